@@ -6,6 +6,7 @@ update row, and delete row.  Operates on a configurable local ``.db`` file.
 
 from __future__ import annotations
 
+import re
 import sqlite3
 
 import typer
@@ -14,6 +15,10 @@ app = typer.Typer()
 
 DEFAULT_DB = "voice_agent.db"
 
+# SQL identifiers and "column = value" clauses, compiled once at import.
+_IDENT_RE = re.compile(r"[A-Za-z_]\w*")
+_ASSIGNMENT_RE = re.compile(r"\s*(\w+)\s*=\s*(.+)")
+
 
 @app.command()
 def create_table(table: str, columns: str, db: str = DEFAULT_DB) -> None:
@@ -119,9 +124,7 @@ def _ident(name: str) -> str:
 
     Only allows alphanumeric characters and underscores.
     """
-    import re as _re
-
-    if not _re.fullmatch(r"[A-Za-z_]\w*", name):
+    if not _IDENT_RE.fullmatch(name):
         raise typer.BadParameter(f"Invalid identifier: {name!r}")
     return name
 
@@ -145,9 +148,7 @@ def _parse_simple_where(clause: str) -> tuple[str, object, list[object]]:
 
     Returns (column_name, coerced_value, [coerced_value]).
     """
-    import re as _re
-
-    match = _re.fullmatch(r"\s*(\w+)\s*=\s*(.+)", clause)
+    match = _ASSIGNMENT_RE.fullmatch(clause)
     if not match:
         raise typer.BadParameter(
             f"WHERE clause must be 'column = value', got: {clause!r}"
@@ -163,11 +164,9 @@ def _parse_assignments(clause: str) -> list[tuple[str, object]]:
 
     Returns a list of (column, coerced_value) pairs.
     """
-    import re as _re
-
     pairs: list[tuple[str, object]] = []
     for part in clause.split(","):
-        match = _re.fullmatch(r"\s*(\w+)\s*=\s*(.+)", part.strip())
+        match = _ASSIGNMENT_RE.fullmatch(part.strip())
         if not match:
             raise typer.BadParameter(
                 f"SET clause must be 'col = val, ...', got segment: {part.strip()!r}"
@@ -181,15 +180,13 @@ def _parse_assignments(clause: str) -> list[tuple[str, object]]:
 
 def _validate_column_defs(columns: str) -> None:
     """Basic validation that column definitions look reasonable."""
-    import re as _re
-
     for part in columns.split(","):
         part = part.strip()
         if not part:
             continue
         # Each part should start with a valid identifier
         tokens = part.split()
-        if not tokens or not _re.fullmatch(r"[A-Za-z_]\w*", tokens[0]):
+        if not tokens or not _IDENT_RE.fullmatch(tokens[0]):
             raise typer.BadParameter(
                 f"Invalid column definition: {part!r}"
             )
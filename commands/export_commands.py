@@ -9,6 +9,7 @@ from __future__ import annotations
 import csv
 import io
 import json
+import re
 import sqlite3
 from pathlib import Path
 
@@ -19,6 +20,10 @@ app = typer.Typer()
 
 DEFAULT_DB = "voice_agent.db"
 
+# SQL identifiers and "column = value" clauses, compiled once at import.
+_IDENT_RE = re.compile(r"[A-Za-z_]\w*")
+_ASSIGNMENT_RE = re.compile(r"\s*(\w+)\s*=\s*(.+)")
+
 
 @app.command()
 def export_query_json(
@@ -113,9 +118,7 @@ def _query(
 
 def _ident(name: str) -> str:
     """Sanitise a SQL identifier to prevent injection."""
-    import re as _re
-
-    if not _re.fullmatch(r"[A-Za-z_]\w*", name):
+    if not _IDENT_RE.fullmatch(name):
         raise typer.BadParameter(f"Invalid identifier: {name!r}")
     return name
 
@@ -139,9 +142,7 @@ def _parse_simple_where(clause: str) -> tuple[str, object, list[object]]:
 
     Returns (column_name, coerced_value, [coerced_value]).
     """
-    import re as _re
-
-    match = _re.fullmatch(r"\s*(\w+)\s*=\s*(.+)", clause)
+    match = _ASSIGNMENT_RE.fullmatch(clause)
     if not match:
         raise typer.BadParameter(
             f"WHERE clause must be 'column = value', got: {clause!r}"
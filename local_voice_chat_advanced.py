@@ -20,11 +20,12 @@ def _build_command_catalog() -> str:
 
 
 def main() -> None:
-    from fastrtc import ReplyOnPause, Stream, get_stt_model, get_tts_model
+    from fastrtc import ReplyOnPause, Stream, get_stt_model
 
     from voice_agent.config import load_config
     from voice_agent.llm import get_llm_backend
     from voice_agent.modes import get_mode_handler
+    from voice_agent.tts import get_tts_backend
 
     parser = argparse.ArgumentParser(description="Local Voice Chat Advanced")
     parser.add_argument(
@@ -42,11 +43,13 @@ def main() -> None:
     args = parser.parse_args()
 
     stt_model = get_stt_model()  # moonshine/base
-    tts_model = get_tts_model()  # kokoro
 
     # Load configuration (R-01)
     config = load_config()
 
+    # Create TTS backend; with tts.warmup it starts loading right away
+    tts = get_tts_backend(config)
+
     # Create shared LLM backend (R-06)
     llm = get_llm_backend(config)
 
@@ -60,20 +63,24 @@ def main() -> None:
         config, llm=llm, context_files=args.context_files, **mode_kwargs,
     )
 
+    def reply_sentences(transcript: str):
+        # Delegate to the active mode handler (R-08), one sentence at a time.
+        for sentence in mode_handler.handle_turn_stream(transcript):
+            logger.debug(f"Response: {sentence}")
+            yield sentence
+
     def echo(audio):
         transcript = stt_model.stt(audio)
         logger.debug(f"Transcript: {transcript}")
 
-        # Delegate to the active mode handler (R-08)
-        response_text = mode_handler.handle_turn(transcript)
-        logger.debug(f"Response: {response_text}")
-
-        for audio_chunk in tts_model.stream_tts_sync(response_text):
-            yield audio_chunk
+        # Sentences are synthesised as the LLM produces them; backends that
+        # batch (e.g. Chatterbox) generate the next one while this one plays.
+        yield from tts.stream_tts_batched(reply_sentences(transcript))
 
     logger.info(
         f"Assistant: {config.assistant.name} | "
         f"LLM: {config.llm.provider}/{config.llm.model} | "
+        f"TTS: {tts!r} | "
         f"Mode: {mode_handler.mode_name}"
     )
     if args.context_files:
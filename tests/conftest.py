@@ -0,0 +1,56 @@
+"""Shared pytest fixtures for the voice agent test suite."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Iterator
+from unittest.mock import MagicMock
+
+import pytest
+
+from voice_agent.config import ConfigNode
+
+# Memoized ConfigNode instances keyed by their frozen source-analysis settings.
+_CONFIG_CACHE: dict[tuple[Any, ...], ConfigNode] = {}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_cache_dir(tmp_path_factory: pytest.TempPathFactory) -> Iterator[None]:
+    """Keep on-disk caches written during tests out of the user's home."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("VOICE_AGENT_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
+        yield
+
+
+@pytest.fixture
+def llm() -> MagicMock:
+    """Return a fresh non-streaming ``MagicMock`` standing in for an ``LLMBackend``.
+
+    Each test gets its own mock, so tests may set attributes (e.g.
+    ``supports_streaming`` or ``model``) without affecting later tests.
+    """
+    return MagicMock(supports_streaming=False)
+
+
+@pytest.fixture
+def make_config() -> Callable[..., ConfigNode]:
+    """Return a factory for memoized source-analysis ``ConfigNode`` objects.
+
+    Code under test never mutates a ``ConfigNode``, so identical settings
+    share a single instance across tests.
+    """
+
+    def _make(enabled: bool = True, threshold: float = 0.5, **extra: Any) -> ConfigNode:
+        key = (enabled, threshold, *sorted(extra.items()))
+        node = _CONFIG_CACHE.get(key)
+        if node is None:
+            node = ConfigNode({
+                "source_analysis": {
+                    "enabled": enabled,
+                    "relevance_threshold": threshold,
+                    **extra,
+                },
+            })
+            _CONFIG_CACHE[key] = node
+        return node
+
+    return _make
@@ -0,0 +1,54 @@
+"""Tests for the shared on-disk cache helpers."""
+
+from pathlib import Path
+
+from voice_agent.cache import cache_dir, load_pickle, store_pickle
+
+
+def test_cache_dir_env_override(monkeypatch, tmp_path):
+    """VOICE_AGENT_CACHE_DIR takes precedence."""
+    monkeypatch.setenv("VOICE_AGENT_CACHE_DIR", str(tmp_path))
+    assert cache_dir("typer") == tmp_path / "typer"
+
+
+def test_cache_dir_xdg(monkeypatch, tmp_path):
+    """XDG_CACHE_HOME is used when no override is set."""
+    monkeypatch.delenv("VOICE_AGENT_CACHE_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert cache_dir("a", "b") == tmp_path / "voice_agent" / "a" / "b"
+
+
+def test_cache_dir_default(monkeypatch):
+    """Falls back to ~/.cache/voice_agent."""
+    monkeypatch.delenv("VOICE_AGENT_CACHE_DIR", raising=False)
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    assert cache_dir() == Path.home() / ".cache" / "voice_agent"
+
+
+def test_cache_dir_not_created(monkeypatch, tmp_path):
+    """Resolving the path does not create it."""
+    monkeypatch.setenv("VOICE_AGENT_CACHE_DIR", str(tmp_path / "root"))
+    assert not cache_dir("x").exists()
+
+
+def test_pickle_round_trip(tmp_path):
+    """store_pickle creates parent directories and load_pickle reads back."""
+    entry = tmp_path / "nested" / "entry.pkl"
+    store_pickle(entry, {"a": (1, 2)})
+    assert load_pickle(entry) == {"a": (1, 2)}
+    assert [p.name for p in entry.parent.iterdir()] == ["entry.pkl"]
+
+
+def test_load_pickle_miss_or_corrupt(tmp_path):
+    """Missing and corrupt entries both read as None."""
+    assert load_pickle(tmp_path / "missing.pkl") is None
+    bad = tmp_path / "bad.pkl"
+    bad.write_bytes(b"not a pickle")
+    assert load_pickle(bad) is None
+
+
+def test_store_pickle_never_raises(tmp_path):
+    """An unwritable location is silently skipped."""
+    blocker = tmp_path / "file"
+    blocker.write_text("x")
+    store_pickle(blocker / "entry.pkl", 1)
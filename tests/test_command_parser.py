@@ -1,5 +1,8 @@
 """Tests for the voice-to-CLI command parser (R-10)."""
 
+import subprocess
+import sys
+
 import pytest
 
 from voice_agent.command_parser import (
@@ -10,6 +13,30 @@ from voice_agent.command_parser import (
 )
 
 
+# ---------------------------------------------------------------------------
+# ParsedCommand tests
+# ---------------------------------------------------------------------------
+
+
+class TestParsedCommand:
+    """Tests for the ParsedCommand result type."""
+
+    def test_is_immutable(self):
+        """ParsedCommand fields cannot be reassigned."""
+        parsed = ParsedCommand(raw="x", command="x", is_valid=True)
+        with pytest.raises(AttributeError):
+            parsed.command = "y"
+
+    def test_has_no_instance_dict(self):
+        """ParsedCommand is tuple-backed with no per-instance __dict__."""
+        parsed = ParsedCommand(raw="x", command="x", is_valid=True)
+        assert not hasattr(parsed, "__dict__")
+
+    def test_default_rejection_reason(self):
+        """rejection_reason defaults to an empty string."""
+        assert ParsedCommand(raw="x", command="x", is_valid=True).rejection_reason == ""
+
+
 # ---------------------------------------------------------------------------
 # parse_llm_output tests
 # ---------------------------------------------------------------------------
@@ -42,6 +69,26 @@ class TestParseLlmOutput:
         assert result.is_valid is True
         assert result.command == "query-db SELECT 1"
 
+    def test_strips_inline_fences(self):
+        """A single-line fenced command keeps its first token."""
+        result = parse_llm_output("```ls-dir /tmp```")
+        assert result.command == "ls-dir /tmp"
+
+    def test_strips_hyphenated_language_tag(self):
+        """Language tags such as shell-session are removed."""
+        result = parse_llm_output("```shell-session\nls-dir /home\n```")
+        assert result.command == "ls-dir /home"
+
+    def test_first_of_multiple_fences(self):
+        """Only the first fenced block is used."""
+        result = parse_llm_output("```\nls-dir /a\n```\nor\n```\nls-dir /b\n```")
+        assert result.command == "ls-dir /a"
+
+    def test_unterminated_fence_left_intact(self):
+        """An unterminated fence is not treated as a code block."""
+        result = parse_llm_output("```ls-dir /tmp")
+        assert result.command == "```ls-dir /tmp"
+
     def test_empty_output(self):
         """Empty LLM output is rejected."""
         result = parse_llm_output("")
@@ -69,6 +116,21 @@ class TestParseLlmOutput:
         result = parse_llm_output("I am unable to determine the right command.")
         assert result.is_valid is False
 
+    @pytest.mark.parametrize(
+        "reply",
+        [
+            "That doesn't match any available command.",
+            "There is no valid command for this.",
+            "Sorry, I can't help with that.",
+            "I CANNOT IDENTIFY a command.",
+        ],
+    )
+    def test_refusal_phrases_anywhere(self, reply):
+        """Refusal phrases are detected case-insensitively anywhere in the reply."""
+        result = parse_llm_output(reply)
+        assert result.is_valid is False
+        assert result.rejection_reason == reply
+
     def test_chained_command(self):
         """A &&-chained command string is valid."""
         result = parse_llm_output("ls-dir /tmp && backup-file foo.txt")
@@ -102,6 +164,22 @@ class TestValidateAgainstCatalog:
         result = validate_against_catalog(parsed, ["ls-dir", "backup-file"])
         assert result.is_valid is False
         assert "Unknown command" in result.rejection_reason
+        assert "Available: backup-file, ls-dir" in result.rejection_reason
+
+    def test_rejection_keeps_raw_and_command(self):
+        """A rejected command keeps the original raw and command strings."""
+        parsed = ParsedCommand(raw="```rm -rf /```", command="rm -rf /", is_valid=True)
+        result = validate_against_catalog(parsed, ["ls-dir"])
+        assert result.raw is parsed.raw
+        assert result.command is parsed.command
+
+    def test_frozenset_catalog(self):
+        """A frozenset catalog is accepted as-is."""
+        known = frozenset({"ls-dir", "backup-file"})
+        ok = ParsedCommand(raw="ls-dir /", command="ls-dir /", is_valid=True)
+        bad = ParsedCommand(raw="rm /", command="rm /", is_valid=True)
+        assert validate_against_catalog(ok, known).is_valid is True
+        assert validate_against_catalog(bad, known).is_valid is False
 
     def test_empty_catalog_skips_validation(self):
         """With an empty catalog, validation is skipped."""
@@ -127,6 +205,12 @@ class TestValidateAgainstCatalog:
         result = validate_against_catalog(parsed, ["ls-dir", "backup-file"])
         assert result.is_valid is True
 
+    def test_first_token_split_on_any_whitespace(self):
+        """The command name is the first token, whatever whitespace follows it."""
+        parsed = ParsedCommand(raw="ls-dir\t/tmp", command="ls-dir\t/tmp", is_valid=True)
+        result = validate_against_catalog(parsed, ("ls-dir",))
+        assert result.is_valid is True
+
     def test_chain_one_invalid(self):
         """A chain with one unknown command is rejected."""
         parsed = ParsedCommand(
@@ -184,3 +268,15 @@ class TestExecuteParsedCommand:
         results = execute_parsed_command(parsed, timeout=1)
         assert len(results) == 1
         assert results[0].success is False
+
+
+def test_import_does_not_load_execution_layer():
+    """Importing command_parser defers loading voice_agent.execute."""
+    code = (
+        "import sys, voice_agent.command_parser; "
+        "print('voice_agent.execute' in sys.modules)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "False"
@@ -3,7 +3,7 @@
 import pytest
 from pathlib import Path
 
-from voice_agent.config import load_config, ConfigNode
+from voice_agent.config import clear_config_cache, load_config, ConfigNode
 
 
 FIXTURE_DIR = Path(__file__).parent / "fixtures"
@@ -82,3 +82,53 @@ def test_config_node_repr():
     """ConfigNode has a meaningful repr."""
     node = ConfigNode({"key": "value"})
     assert "key" in repr(node)
+
+
+def test_load_config_cached_until_file_changes(sample_config):
+    """Unchanged files are served from cache; edits are picked up."""
+    import os
+
+    clear_config_cache()
+    first = load_config(sample_config)
+    assert load_config(sample_config) is first
+
+    sample_config.write_text(sample_config.read_text().replace("TestBot", "Edited"))
+    st = sample_config.stat()
+    os.utime(sample_config, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    reloaded = load_config(sample_config)
+    assert reloaded is not first
+    assert reloaded.assistant.name == "Edited"
+
+
+def test_clear_config_cache(sample_config):
+    """clear_config_cache() forces the next load to re-parse."""
+    first = load_config(sample_config)
+    clear_config_cache()
+    assert load_config(sample_config) is not first
+
+
+def test_config_node_has_no_instance_dict():
+    """ConfigNode uses slots and reuses the wrapper for nested sections."""
+    node = ConfigNode({"llm": {"provider": "ollama"}})
+    assert not hasattr(node, "__dict__")
+    assert node.llm is node.llm
+    assert node.llm.provider == "ollama"
+
+
+def test_config_node_missing_key_default():
+    """getattr with a default works for missing keys."""
+    node = ConfigNode({"a": 1})
+    assert getattr(node, "b", "fallback") == "fallback"
+    with pytest.raises(AttributeError, match="Available keys: a"):
+        node.b
+
+
+def test_load_config_reuses_disk_cache(sample_config):
+    """A fresh process (empty in-memory cache) skips YAML parsing."""
+    from unittest.mock import patch
+
+    clear_config_cache()
+    load_config(sample_config)
+    clear_config_cache()
+    with patch("voice_agent.config.yaml.load", side_effect=AssertionError("parsed")):
+        assert load_config(sample_config).assistant.name == "TestBot"
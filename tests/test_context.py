@@ -1,5 +1,7 @@
 """Tests for context file loading module (R-04)."""
 
+from pathlib import Path
+
 import pytest
 
 from voice_agent.context import load_context_files, context_prompt_section
@@ -70,3 +72,44 @@ def test_context_prompt_section_preserves_file_content(tmp_path):
     f.write_text(content)
     section = context_prompt_section([str(f)])
     assert "Line 1\nLine 2\nLine 3" in section
+
+
+def test_context_prompt_section_exact_layout(tmp_path):
+    """The section layout is stable: header, one block per file, footer."""
+    a = tmp_path / "a.txt"
+    b = tmp_path / "b.txt"
+    a.write_text("A")
+    b.write_text("B")
+    assert context_prompt_section([str(a), str(b)]) == (
+        "\n\n--- Reference Documents ---\n"
+        "\n### a.txt\nA\n"
+        "\n### b.txt\nB\n"
+        "\n--- End Reference Documents ---\n"
+    )
+
+
+def test_load_context_files_undecodable(tmp_path):
+    """Non-UTF-8 files produce an error entry instead of raising."""
+    bad = tmp_path / "bad.bin"
+    bad.write_bytes(b"\xff\xfe\x00")
+    [entry] = load_context_files([str(bad)])
+    assert entry["content"].startswith("[Error reading file:")
+
+
+def test_context_files_cached_until_modified(tmp_path):
+    """Unchanged files are not re-read; edits are picked up."""
+    import os
+    from unittest.mock import patch
+
+    doc = tmp_path / "doc.txt"
+    doc.write_text("first")
+    assert "first" in context_prompt_section([str(doc)])
+
+    with patch.object(Path, "read_bytes", side_effect=AssertionError("re-read")):
+        assert "first" in context_prompt_section([str(doc)])
+        assert load_context_files([str(doc)])[0]["content"] == "first"
+
+    doc.write_text("second")
+    st = doc.stat()
+    os.utime(doc, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert "second" in context_prompt_section([str(doc)])
@@ -52,6 +52,17 @@ class TestExecuteCommand:
         assert result.success is False
         assert "rejected" in result.stderr.lower()
 
+    @pytest.mark.parametrize("command", ["echo `id`", "echo $(id)"])
+    def test_substitution_rejected(self, command):
+        """Backtick and $() command substitution are rejected."""
+        result = execute_command(command)
+        assert result.success is False
+        assert "rejected" in result.stderr.lower()
+
+    def test_dollar_without_paren_allowed(self):
+        """A bare $ (e.g. a variable) is not treated as substitution."""
+        assert execute_command("echo $HOME").success is True
+
     def test_timeout_kills_command(self):
         """A command exceeding the timeout is killed gracefully."""
         result = execute_command("sleep 60", timeout=1)
@@ -139,3 +150,26 @@ class TestExecuteChain:
         results = execute_chain("echo a && echo b && echo c")
         assert len(results) == 3
         assert all(r.success for r in results)
+
+
+def test_repeated_command_lexed_once():
+    """Identical command strings reuse the cached shlex result."""
+    from voice_agent.execute import _split_command
+
+    _split_command.cache_clear()
+    execute_command("echo cached")
+    execute_command("echo cached")
+    info = _split_command.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_output_decoding_is_lenient():
+    """Invalid UTF-8 is replaced and CRLF is normalised, as in text mode."""
+    result = execute_command("printf 'a\\r\\nb\\377'")
+    assert result.success is True
+    assert result.stdout == "a\nb�"
+
+
+def test_result_has_no_instance_dict():
+    """ExecutionResult is tuple-backed with no per-instance __dict__."""
+    assert not hasattr(execute_command("echo hi"), "__dict__")
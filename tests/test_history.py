@@ -1,5 +1,7 @@
 """Tests for conversation history module (R-02)."""
 
+import pytest
+
 from voice_agent.history import ConversationHistory
 
 
@@ -23,6 +25,23 @@ def test_clear():
     assert history.messages == []
 
 
+def test_pop_removes_latest_dialogue_message():
+    """pop() returns the newest user/assistant message, never a system one."""
+    history = ConversationHistory(max_turns=2)
+    history.add("system", "sys")
+    history.add("user", "Hello")
+    assert history.pop() == {"role": "user", "content": "Hello"}
+    assert history.messages == [{"role": "system", "content": "sys"}]
+
+
+def test_pop_empty_raises():
+    """pop() on a history without dialogue raises IndexError."""
+    history = ConversationHistory(max_turns=None)
+    history.add("system", "sys")
+    with pytest.raises(IndexError):
+        history.pop()
+
+
 def test_len():
     """__len__ returns message count."""
     history = ConversationHistory()
@@ -74,3 +93,22 @@ def test_messages_returns_copy():
     msgs = history.messages
     msgs.clear()
     assert len(history) == 1
+
+
+def test_uncapped_history_keeps_arrival_order():
+    """Without a cap, system messages stay where they were added."""
+    history = ConversationHistory(max_turns=0)
+    history.add("user", "a")
+    history.add("system", "s")
+    assert [m["role"] for m in history.messages] == ["user", "system"]
+
+
+def test_lowering_max_turns_trims_immediately():
+    """Reducing max_turns applies the new cap to existing messages."""
+    history = ConversationHistory(max_turns=0)
+    history.add("system", "s")
+    for i in range(3):
+        history.add("user", f"msg-{i}")
+        history.add("assistant", f"reply-{i}")
+    history.max_turns = 1
+    assert [m["content"] for m in history.messages] == ["s", "msg-2", "reply-2"]
@@ -31,6 +31,18 @@ def test_llm_backend_is_abstract():
         LLMBackend(model="test")
 
 
+def test_llm_backend_default_chat_stream():
+    """The default chat_stream yields the full chat reply once."""
+
+    class _Echo(LLMBackend):
+        def chat(self, messages):
+            return "whole reply"
+
+    backend = _Echo(model="test")
+    assert backend.supports_streaming is False
+    assert list(backend.chat_stream(SAMPLE_MESSAGES)) == ["whole reply"]
+
+
 # ---------------------------------------------------------------------------
 # OllamaLLM tests
 # ---------------------------------------------------------------------------
@@ -82,6 +94,26 @@ def test_ollama_chat_with_options():
     )
 
 
+def test_ollama_chat_stream():
+    """OllamaLLM.chat_stream() yields content fragments and closes the stream."""
+    stream = MagicMock()
+    stream.__iter__.return_value = iter([
+        {"message": {"content": "Hi"}},
+        {"message": {"content": ""}},
+        {"message": {"content": " there"}},
+    ])
+    mock_ollama = MagicMock()
+    mock_ollama.chat.return_value = stream
+
+    with patch.dict(sys.modules, {"ollama": mock_ollama}):
+        backend = OllamaLLM(model="gemma3:4b")
+        fragments = list(backend.chat_stream(SAMPLE_MESSAGES))
+
+    assert fragments == ["Hi", " there"]
+    assert mock_ollama.chat.call_args[1]["stream"] is True
+    stream.close.assert_called_once()
+
+
 # ---------------------------------------------------------------------------
 # DeepSeekLLM tests
 # ---------------------------------------------------------------------------
@@ -132,6 +164,78 @@ def test_deepseek_chat():
     )
 
 
+def test_deepseek_chat_stream():
+    """DeepSeekLLM.chat_stream() yields delta content from the stream."""
+    chunks = []
+    for text in ("Deep", None, "Seek"):
+        chunk = MagicMock()
+        chunk.choices = [MagicMock()]
+        chunk.choices[0].delta.content = text
+        chunks.append(chunk)
+    mock_client = MagicMock()
+    mock_client.chat.completions.create.return_value = iter(chunks)
+
+    mock_openai_mod = MagicMock()
+    mock_openai_mod.OpenAI.return_value = mock_client
+
+    with patch.dict(sys.modules, {"openai": mock_openai_mod}):
+        backend = DeepSeekLLM(model="deepseek-chat", api_key="test-key")
+        fragments = list(backend.chat_stream(SAMPLE_MESSAGES))
+
+    assert fragments == ["Deep", "Seek"]
+    assert mock_client.chat.completions.create.call_args[1]["stream"] is True
+
+
+@pytest.mark.parametrize(
+    ("cls", "module_name", "factory"),
+    [(DeepSeekLLM, "openai", "OpenAI"), (AnthropicLLM, "anthropic", "Anthropic")],
+)
+def test_api_client_created_once(cls, module_name, factory):
+    """API backends build their client once and reuse it across turns."""
+    mock_mod = MagicMock()
+
+    with patch.dict(sys.modules, {module_name: mock_mod}):
+        backend = cls(api_key="test-key")
+        backend.chat(SAMPLE_MESSAGES)
+        backend.chat(SAMPLE_MESSAGES)
+
+    getattr(mock_mod, factory).assert_called_once()
+
+
+@pytest.mark.parametrize(
+    ("cls", "module_name", "factory"),
+    [(DeepSeekLLM, "openai", "OpenAI"), (AnthropicLLM, "anthropic", "Anthropic")],
+)
+def test_api_client_uses_keepalive_pool(cls, module_name, factory):
+    """API clients get a pooled httpx client that keeps connections alive."""
+    mock_mod = MagicMock()
+    mock_httpx = MagicMock()
+
+    with patch.dict(sys.modules, {module_name: mock_mod, "httpx": mock_httpx}):
+        cls(api_key="test-key").chat(SAMPLE_MESSAGES)
+
+    http_client = getattr(mock_mod, factory).call_args.kwargs["http_client"]
+    assert http_client is mock_mod.DefaultHttpxClient.return_value
+    assert mock_mod.DefaultHttpxClient.call_args.kwargs["limits"] is mock_httpx.Limits.return_value
+    assert mock_httpx.Limits.call_args.kwargs["keepalive_expiry"] > 5
+
+
+@pytest.mark.parametrize(
+    ("cls", "module_name", "factory"),
+    [(DeepSeekLLM, "openai", "OpenAI"), (AnthropicLLM, "anthropic", "Anthropic")],
+)
+def test_api_client_pool_on_sdk_without_default_client(cls, module_name, factory):
+    """Older SDKs without DefaultHttpxClient fall back to httpx.Client."""
+    mock_mod = MagicMock(spec=[factory])
+    mock_httpx = MagicMock()
+
+    with patch.dict(sys.modules, {module_name: mock_mod, "httpx": mock_httpx}):
+        cls(api_key="test-key")._get_client()
+
+    http_client = getattr(mock_mod, factory).call_args.kwargs["http_client"]
+    assert http_client is mock_httpx.Client.return_value
+
+
 # ---------------------------------------------------------------------------
 # AnthropicLLM tests
 # ---------------------------------------------------------------------------
@@ -205,6 +309,25 @@ def test_anthropic_chat_no_system():
     assert "system" not in call_kwargs
 
 
+def test_anthropic_chat_stream():
+    """AnthropicLLM.chat_stream() yields from the SDK text stream."""
+    stream = MagicMock()
+    stream.text_stream = iter(["Claude", " streamed"])
+    mock_client = MagicMock()
+    mock_client.messages.stream.return_value.__enter__.return_value = stream
+
+    mock_anthropic_mod = MagicMock()
+    mock_anthropic_mod.Anthropic.return_value = mock_client
+
+    with patch.dict(sys.modules, {"anthropic": mock_anthropic_mod}):
+        backend = AnthropicLLM(model="claude-sonnet-4-20250514", api_key="test-key")
+        fragments = list(backend.chat_stream(SAMPLE_MESSAGES))
+
+    assert fragments == ["Claude", " streamed"]
+    call_kwargs = mock_client.messages.stream.call_args[1]
+    assert call_kwargs["system"] == "You are helpful."
+
+
 # ---------------------------------------------------------------------------
 # Factory tests
 # ---------------------------------------------------------------------------
@@ -308,3 +308,116 @@ def test_modes_have_independent_histories(mock_llm):
     assert not any("List files" in m["content"] for m in chat_msgs)
     assert any("List files" in m["content"] for m in agent_msgs)
     assert not any("Hi from chat" in m["content"] for m in agent_msgs)
+
+
+# ---------------------------------------------------------------------------
+# Streaming turns
+# ---------------------------------------------------------------------------
+
+
+def test_handle_turn_stream_yields_sentences(chat_config, mock_llm):
+    """Fragments are regrouped into sentences; history gets the full reply."""
+    mock_llm.chat_stream.return_value = iter(
+        ["Hel", "lo there. How ", "are you? I am", " fine"]
+    )
+    handler = ChatMode(config=chat_config, llm=mock_llm)
+
+    sentences = list(handler.handle_turn_stream("Hi"))
+
+    assert sentences == ["Hello there.", "How are you?", "I am fine"]
+    messages = handler.history.get_messages_for_llm()
+    assert [m["role"] for m in messages] == ["system", "user", "assistant"]
+    assert messages[-1]["content"] == "Hello there. How are you? I am fine"
+    mock_llm.chat.assert_not_called()
+
+
+def test_handle_turn_stream_closed_early(chat_config, mock_llm):
+    """Stopping early records only the text generated so far."""
+    mock_llm.chat_stream.return_value = iter(["One. ", "Two. ", "Three."])
+    handler = ChatMode(config=chat_config, llm=mock_llm)
+
+    stream = handler.handle_turn_stream("Hi")
+    assert next(stream) == "One."
+    stream.close()
+
+    assert handler.history.get_messages_for_llm()[-1] == {
+        "role": "assistant", "content": "One. "
+    }
+
+
+def test_handle_turn_stream_error_before_output(chat_config):
+    """A failed request leaves neither an empty reply nor the user turn."""
+    def failing(messages):
+        raise ConnectionError("network down")
+        yield  # pragma: no cover - makes this a generator
+
+    llm = MagicMock(supports_streaming=True)
+    llm.chat_stream.side_effect = failing
+    handler = ChatMode(config=chat_config, llm=llm)
+    before = handler.history.get_messages_for_llm()
+
+    with pytest.raises(ConnectionError):
+        list(handler.handle_turn_stream("Hi"))
+
+    assert handler.history.get_messages_for_llm() == before
+
+
+def test_handle_turn_stream_closed_before_start(chat_config, mock_llm):
+    """Closing the stream before reading it leaves history untouched."""
+    mock_llm.chat_stream.return_value = iter(["Unused."])
+    handler = ChatMode(config=chat_config, llm=mock_llm)
+    before = handler.history.get_messages_for_llm()
+
+    handler.handle_turn_stream("Hi").close()
+
+    assert handler.history.get_messages_for_llm() == before
+
+
+def test_handle_turn_stream_empty_reply_drops_user_turn(chat_config, mock_llm):
+    """A stream that ends without text records no empty assistant turn."""
+    mock_llm.chat_stream.return_value = iter(["", ""])
+    handler = ChatMode(config=chat_config, llm=mock_llm)
+
+    assert list(handler.handle_turn_stream("Hi")) == []
+    assert [m["role"] for m in handler.history.get_messages_for_llm()] == ["system"]
+
+
+# ---------------------------------------------------------------------------
+# System prompt caching
+# ---------------------------------------------------------------------------
+
+
+def test_system_prompt_reused_across_instances(chat_config, mock_llm):
+    """A second handler with unchanged inputs skips re-rendering."""
+    first = ChatMode(config=chat_config, llm=mock_llm)
+    with patch("voice_agent.modes.render_template") as render:
+        second = ChatMode(config=chat_config, llm=mock_llm)
+    render.assert_not_called()
+    assert second.history.messages[0] == first.history.messages[0]
+
+
+def test_system_prompt_rebuilt_when_scratchpad_changes(chat_config, mock_llm):
+    """Writing the scratchpad invalidates the cached prompt."""
+    from voice_agent.scratchpad import write_scratchpad
+
+    ChatMode(config=chat_config, llm=mock_llm)
+    write_scratchpad("Remember the milk.", "/tmp/_test_scratchpad_modes.md")
+    handler = ChatMode(config=chat_config, llm=mock_llm)
+    assert "Remember the milk." in handler.history.messages[0]["content"]
+
+
+def test_reset_keeps_only_system_prompt(chat_config, mock_llm):
+    """reset() clears the conversation and restores the system prompt."""
+    handler = ChatMode(config=chat_config, llm=mock_llm)
+    system = handler.history.messages[0]
+    handler.handle_turn("Hello")
+    handler.reset()
+    assert handler.history.messages == [system]
+
+
+def test_mode_reads_settings_once(chat_config, mock_llm):
+    """Assistant and scratchpad settings are resolved at construction."""
+    handler = ChatMode(config=chat_config, llm=mock_llm)
+    assert handler._assistant_name == "TestBot"
+    assert handler._persona == "A test bot."
+    assert handler._scratchpad_file == "/tmp/_test_scratchpad_modes.md"
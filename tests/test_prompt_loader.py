@@ -152,3 +152,77 @@ def test_render_concise_response_prompt_template():
     )
     assert "Nova" in result
     assert "brief" in result
+
+
+def test_load_template_picks_up_edits(prompts_dir):
+    """Cached templates are re-parsed once the file changes."""
+    import os
+
+    path = prompts_dir / "greeting.xml"
+    first = load_template("greeting", prompts_dir)
+    path.write_text(path.read_text().replace("<role>", "<role>x-"))
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert load_template("greeting", prompts_dir)["role"] == "x-" + first["role"]
+
+
+def test_load_template_returns_independent_dicts(prompts_dir):
+    """Mutating a returned template does not affect later loads."""
+    tmpl = load_template("greeting", prompts_dir)
+    tmpl["template"] = "changed"
+    assert load_template("greeting", prompts_dir)["template"] != "changed"
+
+
+def test_render_template_values_inserted_verbatim(prompts_dir):
+    """Braces inside substituted values are not treated as placeholders."""
+    result = render_template(
+        "greeting",
+        {"assistant_name": "Nova", "persona": "Notes: {persona} {x}"},
+        prompts_dir,
+    )
+    assert result == "Hello, I am Nova. Notes: {persona} {x}"
+
+
+def test_load_template_reads_only_top_level_fields(tmp_path):
+    """Nested role/template tags are ignored and defaults apply."""
+    (tmp_path / "nested.xml").write_text(
+        "<prompt>\n"
+        "  <meta><role>nested</role></meta>\n"
+        "  <template>Body</template>\n"
+        "</prompt>\n"
+    )
+    tmpl = load_template("nested", tmp_path)
+    assert tmpl == {"name": "nested", "role": "system", "template": "Body"}
+
+
+def test_load_template_reuses_disk_cache(prompts_dir):
+    """Templates parsed in an earlier run are read back from disk."""
+    from unittest.mock import patch
+
+    from voice_agent.prompt_loader import _parse_template
+
+    first = load_template("greeting", prompts_dir)
+    _parse_template.cache_clear()
+    with patch(
+        "voice_agent.prompt_loader._read_template_fields",
+        side_effect=AssertionError("parsed"),
+    ):
+        assert load_template("greeting", prompts_dir) == first
+
+
+def test_render_template_escaped_braces():
+    """Doubled braces render as literal braces (str.format syntax)."""
+    result = render_template(
+        "source_relevance_prompt",
+        {"question": "q", "source_name": "n", "source_content": "c"},
+    )
+    assert '{"score": 0.0,' in result
+    assert "{{" not in result
+
+
+def test_render_template_stray_brace_falls_back(tmp_path):
+    """Templates that are not valid format strings still interpolate."""
+    (tmp_path / "raw.xml").write_text(
+        "<prompt><template>Use { and {name}.</template></prompt>"
+    )
+    assert render_template("raw", {"name": "Nova"}, tmp_path) == "Use { and Nova."
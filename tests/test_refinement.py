@@ -135,3 +135,40 @@ def test_refine_response_preserves_multiline():
     call_args = llm.chat.call_args[0][0]
     system_msg = call_args[0]["content"]
     assert "file1.txt" in system_msg
+
+
+def test_refine_response_memoises_repeated_responses():
+    """An identical response on the same backend skips the second LLM call."""
+    llm = MagicMock()
+    llm.chat.return_value = "All done."
+
+    assert refine_response("done", llm) == "All done."
+    assert refine_response("done", llm) == "All done."
+    llm.chat.assert_called_once()
+
+    refine_response("not done", llm)
+    assert llm.chat.call_count == 2
+
+
+def test_refine_response_long_responses_not_cached():
+    """Very long responses are always sent to the LLM."""
+    llm = MagicMock()
+    llm.chat.return_value = "Summary."
+    long_text = "x" * 5000
+
+    refine_response(long_text, llm)
+    refine_response(long_text, llm)
+    assert llm.chat.call_count == 2
+
+
+def test_refine_response_cache_is_bounded():
+    """The memo cache evicts its oldest entries beyond its size limit."""
+    from voice_agent import refinement
+
+    llm = MagicMock()
+    llm.chat.return_value = "ok"
+    with patch.object(refinement, "_REFINED_CACHE_SIZE", 2):
+        for text in ("a", "b", "c"):
+            refine_response(text, llm)
+        refine_response("a", llm)
+    assert llm.chat.call_count == 4
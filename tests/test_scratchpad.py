@@ -1,5 +1,9 @@
 """Tests for scratchpad persistent memory module (R-03)."""
 
+import os
+import tempfile
+from pathlib import Path
+
 import pytest
 from voice_agent.scratchpad import (
     read_scratchpad,
@@ -10,10 +14,18 @@ from voice_agent.scratchpad import (
 )
 
 
+# RAM-backed tmpfs mount; keeps scratchpad tests off the physical disk.
+_TMPFS_DIR = Path("/dev/shm")
+
+
 @pytest.fixture
-def sp_path(tmp_path):
-    """Return a temporary scratchpad file path."""
-    return tmp_path / "scratchpad.md"
+def sp_path(request):
+    """Return a temporary scratchpad file path, on tmpfs where available."""
+    if _TMPFS_DIR.is_dir() and os.access(_TMPFS_DIR, os.W_OK):
+        with tempfile.TemporaryDirectory(dir=_TMPFS_DIR) as tmp_dir:
+            yield Path(tmp_dir) / "scratchpad.md"
+    else:
+        yield request.getfixturevalue("tmp_path") / "scratchpad.md"
 
 
 def test_read_nonexistent(sp_path):
@@ -34,6 +46,31 @@ def test_write_overwrites(sp_path):
     assert read_scratchpad(sp_path) == "second"
 
 
+def test_write_leaves_no_temp_files(sp_path):
+    """Atomic writes clean up their temporary file."""
+    write_scratchpad("first", sp_path)
+    write_scratchpad("second", sp_path)
+    assert [p.name for p in sp_path.parent.iterdir()] == ["scratchpad.md"]
+
+
+def test_write_preserves_mode(sp_path):
+    """Rewriting keeps the scratchpad's permission bits."""
+    write_scratchpad("first", sp_path)
+    sp_path.chmod(0o644)
+    write_scratchpad("second", sp_path)
+    assert sp_path.stat().st_mode & 0o777 == 0o644
+
+
+def test_write_through_symlink(sp_path):
+    """A symlinked scratchpad stays a symlink; its target is updated."""
+    target = sp_path.with_name("real.md")
+    target.write_text("old")
+    sp_path.symlink_to(target)
+    write_scratchpad("new", sp_path)
+    assert sp_path.is_symlink()
+    assert target.read_text() == "new"
+
+
 def test_append(sp_path):
     """Append adds content after existing text."""
     write_scratchpad("line1", sp_path)
@@ -43,6 +80,24 @@ def test_append(sp_path):
     assert "line2" in content
 
 
+def test_append_adds_separator_only_when_needed(sp_path):
+    """A newline is inserted only if the file does not already end in one."""
+    write_scratchpad("line1", sp_path)
+    assert read_scratchpad(sp_path) == "line1"  # primes the cache
+    append_scratchpad("line2\n", sp_path)
+    append_scratchpad("line3", sp_path)
+    assert read_scratchpad(sp_path) == "line1\nline2\nline3"
+
+
+def test_str_and_path_arguments_are_equivalent(sp_path):
+    """A str path reads and writes the same file as the Path form."""
+    write_scratchpad("via str", str(sp_path))
+    assert read_scratchpad(sp_path) == "via str"
+    clear_scratchpad(str(sp_path))
+    assert read_scratchpad(sp_path) == ""
+    clear_scratchpad(sp_path)  # already gone: no error
+
+
 def test_append_to_nonexistent(sp_path):
     """Append to non-existent file creates it."""
     append_scratchpad("first entry", sp_path)
@@ -80,3 +135,29 @@ def test_prompt_section_whitespace_only(sp_path):
     """Whitespace-only scratchpad is treated as empty."""
     write_scratchpad("   \n  \n  ", sp_path)
     assert scratchpad_prompt_section(sp_path) == ""
+
+
+def test_read_is_cached_until_file_changes(sp_path):
+    """Unchanged scratchpads are served from cache; external edits show up."""
+    from unittest.mock import patch
+
+    write_scratchpad("cached", sp_path)
+    assert read_scratchpad(sp_path) == "cached"
+    with patch("voice_agent.scratchpad.open", create=True,
+               side_effect=AssertionError("re-read")) as reader:
+        assert read_scratchpad(sp_path) == "cached"
+    reader.assert_not_called()
+
+    sp_path.write_text("edited elsewhere")
+    st = sp_path.stat()
+    os.utime(sp_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert read_scratchpad(sp_path) == "edited elsewhere"
+
+
+def test_prompt_section_memoised(sp_path):
+    """The formatted section is reused until the scratchpad changes."""
+    write_scratchpad("note", sp_path)
+    first = scratchpad_prompt_section(sp_path)
+    assert scratchpad_prompt_section(sp_path) is first
+    write_scratchpad("other", sp_path)
+    assert "other" in scratchpad_prompt_section(sp_path)
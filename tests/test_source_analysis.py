@@ -1,15 +1,23 @@
 """Tests for the documentation source analysis pipeline (R-17)."""
 
 import json
+import threading
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 from voice_agent.config import ConfigNode
 from voice_agent.source_analysis import (
     SourceResult,
+    _get_max_concurrency,
+    _get_prefilter_top_k,
     _get_relevance_threshold,
+    _get_top_k,
     _parse_score_response,
+    _read_until_json_object,
     analyze_sources,
+    bm25_scores,
+    score_sources_batch,
+    truncate_for_scoring,
     build_ranked_audio_summary,
     build_ranked_summary,
     is_source_analysis_enabled,
@@ -53,6 +61,36 @@ def test_custom_relevance_threshold():
     assert _get_relevance_threshold(config) == 0.7
 
 
+def test_top_k_defaults_to_none():
+    """Without top_k configured, all passing sources are kept."""
+    config = ConfigNode({"source_analysis": {"enabled": True}})
+    assert _get_top_k(config) is None
+
+
+def test_custom_top_k():
+    """top_k can be configured."""
+    config = ConfigNode({"source_analysis": {"enabled": True, "top_k": 2}})
+    assert _get_top_k(config) == 2
+
+
+def test_max_concurrency_defaults_to_serial():
+    """Sources are scored one at a time unless configured otherwise."""
+    config = ConfigNode({"source_analysis": {"enabled": True}})
+    assert _get_max_concurrency(config) == 1
+
+
+def test_custom_max_concurrency():
+    """max_concurrency can be configured and is at least 1."""
+    assert _get_max_concurrency(ConfigNode({"source_analysis": {"max_concurrency": 4}})) == 4
+    assert _get_max_concurrency(ConfigNode({"source_analysis": {"max_concurrency": 0}})) == 1
+
+
+def test_prefilter_top_k_default_and_disable():
+    """The pre-filter keeps 10 sources by default; 0 turns it off."""
+    assert _get_prefilter_top_k(ConfigNode({"source_analysis": {}})) == 10
+    assert _get_prefilter_top_k(ConfigNode({"source_analysis": {"prefilter_top_k": 0}})) == 0
+
+
 # ---------------------------------------------------------------------------
 # Source loading tests
 # ---------------------------------------------------------------------------
@@ -102,6 +140,15 @@ def test_parse_score_response_with_surrounding_text():
     assert result["score"] == 0.3
 
 
+def test_parse_score_response_nested_and_braces_in_strings():
+    """Nested objects and braces inside strings do not end the match early."""
+    raw = 'Result: {"score": 0.7, "description": "Uses {braces}", "meta": {"k": 1}} ok'
+    result = _parse_score_response(raw)
+    assert result["score"] == 0.7
+    assert result["description"] == "Uses {braces}"
+    assert result["meta"] == {"k": 1}
+
+
 def test_parse_score_response_invalid():
     """Returns fallback for completely unparseable responses."""
     raw = "I cannot parse this at all."
@@ -115,9 +162,8 @@ def test_parse_score_response_invalid():
 # ---------------------------------------------------------------------------
 
 
-def test_score_source_returns_score_and_description():
+def test_score_source_returns_score_and_description(llm):
     """score_source returns a (score, description) tuple."""
-    llm = MagicMock()
     llm.chat.return_value = '{"score": 0.9, "description": "Very relevant content."}'
 
     score, desc = score_source("How to deploy?", "deploy.md", "Deploy instructions...", llm)
@@ -127,9 +173,8 @@ def test_score_source_returns_score_and_description():
     llm.chat.assert_called_once()
 
 
-def test_score_source_clamps_to_valid_range():
+def test_score_source_clamps_to_valid_range(llm):
     """Scores outside 0.0–1.0 are clamped."""
-    llm = MagicMock()
     llm.chat.return_value = '{"score": 1.5, "description": "Over the top."}'
 
     score, _ = score_source("q", "f.txt", "content", llm)
@@ -140,9 +185,8 @@ def test_score_source_clamps_to_valid_range():
     assert score == 0.0
 
 
-def test_score_source_fallback_without_template():
+def test_score_source_fallback_without_template(llm):
     """score_source works even if the template file is missing."""
-    llm = MagicMock()
     llm.chat.return_value = '{"score": 0.5, "description": "Fallback."}'
 
     with patch("voice_agent.source_analysis.render_template", side_effect=FileNotFoundError):
@@ -152,46 +196,64 @@ def test_score_source_fallback_without_template():
     assert desc == "Fallback."
 
 
+def test_score_source_streams_when_supported(llm):
+    """Streaming backends are read only until the JSON object closes."""
+    llm.supports_streaming = True
+    consumed: list[str] = []
+
+    def fragments(_messages):
+        for part in ['{"score":', ' 0.9, "description": "x"}', " Let me explain..."]:
+            consumed.append(part)
+            yield part
+
+    llm.chat_stream.side_effect = fragments
+
+    score, desc = score_source("q", "f.txt", "content", llm)
+
+    assert (score, desc) == (0.9, "x")
+    assert consumed == ['{"score":', ' 0.9, "description": "x"}']
+    llm.chat.assert_not_called()
+
+
+def test_read_until_json_object_ignores_braces_in_strings():
+    """Braces inside JSON strings do not end the object early."""
+    raw = _read_until_json_object(['{"score": 0.4, ', '"description": "a } b"}', "tail"])
+    assert raw == '{"score": 0.4, "description": "a } b"}'
+
+
+def test_read_until_json_object_incomplete_stream():
+    """An unterminated stream returns everything received."""
+    assert _read_until_json_object(["no json", " here"]) == "no json here"
+
+
 # ---------------------------------------------------------------------------
 # analyze_sources tests
 # ---------------------------------------------------------------------------
 
 
-def _make_config(enabled: bool = True, threshold: float = 0.5) -> ConfigNode:
-    return ConfigNode({
-        "source_analysis": {
-            "enabled": enabled,
-            "relevance_threshold": threshold,
-        },
-    })
-
-
-def test_analyze_sources_disabled():
+def test_analyze_sources_disabled(llm, make_config):
     """Returns empty list when source analysis is disabled."""
-    config = _make_config(enabled=False)
-    llm = MagicMock()
+    config = make_config(enabled=False)
     result = analyze_sources("question", ["file.txt"], llm, config)
     assert result == []
     llm.chat.assert_not_called()
 
 
-def test_analyze_sources_empty_list():
+def test_analyze_sources_empty_list(llm, make_config):
     """Returns empty list when no sources are provided."""
-    config = _make_config()
-    llm = MagicMock()
+    config = make_config()
     result = analyze_sources("question", [], llm, config)
     assert result == []
 
 
-def test_analyze_sources_filters_below_threshold(tmp_path):
+def test_analyze_sources_filters_below_threshold(tmp_path, llm, make_config):
     """Sources below the threshold are filtered out."""
     doc_high = tmp_path / "high.txt"
     doc_high.write_text("Very relevant documentation.")
     doc_low = tmp_path / "low.txt"
     doc_low.write_text("Unrelated content.")
 
-    config = _make_config(threshold=0.5)
-    llm = MagicMock()
+    config = make_config(threshold=0.5)
     llm.chat.side_effect = [
         '{"score": 0.9, "description": "Very relevant."}',
         '{"score": 0.2, "description": "Not relevant."}',
@@ -204,7 +266,7 @@ def test_analyze_sources_filters_below_threshold(tmp_path):
     assert results[0].score == 0.9
 
 
-def test_analyze_sources_ranks_by_score(tmp_path):
+def test_analyze_sources_ranks_by_score(tmp_path, llm, make_config):
     """Sources are ranked by score descending."""
     doc_a = tmp_path / "a.txt"
     doc_a.write_text("Content A.")
@@ -213,8 +275,7 @@ def test_analyze_sources_ranks_by_score(tmp_path):
     doc_c = tmp_path / "c.txt"
     doc_c.write_text("Content C.")
 
-    config = _make_config(threshold=0.3)
-    llm = MagicMock()
+    config = make_config(threshold=0.3)
     llm.chat.side_effect = [
         '{"score": 0.5, "description": "Medium."}',
         '{"score": 0.9, "description": "High."}',
@@ -231,13 +292,260 @@ def test_analyze_sources_ranks_by_score(tmp_path):
     assert results[2].name == "a.txt"
 
 
-def test_analyze_sources_skips_unreadable_files(tmp_path):
+def test_analyze_sources_scores_duplicate_content_once(tmp_path, llm, make_config):
+    """Sources with identical content share a single LLM scoring call."""
+    doc_a = tmp_path / "a.txt"
+    doc_a.write_text("Same content.")
+    doc_b = tmp_path / "b.txt"
+    doc_b.write_text("Same content.")
+
+    config = make_config(threshold=0.3)
+    llm.chat.return_value = '{"score": 0.8, "description": "Relevant."}'
+
+    results = analyze_sources("question", [str(doc_a), str(doc_b)], llm, config)
+
+    assert sorted(r.name for r in results) == ["a.txt", "b.txt"]
+    llm.chat.assert_called_once()
+
+
+def test_analyze_sources_top_k(tmp_path, llm, make_config):
+    """Only the top_k best-scoring sources are returned, in rank order."""
+    paths = []
+    for name in ("a.txt", "b.txt", "c.txt"):
+        doc = tmp_path / name
+        doc.write_text(f"Content {name}.")
+        paths.append(str(doc))
+
+    config = make_config(threshold=0.3, top_k=2)
+    llm.chat.side_effect = [
+        '{"score": 0.5, "description": "Medium."}',
+        '{"score": 0.9, "description": "High."}',
+        '{"score": 0.7, "description": "Good."}',
+    ]
+
+    results = analyze_sources("question", paths, llm, config)
+
+    assert [r.name for r in results] == ["b.txt", "c.txt"]
+
+
+def test_analyze_sources_scores_in_parallel(tmp_path, llm, make_config):
+    """With max_concurrency > 1, scoring calls overlap and order is kept."""
+    paths = []
+    for name in ("a.txt", "b.txt", "c.txt"):
+        doc = tmp_path / name
+        doc.write_text(f"Content {name}.")
+        paths.append(str(doc))
+
+    # Every call blocks until all three are in flight at once.
+    barrier = threading.Barrier(3, timeout=5)
+
+    def chat(messages):
+        barrier.wait()
+        return '{"score": 0.8, "description": "Relevant."}'
+
+    config = make_config(threshold=0.3, max_concurrency=3)
+    llm.chat.side_effect = chat
+
+    results = analyze_sources("question", paths, llm, config)
+
+    assert [r.name for r in results] == ["a.txt", "b.txt", "c.txt"]
+    assert llm.chat.call_count == 3
+
+
+def test_analyze_sources_loads_in_parallel(llm, make_config):
+    """With max_concurrency > 1, source files are read concurrently."""
+    barrier = threading.Barrier(2, timeout=5)
+
+    def slow_load(path):
+        barrier.wait()
+        return {"name": path, "content": f"Content of {path}."}
+
+    config = make_config(threshold=0.3, max_concurrency=2)
+    llm.chat.return_value = '{"score": 0.8, "description": "Relevant."}'
+
+    with patch("voice_agent.source_analysis.load_source", side_effect=slow_load):
+        results = analyze_sources("question", ["a.md", "b.md"], llm, config)
+
+    assert [r.name for r in results] == ["a.md", "b.md"]
+
+
+def test_bm25_scores_rank_matching_documents_higher():
+    """Documents sharing rarer query terms score higher."""
+    scores = bm25_scores(
+        "configure the TTS voice",
+        ["How to configure the TTS voice.", "Database schema notes.", "The end."],
+    )
+    assert scores[0] > scores[2] >= scores[1] == 0.0
+    assert bm25_scores("anything", []) == []
+
+
+def test_analyze_sources_prefilters_before_llm(tmp_path, llm, make_config):
+    """Only the best lexical matches are sent to the LLM for scoring."""
+    paths = []
+    for name, text in (
+        ("noise1.txt", "Unrelated database notes."),
+        ("voice.txt", "Configure the TTS voice here."),
+        ("noise2.txt", "Shopping list."),
+    ):
+        doc = tmp_path / name
+        doc.write_text(text)
+        paths.append(str(doc))
+
+    config = make_config(threshold=0.3, prefilter_top_k=1)
+    llm.chat.return_value = '{"score": 0.9, "description": "Relevant."}'
+
+    results = analyze_sources("How do I change the TTS voice?", paths, llm, config)
+
+    assert [r.name for r in results] == ["voice.txt"]
+    llm.chat.assert_called_once()
+
+
+def test_score_sources_batch_parses_answer_array(llm):
+    """One call scores every source, in order, clamped to 0.0-1.0."""
+    llm.chat.return_value = (
+        'Here you go:\n<answer>[{"score": 0.9, "description": "Direct."}, 1.7]</answer>'
+    )
+    results = score_sources_batch("q", [("a.md", "A"), ("b.md", "B")], llm)
+
+    assert results == [(0.9, "Direct."), (1.0, "")]
+    llm.chat.assert_called_once()
+    prompt = llm.chat.call_args[0][0][0]["content"]
+    assert '<source index="1" name="b.md">' in prompt
+
+
+@pytest.mark.parametrize("raw", [
+    "no answer tags",
+    "<answer>[0.5]</answer>",
+    "<answer>[0.5, \"high\"]</answer>",
+])
+def test_score_sources_batch_unparseable(llm, raw):
+    """Malformed or wrong-length answers return None."""
+    llm.chat.return_value = raw
+    assert score_sources_batch("q", [("a.md", "A"), ("b.md", "B")], llm) is None
+
+
+def test_analyze_sources_batch_scoring(tmp_path, llm, make_config):
+    """With batch_scoring enabled, all sources share one LLM call."""
+    paths = []
+    for name in ("a.txt", "b.txt", "c.txt"):
+        doc = tmp_path / name
+        doc.write_text(f"Content {name}.")
+        paths.append(str(doc))
+
+    config = make_config(threshold=0.3, batch_scoring=True)
+    llm.chat.return_value = "<answer>[0.5, 0.9, 0.1]</answer>"
+
+    results = analyze_sources("question", paths, llm, config)
+
+    assert [r.name for r in results] == ["b.txt", "a.txt"]
+    llm.chat.assert_called_once()
+
+
+def test_analyze_sources_batch_falls_back_per_source(tmp_path, llm, make_config):
+    """An unparseable batch reply falls back to scoring each source."""
+    paths = []
+    for name in ("a.txt", "b.txt"):
+        doc = tmp_path / name
+        doc.write_text(f"Content {name}.")
+        paths.append(str(doc))
+
+    config = make_config(threshold=0.3, batch_scoring=True)
+    llm.chat.side_effect = [
+        "I cannot do that.",
+        '{"score": 0.8, "description": "A."}',
+        '{"score": 0.6, "description": "B."}',
+    ]
+
+    results = analyze_sources("question", paths, llm, config)
+
+    assert [r.name for r in results] == ["a.txt", "b.txt"]
+    assert llm.chat.call_count == 3
+
+
+def test_truncate_for_scoring_keeps_head_and_tail():
+    """Long content keeps its start and end within the budget."""
+    content = "A" * 50 + "B" * 100 + "C" * 50
+    trimmed = truncate_for_scoring(content, 25)  # ~100 characters
+    assert trimmed.startswith("A" * 50) and trimmed.endswith("C" * 50)
+    assert "B" not in trimmed and "omitted" in trimmed
+    assert truncate_for_scoring(content, 0) == content
+    assert truncate_for_scoring("short", 25) == "short"
+
+
+def test_analyze_sources_scores_truncated_content(tmp_path, llm, make_config):
+    """The LLM sees the trimmed source; the result keeps the full text."""
+    doc = tmp_path / "long.txt"
+    doc.write_text("head " + "filler " * 200 + "tail")
+
+    config = make_config(threshold=0.3, max_score_tokens=10)
+    llm.chat.return_value = '{"score": 0.9, "description": "Relevant."}'
+
+    results = analyze_sources("question", [str(doc)], llm, config)
+
+    prompt = llm.chat.call_args[0][0][0]["content"]
+    assert "omitted" in prompt and prompt.count("filler") < 20
+    assert results[0].content == doc.read_text()
+
+
+def test_analyze_sources_literal_file_name_skips_llm(tmp_path, llm, make_config):
+    """A question naming a source exactly returns it without scoring."""
+    target = tmp_path / "deploy.md"
+    target.write_text("Deploy steps.")
+    other = tmp_path / "config.md"
+    other.write_text("Config keys.")
+
+    results = analyze_sources(" deploy.md ", [str(other), str(target)], llm, make_config())
+
+    assert [(r.name, r.score) for r in results] == [("deploy.md", 1.0)]
+    assert results[0].content == "Deploy steps."
+    llm.chat.assert_not_called()
+
+
+def test_analyze_sources_quoted_phrase_matches_file_name(tmp_path, llm, make_config):
+    """A quoted phrase selects the sources whose names contain it."""
+    paths = []
+    for name in ("tts_setup.md", "llm_setup.md", "TTS_voices.md"):
+        doc = tmp_path / name
+        doc.write_text(name)
+        paths.append(str(doc))
+
+    results = analyze_sources('"tts"', paths, llm, make_config())
+
+    assert [r.name for r in results] == ["tts_setup.md", "TTS_voices.md"]
+    llm.chat.assert_not_called()
+
+
+def test_analyze_sources_persists_scores_across_calls(tmp_path, llm, make_config):
+    """With cache_scores enabled, an unchanged source is not rescored."""
+    doc = tmp_path / "doc.txt"
+    doc.write_text("Cached content.")
+
+    config = make_config(threshold=0.3, cache_scores=True)
+    llm.model = "score-model"
+    llm.chat.return_value = '{"score": 0.8, "description": "Relevant."}'
+
+    first = analyze_sources("persisted question", [str(doc)], llm, config)
+    second = analyze_sources("persisted question", [str(doc)], llm, config)
+
+    assert first == second
+    llm.chat.assert_called_once()
+
+    doc.write_text("Edited content.")
+    analyze_sources("persisted question", [str(doc)], llm, config)
+    assert llm.chat.call_count == 2
+
+    # A different token budget scores different text, so it is a miss too.
+    rebudgeted = make_config(threshold=0.3, cache_scores=True, max_score_tokens=1)
+    analyze_sources("persisted question", [str(doc)], llm, rebudgeted)
+    assert llm.chat.call_count == 3
+
+
+def test_analyze_sources_skips_unreadable_files(tmp_path, llm, make_config):
     """Sources that fail to load are silently skipped."""
     doc = tmp_path / "good.txt"
     doc.write_text("Valid content.")
 
-    config = _make_config(threshold=0.3)
-    llm = MagicMock()
+    config = make_config(threshold=0.3)
     llm.chat.return_value = '{"score": 0.8, "description": "Relevant."}'
 
     results = analyze_sources(
@@ -277,9 +585,8 @@ def test_build_ranked_summary_empty():
 # ---------------------------------------------------------------------------
 
 
-def test_build_ranked_audio_summary_calls_llm():
+def test_build_ranked_audio_summary_calls_llm(llm):
     """build_ranked_audio_summary sends ranked sources through the LLM."""
-    llm = MagicMock()
     llm.chat.return_value = "Okay, so I found 2 relevant sources."
 
     results = [
@@ -292,17 +599,15 @@ def test_build_ranked_audio_summary_calls_llm():
     llm.chat.assert_called_once()
 
 
-def test_build_ranked_audio_summary_empty():
+def test_build_ranked_audio_summary_empty(llm):
     """Returns a fallback message when no results exist."""
-    llm = MagicMock()
     summary = build_ranked_audio_summary([], llm)
     assert "didn't find" in summary
     llm.chat.assert_not_called()
 
 
-def test_build_ranked_audio_summary_fallback_without_template():
+def test_build_ranked_audio_summary_fallback_without_template(llm):
     """Falls back gracefully when the template file is missing."""
-    llm = MagicMock()
     llm.chat.return_value = "Here is a summary."
 
     results = [SourceResult("doc.md", 0.8, "Relevant.", "...")]
@@ -326,15 +631,23 @@ def test_source_result_is_frozen():
         result.score = 0.5
 
 
-def test_source_result_fields():
-    """SourceResult stores all fields correctly."""
+def test_source_result_fields(tmp_path):
+    """SourceResult stores all fields and reads content from its path."""
+    doc = tmp_path / "guide.md"
+    doc.write_text("Full content here.")
     result = SourceResult(
         name="guide.md",
         score=0.75,
         description="Useful guide.",
-        content="Full content here.",
+        content_path=str(doc),
     )
     assert result.name == "guide.md"
     assert result.score == 0.75
     assert result.description == "Useful guide."
     assert result.content == "Full content here."
+
+
+def test_source_result_has_no_instance_dict():
+    """SourceResult uses slots, so instances carry no per-instance __dict__."""
+    result = SourceResult("doc.md", 0.8, "Relevant.", "Content.")
+    assert not hasattr(result, "__dict__")
@@ -0,0 +1,35 @@
+"""Tests for the persistent source relevance score cache."""
+
+from voice_agent.source_analysis_cache import ScoreCache, get_score_cache
+
+
+def test_round_trip(tmp_path):
+    """A stored score is read back, and survives reopening the database."""
+    path = tmp_path / "scores.sqlite3"
+    cache = ScoreCache(path)
+    key = ScoreCache.make_key("q", "doc.md", b"digest", "model", 2000)
+    assert cache.get(key) is None
+
+    cache.put(key, 0.75, "Useful.")
+    assert cache.get(key) == (0.75, "Useful.")
+    cache.close()
+
+    reopened = ScoreCache(path)
+    assert reopened.get(key) == (0.75, "Useful.")
+    reopened.close()
+
+
+def test_make_key_depends_on_every_field():
+    """Changing any key component yields a different key."""
+    base = ("q", "doc.md", b"digest", "model", 2000)
+    key = ScoreCache.make_key(*base)
+    assert ScoreCache.make_key(*base) == key
+    for i, changed in enumerate(("q2", "other.md", b"digest2", "model2", 500)):
+        parts = list(base)
+        parts[i] = changed
+        assert ScoreCache.make_key(*parts) != key
+
+
+def test_get_score_cache_is_shared():
+    """The shared cache is opened once per location."""
+    assert get_score_cache() is get_score_cache()
@@ -4,6 +4,7 @@ import sys
 import pytest
 from unittest.mock import MagicMock, patch
 
+import voice_agent.tts as tts_module
 from voice_agent.config import ConfigNode
 from voice_agent.tts import (
     ChatterboxTTS,
@@ -12,10 +13,24 @@ from voice_agent.tts import (
     RealtimeTTSBackend,
     TTSBackend,
     _chunk_text,
+    _lazy_import,
     get_tts_backend,
+    reset_tts_backends,
 )
 
 
+@pytest.fixture(autouse=True)
+def _fresh_backend_cache():
+    """Give every test its own backend instances and models."""
+    reset_tts_backends()
+    ChatterboxTTS._shared_models.clear()
+    tts_module._get_torch.cache_clear()
+    yield
+    reset_tts_backends()
+    ChatterboxTTS._shared_models.clear()
+    tts_module._get_torch.cache_clear()
+
+
 # ---------------------------------------------------------------------------
 # Base class tests
 # ---------------------------------------------------------------------------
@@ -27,6 +42,34 @@ def test_tts_backend_is_abstract():
         TTSBackend(voice="test")
 
 
+def test_stream_tts_batched_default_runs_texts_in_order():
+    """The base implementation synthesises each text in turn."""
+
+    class Echo(TTSBackend):
+        def stream_tts(self, text):
+            yield (16000, text)
+
+    assert list(Echo().stream_tts_batched(["a", "b"])) == [(16000, "a"), (16000, "b")]
+
+
+def test_stream_tts_batched_default_pulls_texts_lazily():
+    """A text is not requested until the previous one has been spoken."""
+    pulled = []
+
+    def texts():
+        for text in ("a", "b"):
+            pulled.append(text)
+            yield text
+
+    class Echo(TTSBackend):
+        def stream_tts(self, text):
+            yield (16000, text)
+
+    chunks = Echo().stream_tts_batched(texts())
+    assert next(chunks) == (16000, "a")
+    assert pulled == ["a"]
+
+
 # ---------------------------------------------------------------------------
 # KokoroTTS tests
 # ---------------------------------------------------------------------------
@@ -83,6 +126,33 @@ def test_kokoro_lazy_init():
         mock_fastrtc.get_tts_model.assert_called_once()
 
 
+def test_lazy_import_defers_module_execution(tmp_path, monkeypatch):
+    """_lazy_import registers the module but only runs it on attribute access."""
+    (tmp_path / "lazy_probe_mod.py").write_text(
+        "import builtins\nbuiltins._lazy_probe_ran = True\nVALUE = 42\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "lazy_probe_mod", raising=False)
+    import builtins
+
+    try:
+        module = _lazy_import("lazy_probe_mod")
+        assert sys.modules["lazy_probe_mod"] is module
+        assert not hasattr(builtins, "_lazy_probe_ran")
+
+        assert module.VALUE == 42
+        assert builtins._lazy_probe_ran is True
+    finally:
+        sys.modules.pop("lazy_probe_mod", None)
+        if hasattr(builtins, "_lazy_probe_ran"):
+            del builtins._lazy_probe_ran
+
+
+def test_lazy_import_missing_module():
+    """_lazy_import returns None for modules that are not installed."""
+    assert _lazy_import("definitely_not_installed_module_xyz") is None
+
+
 # ---------------------------------------------------------------------------
 # Pyttsx3TTS tests
 # ---------------------------------------------------------------------------
@@ -106,6 +176,52 @@ def test_pyttsx3_stores_rate():
     assert backend._rate == 200
 
 
+@pytest.fixture
+def fresh_pyttsx3_cache(monkeypatch):
+    """Isolate the class-level pyttsx3 engine cache for a single test."""
+    monkeypatch.setattr(Pyttsx3TTS, "_engine", None)
+    monkeypatch.setattr(Pyttsx3TTS, "_voice_ids", {})
+    monkeypatch.setattr(Pyttsx3TTS, "_applied", None)
+
+
+def test_pyttsx3_shares_engine_across_instances(fresh_pyttsx3_cache):
+    """pyttsx3.init() runs once; later instances reuse the engine."""
+    mock_pyttsx3 = MagicMock()
+
+    with patch.dict(sys.modules, {"pyttsx3": mock_pyttsx3}):
+        first = Pyttsx3TTS(rate=150)._get_engine()
+        second = Pyttsx3TTS(voice="english", rate=200)._get_engine()
+
+    assert first is second
+    mock_pyttsx3.init.assert_called_once()
+
+
+def test_pyttsx3_caches_voice_lookup(fresh_pyttsx3_cache):
+    """Voice ids are resolved once per voice name."""
+    english = MagicMock(id="com.voice.English")
+    engine = MagicMock()
+    engine.getProperty.return_value = [MagicMock(id="com.voice.French"), english]
+
+    backend = Pyttsx3TTS(voice="english")
+    assert backend._resolve_voice_id(engine) == "com.voice.English"
+    assert Pyttsx3TTS(voice="English")._resolve_voice_id(engine) == "com.voice.English"
+    engine.getProperty.assert_called_once_with("voices")
+
+
+def test_pyttsx3_applies_settings_only_when_changed(fresh_pyttsx3_cache):
+    """Rate and voice are re-applied only when they differ from the last call."""
+    engine = MagicMock()
+    engine.getProperty.return_value = [MagicMock(id="com.voice.English")]
+
+    Pyttsx3TTS(voice="english", rate=180)._configure_engine(engine)
+    Pyttsx3TTS(voice="english", rate=180)._configure_engine(engine)
+    assert engine.setProperty.call_count == 2
+
+    Pyttsx3TTS(voice="english", rate=120)._configure_engine(engine)
+    engine.setProperty.assert_any_call("rate", 120)
+    assert engine.setProperty.call_count == 4
+
+
 # ---------------------------------------------------------------------------
 # RealtimeTTSBackend tests
 # ---------------------------------------------------------------------------
@@ -123,6 +239,186 @@ def test_realtimetts_default_voice():
     assert backend.voice is None
 
 
+def test_pcm_backends_validate_dtype():
+    """Only float32 and int16 output are accepted."""
+    assert Pyttsx3TTS(dtype="int16")._dtype == "int16"
+    assert RealtimeTTSBackend()._dtype == "float32"
+    with pytest.raises(ValueError, match="dtype"):
+        RealtimeTTSBackend(dtype="float64")
+
+
+def test_pcm16_to_audio_int16_is_a_view():
+    """int16 output is the frombuffer view, with no scaling pass."""
+    mock_np = MagicMock()
+    with patch.object(tts_module, "np", mock_np):
+        audio = tts_module._pcm16_to_audio(b"\x00\x01", "int16")
+    assert audio is mock_np.frombuffer.return_value
+    mock_np.multiply.assert_not_called()
+
+
+def test_pcm16_to_audio_float32_single_fused_pass():
+    """float32 output comes from one multiply that converts and scales."""
+    mock_np = MagicMock()
+    with patch.object(tts_module, "np", mock_np):
+        audio = tts_module._pcm16_to_audio(b"\x00\x01", "float32")
+    assert audio is mock_np.multiply.return_value
+    mock_np.multiply.assert_called_once()
+    assert mock_np.multiply.call_args.kwargs["dtype"] is mock_np.float32
+    mock_np.frombuffer.return_value.astype.assert_not_called()
+
+
+def _write_wav(path, frames, rate=22050, sampwidth=2):
+    import wave
+
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(sampwidth)
+        wf.setframerate(rate)
+        wf.writeframes(frames)
+
+
+def test_read_wav_pcm16_maps_data_chunk(tmp_path):
+    """The sample rate comes from the fmt chunk and samples from data."""
+    wav = tmp_path / "out.wav"
+    _write_wav(wav, b"\x01\x00\x02\x00\x03\x00", rate=16000)
+
+    with patch.object(tts_module, "_pcm16_to_audio", lambda raw, dtype: bytes(raw)):
+        rate, audio = tts_module._read_wav_pcm16(str(wav), "float32")
+
+    assert (rate, audio) == (16000, b"\x01\x00\x02\x00\x03\x00")
+
+
+def test_read_wav_pcm16_int16_does_not_keep_mapping(tmp_path):
+    """int16 samples are copied out and the mapping is closed before return."""
+    wav = tmp_path / "out.wav"
+    _write_wav(wav, b"\x01\x00\x02\x00")
+    views = []
+    mapped = MagicMock()
+
+    def to_audio(raw, dtype):
+        views.append(raw)
+        return mapped
+
+    with patch.object(tts_module, "_pcm16_to_audio", to_audio):
+        _, audio = tts_module._read_wav_pcm16(str(wav), "int16")
+
+    assert audio is mapped.copy.return_value
+    with pytest.raises(ValueError):
+        views[0].tobytes()  # released
+    wav.unlink()
+
+
+def test_read_wav_pcm16_releases_mapping_on_error(tmp_path):
+    """A failed conversion still releases the view and closes the mapping."""
+    wav = tmp_path / "out.wav"
+    _write_wav(wav, b"\x01\x00\x02\x00")
+    views = []
+
+    def to_audio(raw, dtype):
+        views.append(raw)
+        raise MemoryError
+
+    with patch.object(tts_module, "_pcm16_to_audio", to_audio):
+        with pytest.raises(MemoryError):
+            tts_module._read_wav_pcm16(str(wav), "float32")
+
+    with pytest.raises(ValueError):
+        views[0].tobytes()  # released
+    wav.unlink()
+
+
+def test_read_wav_pcm16_rejects_bad_input(tmp_path):
+    """Non-WAV and non-16-bit files raise RuntimeError."""
+    junk = tmp_path / "junk.wav"
+    junk.write_bytes(b"not a wav file at all")
+    with pytest.raises(RuntimeError, match="Not a WAV"):
+        tts_module._read_wav_pcm16(str(junk), "float32")
+
+    wide = tmp_path / "wide.wav"
+    _write_wav(wide, b"\x00" * 8, sampwidth=4)
+    with pytest.raises(RuntimeError, match="16-bit"):
+        tts_module._read_wav_pcm16(str(wide), "float32")
+
+
+def test_pyttsx3_synthesises_into_scratch_dir(fresh_pyttsx3_cache, monkeypatch, tmp_path):
+    """The WAV is written under the scratch dir and removed after reading."""
+    monkeypatch.setattr(tts_module, "_scratch_dir", lambda: str(tmp_path))
+    engine = MagicMock()
+    engine.save_to_file.side_effect = lambda text, path: _write_wav(path, b"\x01\x00")
+    monkeypatch.setattr(Pyttsx3TTS, "_engine", engine)
+
+    with patch.object(tts_module, "_pcm16_to_audio", lambda raw, dtype: bytes(raw)), \
+            patch.object(tts_module, "np", MagicMock()):
+        out = list(Pyttsx3TTS().stream_tts("hi"))
+
+    assert out == [(22050, b"\x01\x00")]
+    assert engine.save_to_file.call_args.args[1].startswith(str(tmp_path))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_torch_imported_once():
+    """torch is resolved on first use and reused from then on."""
+    fake = MagicMock()
+    with patch.dict(sys.modules, {"torch": fake}):
+        assert tts_module._get_torch() is fake
+    assert tts_module._get_torch() is fake
+
+
+def test_realtimetts_module_imported_once(monkeypatch):
+    """The RealtimeTTS module is imported on first use and then reused."""
+    monkeypatch.setattr(RealtimeTTSBackend, "_realtimetts", None)
+    mock_rtts = MagicMock()
+    with patch.dict(sys.modules, {"RealtimeTTS": mock_rtts}):
+        assert RealtimeTTSBackend._get_realtimetts() is mock_rtts
+    assert RealtimeTTSBackend._get_realtimetts() is mock_rtts
+
+
+def _mock_realtimetts(chunks=(), error=None):
+    """Build a fake RealtimeTTS module whose stream plays *chunks*."""
+    def play(on_audio_chunk, muted):
+        for chunk in chunks:
+            on_audio_chunk(chunk)
+        if error is not None:
+            raise error
+
+    module = MagicMock()
+    module.TextToAudioStream.return_value.play.side_effect = play
+    return module
+
+
+def test_realtimetts_yields_each_chunk(monkeypatch):
+    """Chunks are yielded as they arrive; odd bytes carry to the next one."""
+    monkeypatch.setattr(
+        RealtimeTTSBackend, "_realtimetts", _mock_realtimetts([b"abc", b"d", b"ef"])
+    )
+    with patch.object(tts_module, "_pcm16_to_audio", lambda raw, dtype: raw), \
+            patch.object(tts_module, "np", MagicMock()):
+        out = list(RealtimeTTSBackend(sample_rate=16000).stream_tts("hi"))
+
+    assert out == [(16000, b"ab"), (16000, b"cd"), (16000, b"ef")]
+
+
+def test_realtimetts_reraises_playback_errors(monkeypatch):
+    """An engine failure surfaces in the consuming generator."""
+    monkeypatch.setattr(
+        RealtimeTTSBackend, "_realtimetts",
+        _mock_realtimetts([b"ab"], error=OSError("no audio device")),
+    )
+    with patch.object(tts_module, "np", MagicMock()):
+        gen = RealtimeTTSBackend().stream_tts("hi")
+        next(gen)
+        with pytest.raises(OSError, match="no audio device"):
+            next(gen)
+
+
+def test_stream_tts_requires_numpy():
+    """The pyttsx3 and RealtimeTTS backends need numpy to build audio."""
+    with patch.object(tts_module, "np", None):
+        for backend in (Pyttsx3TTS(), RealtimeTTSBackend()):
+            with pytest.raises(RuntimeError, match="numpy"):
+                next(backend.stream_tts("hi"))
+
+
 # ---------------------------------------------------------------------------
 # Factory tests
 # ---------------------------------------------------------------------------
@@ -186,6 +482,102 @@ def test_get_tts_backend_case_insensitive():
     assert isinstance(backend, KokoroTTS)
 
 
+def test_get_tts_backend_warms_up_in_background():
+    """With tts.warmup enabled, warm_up() runs on a background thread."""
+    import threading
+
+    called = threading.Event()
+    config = ConfigNode({"tts": {"provider": "kokoro", "voice": "af_heart", "warmup": True}})
+
+    with patch.object(KokoroTTS, "warm_up", side_effect=called.set):
+        backend = get_tts_backend(config)
+        assert called.wait(timeout=5)
+
+    assert isinstance(backend, KokoroTTS)
+
+
+def test_get_tts_backend_reuses_instances():
+    """Equal settings share one backend; different settings do not."""
+    config = ConfigNode({"tts": {"provider": "pyttsx3", "rate": 180}})
+    backend = get_tts_backend(config)
+    assert get_tts_backend(ConfigNode({"tts": {"provider": "pyttsx3", "rate": 180}})) is backend
+    assert get_tts_backend(ConfigNode({"tts": {"provider": "pyttsx3", "rate": 120}})) is not backend
+
+
+def test_get_tts_backend_unhashable_options_uncached():
+    """Options that cannot be hashed still build a (fresh) backend."""
+    config = ConfigNode({"tts": {"provider": "pyttsx3", "extra": ["a"]}})
+    assert get_tts_backend(config) is not get_tts_backend(config)
+
+
+def test_get_tts_backend_constructor_type_error_propagates():
+    """A TypeError from the constructor surfaces; it is not retried uncached."""
+    calls = []
+
+    class Broken(TTSBackend):
+        def __init__(self, voice=None, **kwargs):
+            calls.append(kwargs)
+            raise TypeError("bad option")
+
+        def stream_tts(self, text):  # pragma: no cover
+            yield from ()
+
+    with patch.dict(tts_module._PROVIDERS, {"broken": Broken}):
+        with pytest.raises(TypeError, match="bad option"):
+            get_tts_backend(ConfigNode({"tts": {"provider": "broken", "rate": 1}}))
+    assert len(calls) == 1
+
+
+def test_reset_tts_backends_drops_instances():
+    """After a reset, equal settings build a new backend."""
+    config = ConfigNode({"tts": {"provider": "pyttsx3"}})
+    backend = get_tts_backend(config)
+    reset_tts_backends()
+    assert get_tts_backend(config) is not backend
+
+
+def test_get_tts_backend_warms_up_once_per_instance():
+    """A cached backend is not warmed up again."""
+    config = ConfigNode({"tts": {"provider": "kokoro", "warmup": True}})
+    with patch("voice_agent.tts.threading.Thread") as mock_thread:
+        get_tts_backend(config)
+        get_tts_backend(config)
+    mock_thread.assert_called_once()
+
+
+def test_get_tts_backend_no_warmup_by_default():
+    """Without tts.warmup, no warm-up is started."""
+    config = ConfigNode({"tts": {"provider": "kokoro", "voice": "af_heart"}})
+    with patch("voice_agent.tts.threading.Thread") as mock_thread:
+        get_tts_backend(config)
+    mock_thread.assert_not_called()
+
+
+def test_warm_up_failure_is_swallowed():
+    """A failing warm-up never propagates out of the background thread."""
+    from voice_agent.tts import _warm_up_quietly
+
+    backend = MagicMock()
+    backend.warm_up.side_effect = RuntimeError("model missing")
+    _warm_up_quietly(backend)
+    backend.warm_up.assert_called_once()
+
+
+def test_kokoro_warm_up_primes_model():
+    """KokoroTTS.warm_up() loads the model and runs one synthesis."""
+    mock_model = MagicMock()
+    mock_model.stream_tts_sync.return_value = iter([(24000, b"x")])
+    mock_fastrtc = MagicMock()
+    mock_fastrtc.get_tts_model.return_value = mock_model
+
+    backend = KokoroTTS()
+    with patch.dict(sys.modules, {"fastrtc": mock_fastrtc}):
+        backend.warm_up()
+
+    assert backend._model is mock_model
+    mock_model.stream_tts_sync.assert_called_once()
+
+
 # ---------------------------------------------------------------------------
 # ChatterboxTTS tests (R-18 — R-23)
 # ---------------------------------------------------------------------------
@@ -225,10 +617,26 @@ class TestChatterboxInstantiation:
         backend = ChatterboxTTS(voice_file="/tmp/ref.wav")
         assert "ChatterboxTTS" in repr(backend)
 
+    def test_repr_shows_voice_file_not_model(self):
+        backend = ChatterboxTTS(voice_file="/tmp/ref.wav", model_type="turbo")
+        backend._model = MagicMock()
+        assert repr(backend) == "ChatterboxTTS(voice_file='/tmp/ref.wav', model_type='turbo')"
+
     def test_lazy_model_not_loaded(self):
         backend = ChatterboxTTS(voice_file="/tmp/ref.wav")
         assert backend._model is None
 
+    def test_identical_instances_share_model(self):
+        with patch.object(
+            ChatterboxTTS, "_build_model", side_effect=lambda: MagicMock(spec=[])
+        ) as build:
+            first = ChatterboxTTS(voice_file="/tmp/ref.wav", device="cpu", quantize=False)
+            again = ChatterboxTTS(voice_file="/tmp/ref.wav", device="cpu", quantize=False)
+            other = ChatterboxTTS(voice_file="/tmp/other.wav", device="cpu", quantize=False)
+            assert first._load_model() is again._load_model()
+            assert other._load_model() is not first._load_model()
+        assert build.call_count == 2
+
 
 class TestChatterboxProviderRegistry:
     """R-18: ChatterboxTTS registered in _PROVIDERS."""
@@ -341,6 +749,247 @@ class TestChatterboxLazyImport:
                 backend._load_model()
 
 
+class TestChatterboxCpuQuantization:
+    """Linear layers are quantised to int8 when running on CPU."""
+
+    @pytest.fixture
+    def fake_torch(self):
+        class Module:
+            pass
+
+        torch = MagicMock()
+        torch.nn.Module = Module
+        torch.ao.quantization.quantize_dynamic.side_effect = lambda m, *a, **k: ("q", m)
+        with patch.dict(sys.modules, {"torch": torch}):
+            yield torch
+
+    def _load(self, fake_torch, **kwargs):
+        wrapper = MagicMock(spec=[])
+        wrapper.t3 = fake_torch.nn.Module()
+        wrapper.sr = 24000
+        backend = ChatterboxTTS(voice_file="/tmp/ref.wav", **kwargs)
+        with patch.object(ChatterboxTTS, "_build_model", return_value=wrapper):
+            return backend._load_model(), wrapper
+
+    def test_cpu_quantizes_module_components(self, fake_torch):
+        model, wrapper = self._load(fake_torch, device="cpu")
+        assert model is wrapper
+        assert model.t3[0] == "q"
+        assert model.sr == 24000
+
+    def test_cuda_not_quantized(self, fake_torch):
+        self._load(fake_torch, device="cuda")
+        fake_torch.ao.quantization.quantize_dynamic.assert_not_called()
+
+    def test_quantize_disabled(self, fake_torch):
+        self._load(fake_torch, device="cpu", quantize=False)
+        fake_torch.ao.quantization.quantize_dynamic.assert_not_called()
+
+    def test_quantization_failure_keeps_fp32(self, fake_torch):
+        fake_torch.ao.quantization.quantize_dynamic.side_effect = RuntimeError("no engine")
+        model, wrapper = self._load(fake_torch, device="cpu")
+        assert isinstance(model.t3, fake_torch.nn.Module)
+
+
+class TestChatterboxCudaPrecision:
+    """Model calls run under CUDA autocast when a half precision is set."""
+
+    @pytest.fixture
+    def fake_torch(self):
+        torch = MagicMock()
+        with patch.dict(sys.modules, {"torch": torch}):
+            yield torch
+
+    def test_float32_uses_no_autocast(self, fake_torch):
+        backend = ChatterboxTTS(voice_file="v.wav", device="cuda")
+        with backend._autocast():
+            pass
+        fake_torch.autocast.assert_not_called()
+
+    def test_explicit_precision(self, fake_torch):
+        backend = ChatterboxTTS(voice_file="v.wav", device="cuda", precision="float16")
+        assert backend._autocast() is fake_torch.autocast.return_value
+        fake_torch.autocast.assert_called_once_with("cuda", dtype=fake_torch.float16)
+
+    @pytest.mark.parametrize("supported", [True, False])
+    def test_auto_uses_bf16_when_supported(self, fake_torch, supported):
+        fake_torch.cuda.is_bf16_supported.return_value = supported
+        backend = ChatterboxTTS(voice_file="v.wav", device="cuda", precision="auto")
+        with backend._autocast():
+            pass
+        if supported:
+            fake_torch.autocast.assert_called_once_with("cuda", dtype=fake_torch.bfloat16)
+        else:
+            fake_torch.autocast.assert_not_called()
+
+    def test_cpu_uses_no_autocast(self, fake_torch):
+        backend = ChatterboxTTS(voice_file="v.wav", device="cpu", precision="bfloat16")
+        with backend._autocast():
+            pass
+        fake_torch.autocast.assert_not_called()
+
+    def test_weights_are_not_cast(self, fake_torch):
+        wrapper = MagicMock(spec=[])
+        wrapper.t3 = MagicMock()
+        backend = ChatterboxTTS(voice_file="v.wav", device="cuda", precision="float16")
+        with patch.object(ChatterboxTTS, "_build_model", return_value=wrapper):
+            model = backend._load_model()
+        model.t3.to.assert_not_called()
+        model.t3.half.assert_not_called()
+
+    def test_generate_runs_under_autocast_in_worker(self, fake_torch, tmp_path):
+        wav = tmp_path / "voice.wav"
+        wav.write_bytes(b"RIFF....WAVEfmt ")
+        backend = ChatterboxTTS(voice_file=str(wav), device="cuda", precision="float16")
+        active = []
+        fake_torch.autocast.return_value.__enter__.side_effect = lambda *a: active.append(1)
+        fake_torch.autocast.return_value.__exit__.side_effect = lambda *a: active.pop()
+        calls = []
+        mock_model = MagicMock(spec=["generate"])
+        mock_model.generate.side_effect = lambda text, **kw: calls.append(bool(active)) or "w"
+        backend._model = mock_model
+
+        with patch.object(tts_module, "np", MagicMock()):
+            list(backend.stream_tts("Hello world."))
+
+        assert calls == [True]
+        assert active == []
+
+    def test_fp32_inputs_through_half_precision_layer(self):
+        torch = pytest.importorskip("torch")
+        if not torch.cuda.is_available():
+            pytest.skip("needs a CUDA device")
+        backend = ChatterboxTTS(voice_file="v.wav", device="cuda", precision="float16")
+        layer = torch.nn.Linear(4, 4).cuda()
+        features = torch.randn(2, 4, device="cuda")  # FP32, like the conditionals
+        with backend._autocast():
+            out = layer(features)
+        assert out.dtype == torch.float16
+        assert layer.weight.dtype == torch.float32
+
+    def test_invalid_precision(self):
+        with pytest.raises(ValueError, match="precision"):
+            ChatterboxTTS(voice_file="v.wav", precision="int4")
+
+
+class TestChatterboxCudaCompile:
+    """Heavy components are torch.compiled on CUDA when enabled."""
+
+    @pytest.fixture
+    def fake_torch(self):
+        class Module:
+            pass
+
+        torch = MagicMock()
+        torch.nn.Module = Module
+        torch.compile.side_effect = lambda m, **k: ("compiled", m)
+        with patch.dict(sys.modules, {"torch": torch}):
+            yield torch
+
+    def _load(self, fake_torch, **kwargs):
+        wrapper = MagicMock(spec=["generate"])
+        wrapper.t3 = fake_torch.nn.Module()
+        wrapper.s3gen = fake_torch.nn.Module()
+        backend = ChatterboxTTS(voice_file="/tmp/ref.wav", **kwargs)
+        with patch.object(ChatterboxTTS, "_build_model", return_value=wrapper):
+            return backend._load_model(), wrapper
+
+    def test_compiles_and_primes_on_cuda(self, fake_torch, monkeypatch):
+        environ: dict[str, str] = {}
+        monkeypatch.setattr(tts_module.os, "environ", environ)
+        model, wrapper = self._load(fake_torch, device="cuda", compile=True)
+        assert model.t3[0] == "compiled" and model.s3gen[0] == "compiled"
+        assert fake_torch.compile.call_args.kwargs["mode"] == "reduce-overhead"
+        assert wrapper.generate.call_count == 2
+        assert environ["TORCHINDUCTOR_CACHE_DIR"].endswith("torchinductor")
+        assert environ["TORCHINDUCTOR_FX_GRAPH_CACHE"] == "1"
+
+    def test_compile_failure_restores_eager(self, fake_torch, monkeypatch):
+        monkeypatch.setattr(tts_module.os, "environ", {})
+        wrapper = MagicMock(spec=["generate"])
+        wrapper.t3 = t3 = fake_torch.nn.Module()
+        wrapper.generate.side_effect = RuntimeError("BackendCompilerFailed")
+        backend = ChatterboxTTS(voice_file="/tmp/ref.wav", device="cuda", compile=True)
+        with patch.object(ChatterboxTTS, "_build_model", return_value=wrapper):
+            model = backend._load_model()
+        assert model.t3 is t3
+
+    @pytest.mark.parametrize("kwargs", [
+        {"device": "cuda"},
+        {"device": "cpu", "compile": True, "quantize": False},
+        {"device": "cuda", "compile": True, "model_type": "rsxdalv-faster"},
+    ])
+    def test_not_compiled(self, fake_torch, kwargs):
+        self._load(fake_torch, **kwargs)
+        fake_torch.compile.assert_not_called()
+
+
+class TestChatterboxReferenceCache:
+    """Reference-voice conditioning is computed once and cached on disk."""
+
+    @pytest.fixture
+    def fake_chatterbox(self):
+        """Fake ``chatterbox.tts`` whose Conditionals load from existing files."""
+        def load(path, map_location=None):
+            return path.read_bytes()  # FileNotFoundError on a cache miss
+
+        module = MagicMock()
+        module.Conditionals.load.side_effect = load
+        with patch.dict(sys.modules, {"chatterbox.tts": module}):
+            yield module
+
+    @staticmethod
+    def _model():
+        model = MagicMock()
+        model.conds.save.side_effect = lambda path: path.write_bytes(b"conds")
+        return model
+
+    @staticmethod
+    def _voice(tmp_path):
+        wav = tmp_path / "voice.wav"
+        wav.write_bytes(b"RIFF" + b"\x00" * 8000)
+        return wav
+
+    def test_encodes_once_per_session(self, tmp_path, fake_chatterbox):
+        wav = self._voice(tmp_path)
+        backend = ChatterboxTTS(voice_file=str(wav), device="cpu")
+        model = self._model()
+
+        assert backend._prepare_reference(model, wav) is True
+        assert backend._prepare_reference(model, wav) is True
+
+        model.prepare_conditionals.assert_called_once_with(str(wav), exaggeration=0.5)
+        assert backend._reference_cache_path(wav).read_bytes() == b"conds"
+
+    def test_new_session_loads_from_disk(self, tmp_path, fake_chatterbox):
+        wav = self._voice(tmp_path)
+        ChatterboxTTS(voice_file=str(wav), device="cpu")._prepare_reference(
+            self._model(), wav
+        )
+
+        model = self._model()
+        ChatterboxTTS(voice_file=str(wav), device="cpu")._prepare_reference(model, wav)
+
+        model.prepare_conditionals.assert_not_called()
+        assert model.conds == b"conds"
+
+    def test_cache_key_depends_on_content_and_model(self, tmp_path):
+        original = ChatterboxTTS(voice_file="unused")
+        turbo = ChatterboxTTS(voice_file="unused", model_type="turbo")
+        a = tmp_path / "a.wav"
+        b = tmp_path / "b.wav"
+        a.write_bytes(b"RIFF-one")
+        b.write_bytes(b"RIFF-two")
+        assert original._reference_cache_path(a) == original._reference_cache_path(a)
+        assert original._reference_cache_path(a) != original._reference_cache_path(b)
+        assert original._reference_cache_path(a) != turbo._reference_cache_path(a)
+
+    def test_model_without_conditionals_not_prepared(self, tmp_path):
+        wav = self._voice(tmp_path)
+        backend = ChatterboxTTS(voice_file=str(wav))
+        assert backend._prepare_reference(MagicMock(spec=["generate"]), wav) is False
+
+
 class TestChatterboxTextChunking:
     """R-22: Sentence-boundary text chunking."""
 
@@ -350,6 +999,12 @@ class TestChatterboxTextChunking:
     def test_whitespace_only(self):
         assert _chunk_text("   ") == []
 
+    def test_splits_only_at_ascii_whitespace(self):
+        # A no-break space after a period (e.g. "Mr.\u00a0Smith") is not a
+        # sentence boundary.
+        text = "Mr.\u00a0Smith arrived.\tThen left."
+        assert _chunk_text(text, limit=10) == ["Mr.\u00a0Smith arrived.", "Then left."]
+
     def test_short_text_single_chunk(self):
         text = "Hello world."
         chunks = _chunk_text(text)
@@ -378,6 +1033,11 @@ class TestChatterboxTextChunking:
         assert len(chunks) == 1
         assert chunks[0] == text
 
+    def test_chunks_are_slices_of_the_input(self):
+        text = "  First one.\nSecond one!  Third one? " + "Z" * 30 + "."
+        chunks = _chunk_text(text, limit=40)
+        assert chunks == ["First one.\nSecond one!  Third one?", "Z" * 30 + "."]
+
     def test_question_and_exclamation_splits(self):
         s1 = "X" * 300 + "?"
         s2 = "Y" * 300 + "!"
@@ -392,18 +1052,18 @@ class TestChatterboxStreamTTS:
     def _make_mock_model(self):
         mock_model = MagicMock()
         # Return a mock tensor that mimics the torch.Tensor chaining API.
-        # squeeze() -> cpu() -> numpy() -> astype() must all resolve.
+        # squeeze() -> float() -> cpu() -> numpy() must all resolve.
         fake_audio = MagicMock()
-        fake_audio.astype.return_value = fake_audio  # .astype(np.float32)
         fake_tensor = MagicMock()
         fake_tensor.squeeze.return_value = fake_tensor
+        fake_tensor.float.return_value = fake_tensor
         fake_tensor.cpu.return_value = fake_tensor
         fake_tensor.numpy.return_value = fake_audio
         mock_model.generate.return_value = fake_tensor
         return mock_model
 
     def _make_mock_np(self):
-        """Create a fake numpy module so stream_tts can import it."""
+        """Create a fake numpy module to stand in for ``voice_agent.tts.np``."""
         mock_np = MagicMock()
         mock_np.float32 = "float32"
         mock_np.asarray.side_effect = lambda v, dtype=None: v
@@ -419,7 +1079,7 @@ class TestChatterboxStreamTTS:
         mock_model = self._make_mock_model()
         backend._model = mock_model
 
-        with patch.dict(sys.modules, {"numpy": self._make_mock_np()}):
+        with patch.object(tts_module, "np", self._make_mock_np()):
             chunks = list(backend.stream_tts("Hello world."))
         assert len(chunks) == 1
         sr, audio = chunks[0]
@@ -439,7 +1099,7 @@ class TestChatterboxStreamTTS:
         mock_model = self._make_mock_model()
         backend._model = mock_model
 
-        with patch.dict(sys.modules, {"numpy": self._make_mock_np()}):
+        with patch.object(tts_module, "np", self._make_mock_np()):
             chunks = list(backend.stream_tts("Hello world."))
         assert len(chunks) == 1
         call_kwargs = mock_model.generate.call_args
@@ -457,7 +1117,7 @@ class TestChatterboxStreamTTS:
         mock_model = self._make_mock_model()
         backend._model = mock_model
 
-        with patch.dict(sys.modules, {"numpy": self._make_mock_np()}):
+        with patch.object(tts_module, "np", self._make_mock_np()):
             chunks = list(backend.stream_tts("Hello world."))
         assert len(chunks) == 1
         # rsxdalv-faster uses same API as original (with exaggeration/cfg_weight)
@@ -476,7 +1136,234 @@ class TestChatterboxStreamTTS:
 
         # Build text > 500 chars with 2 sentences
         long_text = ("A" * 300 + ". ") + ("B" * 300 + ".")
-        with patch.dict(sys.modules, {"numpy": self._make_mock_np()}):
+        with patch.object(tts_module, "np", self._make_mock_np()):
             chunks = list(backend.stream_tts(long_text))
         assert len(chunks) == 2
         assert mock_model.generate.call_count == 2
+
+    def test_stream_tts_prefetches_next_chunk_in_order(self, tmp_path):
+        import threading
+
+        wav = tmp_path / "voice.wav"
+        wav.write_bytes(b"RIFF....WAVEfmt ")
+
+        backend = ChatterboxTTS(
+            voice_file=str(wav), model_type="turbo", device="cpu",
+        )
+        second_started = threading.Event()
+
+        def generate(chunk, **kwargs):
+            if chunk.startswith("B"):
+                second_started.set()
+            return chunk[0]
+
+        mock_model = MagicMock(spec=["generate"])
+        mock_model.generate.side_effect = generate
+        backend._model = mock_model
+
+        long_text = ("A" * 300 + ". ") + ("B" * 300 + ".")
+        with patch.object(tts_module, "np", self._make_mock_np()):
+            stream = backend.stream_tts(long_text)
+            first = next(stream)
+            # Chunk B is synthesised while chunk A is being consumed.
+            assert second_started.wait(timeout=5)
+            rest = list(stream)
+
+        assert [audio for _, audio in [first, *rest]] == ["A", "B"]
+
+    def test_stream_tts_shuts_down_both_stages_on_early_close(self, tmp_path):
+        from concurrent.futures import ThreadPoolExecutor
+
+        shutdowns = []
+
+        class RecordingPool(ThreadPoolExecutor):
+            def shutdown(self, wait=True, *, cancel_futures=False):
+                shutdowns.append((self._thread_name_prefix, wait, cancel_futures))
+                super().shutdown(wait=wait, cancel_futures=cancel_futures)
+
+        wav = tmp_path / "voice.wav"
+        wav.write_bytes(b"RIFF....WAVEfmt ")
+        backend = ChatterboxTTS(voice_file=str(wav), device="cpu")
+        mock_model = MagicMock(spec=["generate"])
+        mock_model.generate.side_effect = lambda text, **kw: text[0]
+        backend._model = mock_model
+
+        long_text = ("A" * 300 + ". ") + ("B" * 300 + ". ") + ("C" * 300 + ".")
+        with patch("concurrent.futures.ThreadPoolExecutor", RecordingPool), \
+                patch.object(tts_module, "np", self._make_mock_np()):
+            stream = backend.stream_tts(long_text)
+            next(stream)
+            stream.close()
+
+        assert sorted(shutdowns) == [
+            ("chatterbox-gen", False, True),
+            ("chatterbox-post", False, True),
+        ]
+
+    def test_stream_tts_cuda_copies_on_side_stream(self, tmp_path):
+        wav = tmp_path / "voice.wav"
+        wav.write_bytes(b"RIFF....WAVEfmt ")
+        backend = ChatterboxTTS(voice_file=str(wav), device="cuda")
+        mock_model = self._make_mock_model()
+        backend._model = mock_model
+        fake_tensor = mock_model.generate.return_value
+        fake_tensor.is_cuda = True
+        device_wav = fake_tensor.squeeze.return_value
+
+        torch = MagicMock()
+        host = torch.empty.return_value
+        on_copy_stream, copies = [], []
+        torch.cuda.stream.return_value.__enter__.side_effect = (
+            lambda *a: on_copy_stream.append(True)
+        )
+        torch.cuda.stream.return_value.__exit__.side_effect = (
+            lambda *a: on_copy_stream.pop()
+        )
+        host.copy_.side_effect = lambda *a, **k: copies.append(bool(on_copy_stream))
+        with patch.dict(sys.modules, {"torch": torch}), \
+                patch.object(tts_module, "np", self._make_mock_np()):
+            [(_, audio)] = backend.stream_tts("Hello world.")
+
+        assert audio is host.numpy.return_value
+        assert torch.empty.call_args.kwargs["pin_memory"] is True
+        assert torch.empty.call_args.kwargs["dtype"] is torch.float32
+        # The float32 conversion happens inside copy_, under the copy stream;
+        # no cast kernel is launched on the generation stream.
+        host.copy_.assert_called_once_with(device_wav, non_blocking=True)
+        assert copies == [True]
+        torch.cuda.stream.assert_called_once_with(torch.cuda.Stream.return_value)
+        device_wav.float.assert_not_called()
+        fake_tensor.float.assert_not_called()
+        fake_tensor.cpu.assert_not_called()
+        copy_stream = torch.cuda.Stream.return_value
+        copy_stream.wait_event.assert_called_once_with(torch.cuda.Event.return_value)
+        torch.cuda.Event.return_value.record.assert_called_once_with()
+        copy_stream.synchronize.assert_called_once_with()
+
+    def test_stream_tts_yields_sub_chunks_when_streaming(self, tmp_path):
+        wav = tmp_path / "voice.wav"
+        wav.write_bytes(b"RIFF....WAVEfmt ")
+        backend = ChatterboxTTS(
+            voice_file=str(wav), device="cpu", stream_chunk_size=25,
+        )
+        mock_model = MagicMock(spec=["generate", "generate_stream"])
+        mock_model.generate_stream.return_value = iter([("a", {}), "b"])
+        backend._model = mock_model
+
+        with patch.object(tts_module, "np", self._make_mock_np()):
+            chunks = list(backend.stream_tts("Hello world."))
+
+        assert [audio for _, audio in chunks] == ["a", "b"]
+        mock_model.generate.assert_not_called()
+        kwargs = mock_model.generate_stream.call_args.kwargs
+        assert kwargs["chunk_size"] == 25 and kwargs["exaggeration"] == 0.5
+
+    def test_stream_tts_falls_back_without_generate_stream(self, tmp_path):
+        wav = tmp_path / "voice.wav"
+        wav.write_bytes(b"RIFF....WAVEfmt ")
+        backend = ChatterboxTTS(
+            voice_file=str(wav), device="cpu", stream_chunk_size=25,
+        )
+        mock_model = MagicMock(spec=["generate"])
+        mock_model.generate.return_value = "whole"
+        backend._model = mock_model
+
+        with patch.object(tts_module, "np", self._make_mock_np()):
+            assert list(backend.stream_tts("Hello world.")) == [(24000, "whole")]
+
+    def test_stream_tts_batches_chunks_with_generate_batch(self, tmp_path):
+        wav = tmp_path / "voice.wav"
+        wav.write_bytes(b"RIFF....WAVEfmt ")
+        backend = ChatterboxTTS(voice_file=str(wav), device="cpu", batch_size=2)
+        mock_model = MagicMock(spec=["generate", "generate_batch"])
+        mock_model.generate_batch.side_effect = lambda texts, **kw: [t[0] for t in texts]
+        mock_model.generate.side_effect = lambda text, **kw: text[0]
+        backend._model = mock_model
+
+        text = " ".join(f"{letter * 300}." for letter in "ABC")
+        with patch.object(tts_module, "np", self._make_mock_np()):
+            chunks = list(backend.stream_tts(text))
+
+        assert [audio for _, audio in chunks] == ["A", "B", "C"]
+        assert mock_model.generate_batch.call_count == 1
+        assert mock_model.generate_batch.call_args.kwargs["cfg_weight"] == 0.5
+        # The odd chunk out goes through the single-text path.
+        mock_model.generate.assert_called_once()
+
+    def test_stream_tts_batched_shares_batches_across_texts(self, tmp_path):
+        wav = tmp_path / "voice.wav"
+        wav.write_bytes(b"RIFF....WAVEfmt ")
+        backend = ChatterboxTTS(voice_file=str(wav), device="cpu", batch_size=2)
+        mock_model = MagicMock(spec=["generate", "generate_batch"])
+        mock_model.generate_batch.side_effect = lambda texts, **kw: list(texts)
+        backend._model = mock_model
+
+        with patch.object(tts_module, "np", self._make_mock_np()):
+            chunks = list(backend.stream_tts_batched(["Hi.", "", "Bye."]))
+
+        assert [audio for _, audio in chunks] == ["Hi.", "Bye."]
+        mock_model.generate_batch.assert_called_once()
+        mock_model.generate.assert_not_called()
+
+    def test_stream_tts_batched_consumes_texts_lazily(self, tmp_path):
+        wav = tmp_path / "voice.wav"
+        wav.write_bytes(b"RIFF....WAVEfmt ")
+        backend = ChatterboxTTS(voice_file=str(wav), device="cpu")
+        mock_model = MagicMock(spec=["generate"])
+        mock_model.generate.side_effect = lambda text, **kw: text
+        backend._model = mock_model
+        pulled = []
+
+        def sentences():
+            for text in ("One.", "Two.", "Three."):
+                pulled.append(text)
+                yield text
+
+        with patch.object(tts_module, "np", self._make_mock_np()):
+            chunks = backend.stream_tts_batched(sentences())
+            assert next(chunks) == (24000, "One.")
+            # Only the sentence generating behind the first has been pulled.
+            assert pulled == ["One.", "Two."]
+            assert [audio for _, audio in chunks] == ["Two.", "Three."]
+
+    def test_stream_tts_batch_size_needs_generate_batch(self, tmp_path):
+        wav = tmp_path / "voice.wav"
+        wav.write_bytes(b"RIFF....WAVEfmt ")
+        backend = ChatterboxTTS(voice_file=str(wav), device="cpu", batch_size=4)
+        mock_model = MagicMock(spec=["generate"])
+        mock_model.generate.side_effect = lambda text, **kw: text[0]
+        backend._model = mock_model
+
+        with patch.object(tts_module, "np", self._make_mock_np()):
+            chunks = list(backend.stream_tts("A" * 300 + ". " + "B" * 300 + "."))
+
+        assert [audio for _, audio in chunks] == ["A", "B"]
+
+    def test_invalid_batch_size(self):
+        with pytest.raises(ValueError, match="batch_size"):
+            ChatterboxTTS(voice_file="v.wav", batch_size=0)
+
+    def test_stream_tts_without_numpy(self, tmp_path):
+        wav = tmp_path / "voice.wav"
+        wav.write_bytes(b"RIFF....WAVEfmt ")
+        backend = ChatterboxTTS(voice_file=str(wav), device="cpu")
+        backend._model = self._make_mock_model()
+
+        with patch.object(tts_module, "np", None):
+            with pytest.raises(RuntimeError, match="pip install numpy"):
+                list(backend.stream_tts("Hello world."))
+
+    def test_stream_tts_casts_on_tensor_without_numpy_copy(self, tmp_path):
+        wav = tmp_path / "voice.wav"
+        wav.write_bytes(b"RIFF....WAVEfmt ")
+        backend = ChatterboxTTS(voice_file=str(wav), device="cpu")
+        mock_model = self._make_mock_model()
+        backend._model = mock_model
+        fake_tensor = mock_model.generate.return_value
+
+        with patch.object(tts_module, "np", self._make_mock_np()):
+            [(_, audio)] = backend.stream_tts("Hello world.")
+
+        fake_tensor.float.assert_called_once_with()
+        assert audio is fake_tensor.numpy.return_value
+        audio.astype.assert_not_called()
@@ -159,6 +159,17 @@ class TestDiscoverCommands:
         commands = discover_commands(empty_typer_file)
         assert commands == []
 
+    def test_file_without_decorators_skips_ast(self, tmp_path: Path, monkeypatch):
+        """Files with no ``.command`` text are not AST-parsed."""
+        f = tmp_path / "plain.py"
+        f.write_text("def helper():\n    return 1\n")
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("ast.parse should not run")
+
+        monkeypatch.setattr("voice_agent.typer_discovery.ast.parse", _fail)
+        assert discover_commands(f) == []
+
     def test_missing_docstring(self, no_docstring_file: Path):
         """Commands without docstrings get empty strings."""
         commands = discover_commands(no_docstring_file)
@@ -176,6 +187,121 @@ class TestDiscoverCommands:
         with pytest.raises(FileNotFoundError):
             discover_commands("/nonexistent/path/commands.py")
 
+    def test_command_info_has_no_instance_dict(self):
+        """CommandInfo uses slots, so instances carry no per-instance __dict__."""
+        assert not hasattr(CommandInfo("x", (), ""), "__dict__")
+
+    def test_command_info_is_hashable(self, typer_file: Path):
+        """Frozen CommandInfo with tuple params can be hashed and set-deduped."""
+        commands = discover_commands(typer_file)
+        assert len(set(commands + discover_commands(typer_file))) == 3
+
+    def test_unchanged_file_served_from_cache(self, typer_file: Path, monkeypatch):
+        """A second discovery of an unchanged file skips parsing."""
+        monkeypatch.setenv("VOICE_AGENT_CACHE_DIR", str(typer_file.parent / "cache"))
+        first = discover_commands(typer_file)
+
+        def _fail(path):
+            raise AssertionError("file was re-parsed")
+
+        monkeypatch.setattr("voice_agent.typer_discovery._parse_commands", _fail)
+        assert discover_commands(typer_file) == first
+
+    def test_modified_file_is_reparsed(self, typer_file: Path, monkeypatch):
+        """Changing the file invalidates its cache entry."""
+        monkeypatch.setenv("VOICE_AGENT_CACHE_DIR", str(typer_file.parent / "cache"))
+        assert len(discover_commands(typer_file)) == 3
+
+        typer_file.write_text(SAMPLE_NO_DOCSTRINGS)
+        commands = discover_commands(typer_file)
+        assert [c.name for c in commands] == ["quick-cmd"]
+
+    def test_corrupt_cache_entry_ignored(self, typer_file: Path, monkeypatch):
+        """An unreadable cache entry falls back to parsing."""
+        cache_root = typer_file.parent / "cache"
+        monkeypatch.setenv("VOICE_AGENT_CACHE_DIR", str(cache_root))
+        discover_commands(typer_file)
+        for entry in (cache_root / "typer_catalog").iterdir():
+            entry.write_bytes(b"not a pickle")
+        assert len(discover_commands(typer_file)) == 3
+
+    def test_repeat_discovery_served_from_memory(self, typer_file: Path, monkeypatch):
+        """Later calls for an unchanged file skip the on-disk cache too."""
+        first = build_command_catalog(typer_file)
+
+        def _fail(cache_file):
+            raise AssertionError("on-disk cache was consulted")
+
+        monkeypatch.setattr("voice_agent.typer_discovery._load_cached_commands", _fail)
+        assert build_command_catalog(typer_file) == first
+        assert len(discover_commands(typer_file)) == 3
+
+    def test_only_top_level_and_class_defs_are_scanned(self, tmp_path: Path):
+        """Module- and class-level commands are found; nested defs are not."""
+        f = tmp_path / "scoped.py"
+        f.write_text(
+            "@app.command()\n"
+            "async def fetch_data(url: str):\n"
+            "    @app.command()\n"
+            "    def inner():\n"
+            "        pass\n"
+            "\n"
+            "class Group:\n"
+            "    @app.command()\n"
+            "    def member_cmd(self):\n"
+            "        pass\n"
+        )
+        assert [c.name for c in discover_commands(f)] == ["fetch-data", "member-cmd"]
+
+    def test_complex_annotations_render_as_source(self, tmp_path: Path):
+        """Unions, multi-argument generics and Annotated read as Python."""
+        f = tmp_path / "typed.py"
+        f.write_text(
+            "@app.command()\n"
+            "def run(a: int | None, b: dict[str, int], c: Annotated[str, typer.Option()]):\n"
+            "    pass\n"
+        )
+        assert discover_commands(f)[0].params == (
+            "a:int | None",
+            "b:dict[str, int]",
+            "c:Annotated[str, typer.Option()]",
+        )
+
+    def test_any_app_name_and_other_decorators(self, tmp_path: Path):
+        """Any Typer instance name works; other decorators are ignored."""
+        f = tmp_path / "cli.py"
+        f.write_text(
+            "@cli.command(name='x')\n@other\ndef first():\n    pass\n\n"
+            "@functools.cache\ndef cached():\n    pass\n\n"
+            "@self.app.command()\ndef dotted():\n    pass\n"
+        )
+        assert [c.name for c in discover_commands(f)] == ["first"]
+
+    def test_docstring_keeps_summary_line_only(self, tmp_path: Path):
+        """Multi-paragraph docstrings are reduced to their first line."""
+        f = tmp_path / "long_doc.py"
+        f.write_text(
+            "@app.command()\n"
+            "def sync():\n"
+            '    """\n'
+            "    Sync the mirror.  \n"
+            "\n"
+            "    Long description that the catalog never shows.\n"
+            '    """\n'
+        )
+        assert discover_commands(f)[0].docstring == "Sync the mirror."
+
+    def test_source_encoding_declaration_respected(self, tmp_path: Path):
+        """Files are decoded per their coding cookie, not the locale."""
+        f = tmp_path / "latin.py"
+        f.write_bytes(
+            b"# -*- coding: latin-1 -*-\n"
+            b"@app.command()\n"
+            b"def greet():\n"
+            b'    """Say caf\xe9."""\n'
+        )
+        assert discover_commands(f)[0].docstring == "Say caf\u00e9."
+
     def test_underscores_become_hyphens(self, typer_file: Path):
         """Function underscores are converted to hyphens in command names."""
         commands = discover_commands(typer_file)
@@ -242,3 +368,16 @@ class TestBuildCatalogFromFiles:
         assert "[no_doc]" in catalog
         assert "list-dir" in catalog
         assert "quick-cmd" in catalog
+
+    def test_parallel_matches_sequential(self, tmp_path: Path, monkeypatch):
+        """Parsing in worker processes yields the same catalog, in order."""
+        files = []
+        for i, sample in enumerate([SAMPLE_TYPER_FILE, SAMPLE_NO_DOCSTRINGS] * 2):
+            f = tmp_path / f"cmds_{i}.py"
+            f.write_text(sample)
+            files.append(f)
+
+        sequential = build_catalog_from_files(files)
+        monkeypatch.setattr("voice_agent.typer_discovery._PARALLEL_MIN_FILES", 2)
+        monkeypatch.setattr("voice_agent.typer_discovery._CATALOG_CACHE", {})
+        assert build_catalog_from_files(files) == sequential
@@ -0,0 +1,54 @@
+"""On-disk cache location and pickle helpers shared by persistent caches.
+
+Caches live under ``$VOICE_AGENT_CACHE_DIR`` if set, otherwise under
+``$XDG_CACHE_HOME/voice_agent`` (default ``~/.cache/voice_agent``).
+Everything stored there is derived data and safe to delete.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any
+
+
+def cache_dir(*parts: str) -> Path:
+    """Return the cache directory for *parts*, e.g. ``cache_dir("typer")``.
+
+    The directory is not created; callers create it when they first write.
+    """
+    root = os.environ.get("VOICE_AGENT_CACHE_DIR")
+    if root:
+        base = Path(root)
+    else:
+        xdg = os.environ.get("XDG_CACHE_HOME")
+        base = (Path(xdg) if xdg else Path.home() / ".cache") / "voice_agent"
+    return base.joinpath(*parts)
+
+
+def load_pickle(cache_file: Path) -> Any:
+    """Return the object pickled in *cache_file*, or ``None`` on any failure."""
+    try:
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        # Missing, corrupt or incompatible entry — the caller recomputes.
+        return None
+
+
+def store_pickle(cache_file: Path, value: Any) -> None:
+    """Atomically pickle *value* to *cache_file*; best-effort, never raises."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, cache_file)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except Exception:
+        pass
@@ -7,14 +7,14 @@ and executes that output.
 
 from __future__ import annotations
 
-import re
-from dataclasses import dataclass
+import functools
+from typing import TYPE_CHECKING, Collection, NamedTuple
 
-from voice_agent.execute import ExecutionResult, execute_chain
+if TYPE_CHECKING:
+    from voice_agent.execute import ExecutionResult
 
 
-@dataclass(frozen=True)
-class ParsedCommand:
+class ParsedCommand(NamedTuple):
     """Result of parsing LLM output into a CLI command."""
 
     raw: str
@@ -23,14 +23,28 @@ class ParsedCommand:
     rejection_reason: str = ""
 
 
-# Patterns that indicate the LLM declined to produce a command.
-_REFUSAL_PATTERNS = [
-    r"(?i)i(?:'m| am) (?:sorry|unable|not able)",
-    r"(?i)(?:doesn't|does not|don't|do not) match",
-    r"(?i)no (?:matching|available|valid) command",
-    r"(?i)cannot (?:find|identify|determine)",
-    r"(?i)i can(?:'t|not)",
-]
+# Lower-cased phrases that indicate the LLM declined to produce a command.
+# Checked as plain substrings, which is cheaper than running a regex.
+_REFUSAL_PHRASES = (
+    "i'm sorry",
+    "i am sorry",
+    "i'm unable",
+    "i am unable",
+    "i'm not able",
+    "i am not able",
+    "doesn't match",
+    "does not match",
+    "don't match",
+    "do not match",
+    "no matching command",
+    "no available command",
+    "no valid command",
+    "cannot find",
+    "cannot identify",
+    "cannot determine",
+    "i can't",
+    "i cannot",
+)
 
 
 def parse_llm_output(raw: str) -> ParsedCommand:
@@ -57,21 +71,21 @@ def parse_llm_output(raw: str) -> ParsedCommand:
         )
 
     # Check if the LLM refused to produce a command
-    for pattern in _REFUSAL_PATTERNS:
-        if re.search(pattern, cleaned):
-            return ParsedCommand(
-                raw=raw,
-                command="",
-                is_valid=False,
-                rejection_reason=cleaned,
-            )
+    lowered = cleaned.lower()
+    if any(phrase in lowered for phrase in _REFUSAL_PHRASES):
+        return ParsedCommand(
+            raw=raw,
+            command="",
+            is_valid=False,
+            rejection_reason=cleaned,
+        )
 
     return ParsedCommand(raw=raw, command=cleaned, is_valid=True)
 
 
 def validate_against_catalog(
     parsed: ParsedCommand,
-    known_commands: list[str],
+    known_commands: Collection[str],
 ) -> ParsedCommand:
     """Validate that the first token of each chained command is in the catalog.
 
@@ -80,7 +94,9 @@ def validate_against_catalog(
     parsed:
         A previously parsed command.
     known_commands:
-        List of known command names (e.g. ``["ls-dir", "backup-file"]``).
+        Known command names (e.g. ``["ls-dir", "backup-file"]``).  Passing a
+        ``frozenset`` built once per session avoids re-hashing the catalog
+        on every call.
 
     Returns
     -------
@@ -95,16 +111,24 @@ def validate_against_catalog(
         # No catalog loaded — skip validation
         return parsed
 
-    segments = [s.strip() for s in parsed.command.split("&&") if s.strip()]
+    known = (
+        known_commands
+        if isinstance(known_commands, frozenset)
+        else frozenset(known_commands)
+    )
+    command = parsed.command
+    # Single commands (the common case) skip building a segment list.
+    segments = command.split("&&") if "&&" in command else (command,)
     for segment in segments:
-        first_token = segment.split()[0] if segment.split() else ""
-        if first_token not in known_commands:
-            return ParsedCommand(
-                raw=parsed.raw,
-                command=parsed.command,
+        tokens = segment.split(None, 1)
+        if not tokens:
+            continue
+        first_token = tokens[0]
+        if first_token not in known:
+            return parsed._replace(
                 is_valid=False,
                 rejection_reason=f"Unknown command: {first_token!r}. "
-                f"Available: {', '.join(sorted(known_commands))}",
+                f"Available: {_format_available(known)}",
             )
 
     return parsed
@@ -139,6 +163,9 @@ def execute_parsed_command(
     if not parsed.is_valid:
         raise ValueError(f"Cannot execute invalid command: {parsed.rejection_reason}")
 
+    # Deferred so that parse/validate-only callers never import subprocess.
+    from voice_agent.execute import execute_chain
+
     return execute_chain(parsed.command, timeout=timeout, cwd=cwd)
 
 
@@ -147,11 +174,30 @@ def execute_parsed_command(
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=8)
+def _format_available(known: frozenset[str]) -> str:
+    """Return the sorted, comma-separated catalog for rejection messages.
+
+    The catalog is stable for a session, so the sort is paid once.
+    """
+    return ", ".join(sorted(known))
+
+
 def _strip_fences(text: str) -> str:
     """Remove markdown code fences (```...```) from LLM output."""
-    # Remove fenced code blocks — keep only the content inside
-    pattern = r"```(?:\w*\n?)?(.*?)```"
-    match = re.search(pattern, text, re.DOTALL)
-    if match:
-        return match.group(1).strip()
-    return text
+    # Most replies are bare commands; skip all work when there is no fence.
+    if "```" not in text:
+        return text
+    # Keep only the content of the first fenced block.  Splitting on the
+    # literal delimiter avoids regex backtracking over multi-fence replies.
+    parts = text.split("```", 2)
+    if len(parts) < 3:
+        # Unterminated fence — leave the text as-is.
+        return text
+    body = parts[1]
+    # Drop an optional language tag line (```bash), but only when the block
+    # has content after it; otherwise that line is the command itself.
+    tag, newline, rest = body.partition("\n")
+    if newline and tag and not any(ch.isspace() for ch in tag) and rest.strip():
+        body = rest
+    return body.strip()
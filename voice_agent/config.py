@@ -6,34 +6,62 @@ e.g. config.llm.provider, config.tts.voice.
 
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from voice_agent.cache import cache_dir, load_pickle, store_pickle
+
+try:
+    # LibYAML-backed loader; several times faster than the pure-Python one.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 DEFAULT_CONFIG_PATH = Path(__file__).resolve().parent.parent / "assistant_config.yml"
 
+# Parsed configs keyed by resolved path, stamped with (mtime_ns, size) so an
+# edited file is re-parsed on the next load.
+_CONFIG_CACHE: dict[str, tuple[int, int, ConfigNode]] = {}
+
 
 class ConfigNode:
-    """Recursive wrapper that turns a dict into an object with attribute access."""
+    """Recursive wrapper that turns a dict into an object with attribute access.
+
+    Values are served straight from the wrapped dict; nested sections are
+    wrapped on first access and the wrapper is reused afterwards.
+    """
+
+    __slots__ = ("_data", "_children")
 
     def __init__(self, data: dict[str, Any]) -> None:
         self._data = data
-        for key, value in data.items():
-            if isinstance(value, dict):
-                setattr(self, key, ConfigNode(value))
-            else:
-                setattr(self, key, value)
+        self._children: dict[str, ConfigNode] = {}
 
     def __repr__(self) -> str:
         return f"ConfigNode({self._data!r})"
 
     def __getattr__(self, name: str) -> Any:
-        # Only intercept keys that exist in the underlying data as dicts
-        # (i.e. sub-sections). For anything else, raise AttributeError so
-        # that getattr(obj, key, default) works correctly.
+        # Only reached when normal lookup fails, i.e. for config keys.
+        # Private names raise immediately so copy/pickle never recurse.
         if name.startswith("_"):
             raise AttributeError(name)
+        child = self._children.get(name)
+        if child is not None:
+            return child
+        try:
+            value = self._data[name]
+        except KeyError:
+            pass
+        else:
+            if isinstance(value, dict):
+                child = self._children[name] = ConfigNode(value)
+                return child
+            return value
+        # Missing keys raise AttributeError so that
+        # getattr(obj, key, default) works correctly.
         raise AttributeError(
             f"Config has no attribute {name!r}. "
             f"Available keys: {', '.join(sorted(self._data)) or '(none)'}"
@@ -54,6 +82,13 @@ class ConfigNode:
 def load_config(path: Path | str | None = None) -> ConfigNode:
     """Load YAML config and return a ConfigNode with dot-path access.
 
+    Results are cached per file and reused until its modification time or
+    size changes, so repeated loads cost a single ``stat``.  The returned
+    node is shared between callers and must not be mutated; call
+    :func:`clear_config_cache` to drop the cache.  Across restarts, the
+    parsed data is reused from an on-disk cache while the file's content
+    hash is unchanged.
+
     Parameters
     ----------
     path:
@@ -66,8 +101,37 @@ def load_config(path: Path | str | None = None) -> ConfigNode:
         If the config file does not exist.
     """
     config_path = Path(path) if path else DEFAULT_CONFIG_PATH
-    if not config_path.exists():
-        raise FileNotFoundError(f"Config file not found: {config_path}")
-    with open(config_path) as f:
-        data = yaml.safe_load(f)
-    return ConfigNode(data)
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {config_path}") from None
+
+    key = str(config_path.resolve())
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+
+    node = ConfigNode(_parse_config(config_path, key))
+    _CONFIG_CACHE[key] = (st.st_mtime_ns, st.st_size, node)
+    return node
+
+
+def clear_config_cache() -> None:
+    """Drop the in-memory config cache so the next load re-reads the file."""
+    _CONFIG_CACHE.clear()
+
+
+def _parse_config(config_path: Path, key: str) -> Any:
+    """Return the parsed YAML for *config_path*, via the on-disk cache."""
+    source = config_path.read_bytes()
+    digest = hashlib.blake2b(source, digest_size=16).digest()
+    name = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    cache_file = cache_dir("config") / f"{name}.pkl"
+
+    entry = load_pickle(cache_file)
+    if isinstance(entry, tuple) and len(entry) == 2 and entry[0] == digest:
+        return entry[1]
+
+    data = yaml.load(source, Loader=_YamlLoader)
+    store_pickle(cache_file, (digest, data))
+    return data
@@ -8,10 +8,19 @@ from __future__ import annotations
 
 from pathlib import Path
 
+# File contents keyed by resolved path, stamped with (mtime_ns, size).
+_FILE_CACHE: dict[str, tuple[int, int, str]] = {}
+
+# Rendered sections keyed by the requested paths, with each file's stamp.
+_SECTION_CACHE: dict[tuple[str, ...], tuple[tuple[tuple[int, int], ...], str]] = {}
+
 
 def load_context_files(file_paths: list[str]) -> list[dict[str, str]]:
     """Read the given files and return a list of {name, content} dicts.
 
+    File contents are cached and only re-read once a file's modification
+    time or size changes.
+
     Parameters
     ----------
     file_paths:
@@ -26,12 +35,19 @@ def load_context_files(file_paths: list[str]) -> list[dict[str, str]]:
     results: list[dict[str, str]] = []
     for fp in file_paths:
         path = Path(fp)
-        if not path.exists():
-            results.append({"name": fp, "content": f"[Error: file not found: {fp}]"})
-            continue
         try:
-            text = path.read_text(encoding="utf-8")
+            st = path.stat()
+            key = str(path.resolve())
+            cached = _FILE_CACHE.get(key)
+            if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                text = cached[2]
+            else:
+                # One unbuffered read; avoids the text-IO wrapper read_text() builds.
+                text = path.read_bytes().decode("utf-8")
+                _FILE_CACHE[key] = (st.st_mtime_ns, st.st_size, text)
             results.append({"name": path.name, "content": text})
+        except FileNotFoundError:
+            results.append({"name": fp, "content": f"[Error: file not found: {fp}]"})
         except (OSError, UnicodeDecodeError) as exc:
             results.append({"name": fp, "content": f"[Error reading file: {exc}]"})
     return results
@@ -40,17 +56,42 @@ def load_context_files(file_paths: list[str]) -> list[dict[str, str]]:
 def context_prompt_section(file_paths: list[str]) -> str:
     """Build a prompt section containing context file contents.
 
-    Returns an empty string if *file_paths* is empty.
+    Returns an empty string if *file_paths* is empty.  The rendered section
+    is reused while none of the files has changed.
     """
     if not file_paths:
         return ""
 
+    key = tuple(file_paths)
+    stamps = _stamp_files(file_paths)
+    cached = _SECTION_CACHE.get(key)
+    if stamps is not None and cached is not None and cached[0] == stamps:
+        return cached[1]
+
     loaded = load_context_files(file_paths)
     if not loaded:
         return ""
 
-    parts: list[str] = ["\n\n--- Reference Documents ---"]
-    for doc in loaded:
-        parts.append(f"\n### {doc['name']}\n{doc['content']}")
-    parts.append("\n--- End Reference Documents ---\n")
-    return "\n".join(parts)
+    # Join the original strings directly: no per-document intermediate
+    # string, and file contents are copied exactly once.
+    parts: list[str] = ["\n\n--- Reference Documents ---\n"]
+    for i, doc in enumerate(loaded):
+        parts += ("\n\n### " if i else "\n### ", doc["name"], "\n", doc["content"])
+    parts.append("\n\n--- End Reference Documents ---\n")
+    section = "".join(parts)
+    # Not cached while a file is missing, so it is picked up once created.
+    if stamps is not None:
+        _SECTION_CACHE[key] = (stamps, section)
+    return section
+
+
+def _stamp_files(file_paths: list[str]) -> tuple[tuple[int, int], ...] | None:
+    """Return ``(mtime_ns, size)`` per file, or ``None`` if any is unreadable."""
+    stamps: list[tuple[int, int]] = []
+    for fp in file_paths:
+        try:
+            st = Path(fp).stat()
+        except OSError:
+            return None
+        stamps.append((st.st_mtime_ns, st.st_size))
+    return tuple(stamps)
@@ -7,18 +7,42 @@ chaining with ``&&`` (R-11).
 
 from __future__ import annotations
 
-import re
+import functools
 import shlex
 import subprocess
-from dataclasses import dataclass
+from typing import NamedTuple
 
 # Shell metacharacters that could enable injection when using shell=True.
 # Commands containing these are rejected before execution.
-_DANGEROUS_PATTERN = re.compile(r"[;|`]|\$\(")
+_DANGEROUS_CHARS = frozenset(";|`")
+_DANGEROUS_SUBSTRING = "$("
 
 
-@dataclass(frozen=True)
-class ExecutionResult:
+def _has_dangerous_syntax(command: str) -> bool:
+    """Return ``True`` if *command* contains a disallowed metacharacter."""
+    # C-level set and substring scans; roughly twice as fast as a regex.
+    return not _DANGEROUS_CHARS.isdisjoint(command) or _DANGEROUS_SUBSTRING in command
+
+
+@functools.lru_cache(maxsize=256)
+def _split_command(command: str) -> tuple[str, ...]:
+    """Lex *command* into argv; cached since agents repeat command templates."""
+    return tuple(shlex.split(command))
+
+
+def _decode_output(data: bytes) -> str:
+    """Decode captured output as UTF-8 with universal newlines.
+
+    Mirrors what ``text=True`` would return, without building a text-IO
+    wrapper per stream; undecodable bytes are replaced rather than raising.
+    """
+    text = data.decode("utf-8", errors="replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+class ExecutionResult(NamedTuple):
     """Structured result of a subprocess execution."""
 
     success: bool
@@ -52,7 +76,7 @@ def execute_command(
         and the original command string.
     """
     # Reject commands containing shell metacharacters to prevent injection
-    if _DANGEROUS_PATTERN.search(command):
+    if _has_dangerous_syntax(command):
         return ExecutionResult(
             success=False,
             stdout="",
@@ -65,7 +89,7 @@ def execute_command(
         )
 
     try:
-        argv = shlex.split(command)
+        argv = list(_split_command(command))
     except ValueError as exc:
         return ExecutionResult(
             success=False,
@@ -80,14 +104,13 @@ def execute_command(
             argv,
             shell=False,
             capture_output=True,
-            text=True,
             timeout=timeout,
             cwd=cwd,
         )
         return ExecutionResult(
             success=result.returncode == 0,
-            stdout=result.stdout,
-            stderr=result.stderr,
+            stdout=_decode_output(result.stdout),
+            stderr=_decode_output(result.stderr),
             return_code=result.returncode,
             command=command,
         )
@@ -6,7 +6,7 @@ Supports a configurable max_turns cap to prevent context overflow.
 
 from __future__ import annotations
 
-from typing import Any
+from collections import deque
 
 
 class ConversationHistory:
@@ -22,41 +22,66 @@ class ConversationHistory:
     """
 
     def __init__(self, max_turns: int = 20) -> None:
-        self._messages: list[dict[str, str]] = []
+        # With a cap, system messages are kept apart (always first) and the
+        # rest live in a bounded deque that evicts the oldest in O(1).
+        # Without a cap, everything stays in arrival order in ``_dialogue``.
+        self._system: list[dict[str, str]] = []
+        self._dialogue: deque[dict[str, str]] = deque()
         self.max_turns = max_turns
 
+    @property
+    def max_turns(self) -> int | None:
+        """The turn cap; changing it re-applies the limit immediately."""
+        return self._max_turns
+
+    @max_turns.setter
+    def max_turns(self, value: int | None) -> None:
+        messages = self._system + list(self._dialogue)
+        self._max_turns = value
+        self._system = []
+        self._dialogue = deque(maxlen=value * 2 if value else None)
+        for message in messages:
+            self._append(message)
+
     @property
     def messages(self) -> list[dict[str, str]]:
         """Return the current message list (read-only copy)."""
-        return list(self._messages)
+        return self._system + list(self._dialogue)
 
     def add(self, role: str, content: str) -> None:
         """Append a message and enforce the turn cap."""
-        self._messages.append({"role": role, "content": content})
-        self._enforce_limit()
+        self._append({"role": role, "content": content})
+
+    def pop(self) -> dict[str, str]:
+        """Remove and return the most recent non-system message.
+
+        Raises
+        ------
+        IndexError
+            If there is no such message.
+        """
+        for index in range(len(self._dialogue) - 1, -1, -1):
+            if self._dialogue[index]["role"] != "system":
+                message = self._dialogue[index]
+                del self._dialogue[index]
+                return message
+        raise IndexError("pop from empty conversation history")
 
     def get_messages_for_llm(self) -> list[dict[str, str]]:
         """Return messages formatted for LLM consumption."""
-        return list(self._messages)
+        return self._system + list(self._dialogue)
 
     def clear(self) -> None:
         """Reset the conversation history."""
-        self._messages.clear()
+        self._system.clear()
+        self._dialogue.clear()
 
     def __len__(self) -> int:
-        return len(self._messages)
-
-    def _enforce_limit(self) -> None:
-        """Trim oldest non-system messages when we exceed max_turns."""
-        if not self.max_turns:
-            return
-
-        # Separate system messages from the rest
-        system_msgs = [m for m in self._messages if m["role"] == "system"]
-        non_system = [m for m in self._messages if m["role"] != "system"]
-
-        max_non_system = self.max_turns * 2  # each turn = user + assistant
-        if len(non_system) > max_non_system:
-            non_system = non_system[-max_non_system:]
-
-        self._messages = system_msgs + non_system
+        return len(self._system) + len(self._dialogue)
+
+    def _append(self, message: dict[str, str]) -> None:
+        """Store *message*; the deque trims the oldest non-system message."""
+        if self._max_turns and message["role"] == "system":
+            self._system.append(message)
+        else:
+            self._dialogue.append(message)
@@ -7,7 +7,9 @@ Provider and model are selected via ``assistant_config.yml``.
 from __future__ import annotations
 
 import abc
-from typing import Any
+import importlib.util
+from types import ModuleType
+from typing import Any, Iterator
 
 from voice_agent.config import ConfigNode
 
@@ -15,6 +17,10 @@ from voice_agent.config import ConfigNode
 class LLMBackend(abc.ABC):
     """Base class for all LLM providers."""
 
+    #: Whether :meth:`chat_stream` yields incrementally from the provider.
+    #: Backends that leave this ``False`` fall back to a single ``chat`` call.
+    supports_streaming: bool = False
+
     def __init__(self, model: str, **kwargs: Any) -> None:
         self.model = model
 
@@ -22,6 +28,15 @@ class LLMBackend(abc.ABC):
     def chat(self, messages: list[dict[str, str]]) -> str:
         """Send a conversation and return the assistant's reply as a string."""
 
+    def chat_stream(self, messages: list[dict[str, str]]) -> Iterator[str]:
+        """Yield the assistant's reply as text fragments.
+
+        Closing the returned generator early aborts generation on backends
+        that support streaming.  The default implementation yields the
+        complete ``chat`` reply as a single fragment.
+        """
+        yield self.chat(messages)
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(model={self.model!r})"
 
@@ -29,20 +44,44 @@ class LLMBackend(abc.ABC):
 class OllamaLLM(LLMBackend):
     """Ollama local LLM provider (default)."""
 
+    supports_streaming = True
+
     def __init__(self, model: str = "gemma3:4b", **kwargs: Any) -> None:
         super().__init__(model, **kwargs)
         self._options = kwargs.get("options", {})
+        self._ollama: Any = None
 
-    def chat(self, messages: list[dict[str, str]]) -> str:
-        import ollama
+    def _get_ollama(self) -> Any:
+        """Import the ``ollama`` module on first use and keep a reference."""
+        if self._ollama is None:
+            import ollama
 
-        response = ollama.chat(
+            self._ollama = ollama
+        return self._ollama
+
+    def chat(self, messages: list[dict[str, str]]) -> str:
+        response = self._get_ollama().chat(
             model=self.model,
             messages=messages,
             options=self._options,
         )
         return response["message"]["content"]
 
+    def chat_stream(self, messages: list[dict[str, str]]) -> Iterator[str]:
+        stream = self._get_ollama().chat(
+            model=self.model,
+            messages=messages,
+            options=self._options,
+            stream=True,
+        )
+        try:
+            for part in stream:
+                content = part["message"]["content"]
+                if content:
+                    yield content
+        finally:
+            _close_stream(stream)
+
 
 class DeepSeekLLM(LLMBackend):
     """DeepSeek API provider.
@@ -52,15 +91,23 @@ class DeepSeekLLM(LLMBackend):
     """
 
     BASE_URL = "https://api.deepseek.com"
+    supports_streaming = True
 
     def __init__(self, model: str = "deepseek-chat", **kwargs: Any) -> None:
         super().__init__(model, **kwargs)
         self._api_key: str | None = kwargs.get("api_key")
+        self._client: Any = None
 
     def _get_client(self) -> Any:
+        """Create the API client on first use and reuse it afterwards."""
+        if self._client is None:
+            self._client = self._create_client()
+        return self._client
+
+    def _create_client(self) -> Any:
         import os
 
-        from openai import OpenAI
+        import openai
 
         api_key = self._api_key or os.environ.get("DEEPSEEK_API_KEY")
         if not api_key:
@@ -68,7 +115,11 @@ class DeepSeekLLM(LLMBackend):
                 "DeepSeek API key not found. Set the DEEPSEEK_API_KEY environment "
                 "variable or pass api_key in the config."
             )
-        return OpenAI(api_key=api_key, base_url=self.BASE_URL)
+        return openai.OpenAI(
+            api_key=api_key,
+            base_url=self.BASE_URL,
+            **_pooled_http_client(openai),
+        )
 
     def chat(self, messages: list[dict[str, str]]) -> str:
         client = self._get_client()
@@ -78,6 +129,23 @@ class DeepSeekLLM(LLMBackend):
         )
         return response.choices[0].message.content
 
+    def chat_stream(self, messages: list[dict[str, str]]) -> Iterator[str]:
+        client = self._get_client()
+        stream = client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            stream=True,
+        )
+        try:
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                content = chunk.choices[0].delta.content
+                if content:
+                    yield content
+        finally:
+            _close_stream(stream)
+
 
 class AnthropicLLM(LLMBackend):
     """Anthropic Claude API provider.
@@ -86,12 +154,21 @@ class AnthropicLLM(LLMBackend):
     kwarg.
     """
 
+    supports_streaming = True
+
     def __init__(self, model: str = "claude-sonnet-4-20250514", **kwargs: Any) -> None:
         super().__init__(model, **kwargs)
         self._api_key: str | None = kwargs.get("api_key")
         self._max_tokens: int = kwargs.get("max_tokens", 1024)
+        self._client: Any = None
 
     def _get_client(self) -> Any:
+        """Create the API client on first use and reuse it afterwards."""
+        if self._client is None:
+            self._client = self._create_client()
+        return self._client
+
+    def _create_client(self) -> Any:
         import os
 
         import anthropic
@@ -102,11 +179,13 @@ class AnthropicLLM(LLMBackend):
                 "Anthropic API key not found. Set the ANTHROPIC_API_KEY environment "
                 "variable or pass api_key in the config."
             )
-        return anthropic.Anthropic(api_key=api_key)
-
-    def chat(self, messages: list[dict[str, str]]) -> str:
-        client = self._get_client()
+        return anthropic.Anthropic(
+            api_key=api_key,
+            **_pooled_http_client(anthropic),
+        )
 
+    def _build_request(self, messages: list[dict[str, str]]) -> dict[str, Any]:
+        """Return ``messages.create`` kwargs with the system prompt split out."""
         # Anthropic API separates the system prompt from conversation messages.
         system_text = ""
         conversation: list[dict[str, str]] = []
@@ -123,10 +202,53 @@ class AnthropicLLM(LLMBackend):
         }
         if system_text.strip():
             kwargs["system"] = system_text.strip()
+        return kwargs
 
-        response = client.messages.create(**kwargs)
+    def chat(self, messages: list[dict[str, str]]) -> str:
+        client = self._get_client()
+        response = client.messages.create(**self._build_request(messages))
         return response.content[0].text
 
+    def chat_stream(self, messages: list[dict[str, str]]) -> Iterator[str]:
+        client = self._get_client()
+        with client.messages.stream(**self._build_request(messages)) as stream:
+            yield from stream.text_stream
+
+
+# Idle connections are kept this long (seconds) so the next turn, usually
+# after the user has finished speaking, skips TCP and TLS setup.
+_HTTP_KEEPALIVE_EXPIRY = 60.0
+_HTTP_MAX_KEEPALIVE = 4
+
+
+def _pooled_http_client(sdk: ModuleType) -> dict[str, Any]:
+    """Return ``http_client`` kwargs for an SDK client with a long-lived pool.
+
+    The client is built with *sdk*'s ``DefaultHttpxClient``, which keeps the
+    SDK's own timeout and redirect defaults; SDK releases that predate it
+    get a plain ``httpx.Client``.  HTTP/2 is enabled when ``h2`` is
+    installed.  Returns no kwargs if ``httpx`` is unavailable, leaving the
+    SDK to build its default client.
+    """
+    try:
+        import httpx
+    except ImportError:
+        return {}
+    factory = getattr(sdk, "DefaultHttpxClient", httpx.Client)
+    limits = httpx.Limits(
+        max_keepalive_connections=_HTTP_MAX_KEEPALIVE,
+        keepalive_expiry=_HTTP_KEEPALIVE_EXPIRY,
+    )
+    http2 = importlib.util.find_spec("h2") is not None
+    return {"http_client": factory(limits=limits, http2=http2)}
+
+
+def _close_stream(stream: Any) -> None:
+    """Close a provider response stream if it exposes ``close()``."""
+    close = getattr(stream, "close", None)
+    if callable(close):
+        close()
+
 
 # ---------------------------------------------------------------------------
 # Provider registry & factory
@@ -138,6 +260,9 @@ _PROVIDERS: dict[str, type[LLMBackend]] = {
     "anthropic": AnthropicLLM,
 }
 
+# Config keys consumed by the factory itself rather than forwarded to providers.
+_RESERVED_LLM_KEYS = frozenset({"provider", "model"})
+
 
 def get_llm_backend(config: ConfigNode) -> LLMBackend:
     """Instantiate the LLM backend specified in the config.
@@ -155,12 +280,12 @@ def get_llm_backend(config: ConfigNode) -> LLMBackend:
             f"Available: {', '.join(sorted(_PROVIDERS))}"
         )
 
-    kwargs: dict[str, Any] = {}
     # Forward any extra llm config keys (e.g. api_key, max_tokens, options)
-    llm_data = config.llm.to_dict()
-    for key, value in llm_data.items():
-        if key not in ("provider", "model"):
-            kwargs[key] = value
+    kwargs: dict[str, Any] = {
+        key: value
+        for key, value in config.llm.to_dict().items()
+        if key not in _RESERVED_LLM_KEYS
+    }
 
     if model:
         return cls(model=model, **kwargs)
@@ -8,14 +8,26 @@ via ``config.mode`` in ``assistant_config.yml``.
 from __future__ import annotations
 
 import abc
-from typing import Any
+import os
+import re
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Hashable, Iterator
 
 from voice_agent.config import ConfigNode
 from voice_agent.context import context_prompt_section
 from voice_agent.history import ConversationHistory
 from voice_agent.llm import LLMBackend, get_llm_backend
-from voice_agent.prompt_loader import render_template
-from voice_agent.scratchpad import scratchpad_prompt_section
+from voice_agent.prompt_loader import DEFAULT_PROMPTS_DIR, render_template
+from voice_agent.scratchpad import DEFAULT_SCRATCHPAD_PATH, scratchpad_prompt_section
+
+# End of a sentence: terminal punctuation followed by whitespace.
+_SENTENCE_END_RE = re.compile(r"[.!?]\s")
+
+# Rendered system prompts keyed by mode inputs plus the stamps of every file
+# the prompt is built from, so rebuilding an unchanged prompt is a few stats.
+_PROMPT_CACHE: OrderedDict[tuple[Hashable, ...], str] = OrderedDict()
+_PROMPT_CACHE_SIZE = 16
 
 
 class ModeHandler(abc.ABC):
@@ -44,17 +56,69 @@ class ModeHandler(abc.ABC):
         self.config = config
         self.llm = llm or get_llm_backend(config)
         self.context_files = context_files or []
+        # Resolve the settings the prompt builders read once, up front.
+        assistant = config.get("assistant")
+        assistant = assistant if isinstance(assistant, dict) else {}
+        self._assistant_name: str = assistant.get("name", "")
+        self._persona: str = assistant.get("persona", "")
+        sp_conf = config.get("scratchpad")
+        self._scratchpad_file: str | None = (
+            sp_conf.get("file") if isinstance(sp_conf, dict) else None
+        )
         conv = config.get("conversation")
         max_turns = conv.get("max_turns", 20) if isinstance(conv, dict) else 20
         self.history = ConversationHistory(max_turns=max_turns)
         # Build and inject the mode-specific system prompt
-        system_prompt = self.build_system_prompt()
-        self.history.add("system", system_prompt)
+        self.history.add("system", self.system_prompt())
 
     @abc.abstractmethod
     def build_system_prompt(self) -> str:
         """Return the fully-rendered system prompt for this mode."""
 
+    def prompt_cache_key(self) -> tuple[Hashable, ...] | None:
+        """Return the non-file inputs of :meth:`build_system_prompt`.
+
+        Modes that return a key have their rendered prompt cached until the
+        key or one of :meth:`prompt_source_files` changes.  The default,
+        ``None``, rebuilds the prompt every time.
+        """
+        return None
+
+    def prompt_source_files(self) -> list[Path]:
+        """Return the files :meth:`build_system_prompt` reads."""
+        return [Path(p) for p in self.context_files]
+
+    def system_prompt(self) -> str:
+        """Return the system prompt, reusing a cached render when unchanged."""
+        inputs = self.prompt_cache_key()
+        if inputs is None:
+            return self.build_system_prompt()
+
+        key = (type(self), inputs, *map(_file_stamp, self.prompt_source_files()))
+        prompt = _PROMPT_CACHE.get(key)
+        if prompt is None:
+            prompt = self.build_system_prompt()
+            _PROMPT_CACHE[key] = prompt
+            while len(_PROMPT_CACHE) > _PROMPT_CACHE_SIZE:
+                _PROMPT_CACHE.popitem(last=False)
+        else:
+            _PROMPT_CACHE.move_to_end(key)
+        return prompt
+
+    def reset(self) -> None:
+        """Start a fresh conversation, keeping only the system prompt."""
+        self.history.clear()
+        self.history.add("system", self.system_prompt())
+
+    def _template_prompt_sources(self, template: str) -> list[Path]:
+        """Return the scratchpad, *template* and context files, in that order."""
+        scratchpad = self._scratchpad_file
+        return [
+            Path(scratchpad) if scratchpad else DEFAULT_SCRATCHPAD_PATH,
+            DEFAULT_PROMPTS_DIR / f"{template}.xml",
+            *(Path(p) for p in self.context_files),
+        ]
+
     def handle_turn(self, user_input: str) -> str:
         """Process one conversational turn.
 
@@ -66,6 +130,38 @@ class ModeHandler(abc.ABC):
         self.history.add("assistant", response)
         return response
 
+    def handle_turn_stream(self, user_input: str) -> Iterator[str]:
+        """Process one turn, yielding the reply sentence by sentence.
+
+        Tokens are streamed from the LLM and each complete sentence is
+        yielded as soon as it arrives, so speech synthesis can start before
+        generation finishes.  The full reply is recorded in history once the
+        stream ends; if the caller stops early, only the text generated so
+        far is recorded.  If nothing was generated (e.g. the request failed
+        before the first token), the user turn is removed again so the
+        history never holds an empty or unanswered turn.
+        """
+        self.history.add("user", user_input)
+        parts: list[str] = []
+        pending = ""
+        try:
+            for fragment in self.llm.chat_stream(self.history.get_messages_for_llm()):
+                parts.append(fragment)
+                pending += fragment
+                while (match := _SENTENCE_END_RE.search(pending)) is not None:
+                    sentence = pending[: match.start() + 1].strip()
+                    pending = pending[match.end():]
+                    if sentence:
+                        yield sentence
+            if pending.strip():
+                yield pending.strip()
+        finally:
+            reply = "".join(parts)
+            if reply:
+                self.history.add("assistant", reply)
+            else:
+                self.history.pop()
+
     @property
     def mode_name(self) -> str:
         """Return a human-readable mode identifier."""
@@ -82,24 +178,28 @@ class ChatMode(ModeHandler):
     behaviour with history, scratchpad memory, and context file injection.
     """
 
+    def prompt_cache_key(self) -> tuple[Hashable, ...]:
+        return (self._assistant_name, self._persona)
+
+    def prompt_source_files(self) -> list[Path]:
+        return self._template_prompt_sources("system_prompt")
+
     def build_system_prompt(self) -> str:
-        sp_conf = self.config.get("scratchpad")
-        sp_file = sp_conf.get("file") if isinstance(sp_conf, dict) else None
-        scratchpad = scratchpad_prompt_section(sp_file)
+        scratchpad = scratchpad_prompt_section(self._scratchpad_file)
         context = context_prompt_section(self.context_files)
 
         try:
             return render_template(
                 "system_prompt",
                 variables={
-                    "assistant_name": self.config.assistant.name,
-                    "persona": self.config.assistant.persona,
+                    "assistant_name": self._assistant_name,
+                    "persona": self._persona,
                     "scratchpad": scratchpad,
                     "context": context,
                 },
             )
         except FileNotFoundError:
-            return self.config.assistant.persona + scratchpad + context
+            return self._persona + scratchpad + context
 
     @property
     def mode_name(self) -> str:
@@ -129,17 +229,21 @@ class AgentMode(ModeHandler):
         self.commands = commands
         super().__init__(config, llm=llm, context_files=context_files)
 
+    def prompt_cache_key(self) -> tuple[Hashable, ...]:
+        return (self._assistant_name, self.commands)
+
+    def prompt_source_files(self) -> list[Path]:
+        return self._template_prompt_sources("agent_command_prompt")
+
     def build_system_prompt(self) -> str:
-        sp_conf = self.config.get("scratchpad")
-        sp_file = sp_conf.get("file") if isinstance(sp_conf, dict) else None
-        scratchpad = scratchpad_prompt_section(sp_file)
+        scratchpad = scratchpad_prompt_section(self._scratchpad_file)
         context = context_prompt_section(self.context_files)
 
         try:
             return render_template(
                 "agent_command_prompt",
                 variables={
-                    "assistant_name": self.config.assistant.name,
+                    "assistant_name": self._assistant_name,
                     "commands": self.commands,
                     "scratchpad": scratchpad,
                     "context": context,
@@ -147,7 +251,7 @@ class AgentMode(ModeHandler):
             )
         except FileNotFoundError:
             return (
-                f"You are {self.config.assistant.name} in command mode.\n"
+                f"You are {self._assistant_name} in command mode.\n"
                 f"Available commands: {self.commands}\n"
                 + scratchpad
                 + context
@@ -158,6 +262,16 @@ class AgentMode(ModeHandler):
         return "agent"
 
 
+def _file_stamp(path: Path) -> tuple[Hashable, ...]:
+    """Return a change stamp for *path*; a missing file has its own stamp."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return (str(path), None)
+    # The inode catches atomic replacements within one mtime tick.
+    return (str(path), st.st_ino, st.st_mtime_ns, st.st_size)
+
+
 # ---------------------------------------------------------------------------
 # Mode registry & factory
 # ---------------------------------------------------------------------------
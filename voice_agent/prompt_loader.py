@@ -6,13 +6,28 @@ variables such as assistant name, commands, scratchpad, context, and user input.
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import io
 import re
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Any
 
+from voice_agent.cache import cache_dir, load_pickle, store_pickle
+
 DEFAULT_PROMPTS_DIR = Path(__file__).resolve().parent.parent / "prompts"
 
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+_MULTI_NL_RE = re.compile(r"\n{3,}")
+
+
+class _BlankMissing(dict):
+    """Format mapping that renders unknown placeholders as empty strings."""
+
+    def __missing__(self, key: str) -> str:
+        return ""
+
 
 def load_template(name: str, prompts_dir: Path | str | None = None) -> dict[str, str]:
     """Load a single XML prompt template by name.
@@ -37,17 +52,16 @@ def load_template(name: str, prompts_dir: Path | str | None = None) -> dict[str,
     """
     directory = Path(prompts_dir) if prompts_dir else DEFAULT_PROMPTS_DIR
     template_path = directory / f"{name}.xml"
-    if not template_path.exists():
-        raise FileNotFoundError(f"Prompt template not found: {template_path}")
-
-    tree = ET.parse(template_path)
-    root = tree.getroot()
+    try:
+        st = template_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Prompt template not found: {template_path}") from None
 
-    return {
-        "name": root.attrib.get("name", name),
-        "role": _get_text(root, "role", "system"),
-        "template": _get_text(root, "template", ""),
-    }
+    # Keyed on mtime and size so edited templates are re-parsed.
+    tmpl_name, role, template = _parse_template(
+        str(template_path), name, st.st_mtime_ns, st.st_size
+    )
+    return {"name": tmpl_name, "role": role, "template": template}
 
 
 def render_template(
@@ -63,7 +77,8 @@ def render_template(
         Template name (without ``.xml`` extension).
     variables:
         Mapping of placeholder names to their values.  Missing variables
-        are replaced with empty strings.
+        are replaced with empty strings.  Templates use ``str.format``
+        syntax, so literal braces are written ``{{`` and ``}}``.
     prompts_dir:
         Directory containing XML templates.
 
@@ -76,13 +91,17 @@ def render_template(
     tmpl = load_template(name, prompts_dir)
     raw = tmpl["template"]
     vars_ = variables or {}
-    # Replace {key} placeholders; missing keys become empty strings
-    for key, value in vars_.items():
-        raw = raw.replace(f"{{{key}}}", str(value))
-    # Clean up any remaining unreplaced placeholders
-    raw = re.sub(r"\{(\w+)\}", "", raw)
+    # Replace {key} placeholders in one C-level pass; missing keys become
+    # empty strings.
+    try:
+        raw = raw.format_map(_BlankMissing(vars_))
+    except (ValueError, IndexError, AttributeError):
+        # Not valid format syntax (e.g. a stray brace): substitute plain
+        # {key} placeholders only and leave everything else untouched.
+        raw = _PLACEHOLDER_RE.sub(lambda m: str(vars_.get(m.group(1), "")), raw)
     # Collapse runs of 3+ newlines into 2
-    raw = re.sub(r"\n{3,}", "\n\n", raw)
+    if "\n\n\n" in raw:
+        raw = _MULTI_NL_RE.sub("\n\n", raw)
     return raw.strip()
 
 
@@ -100,9 +119,62 @@ def list_templates(prompts_dir: Path | str | None = None) -> list[str]:
     return sorted(p.stem for p in directory.glob("*.xml"))
 
 
-def _get_text(root: ET.Element, tag: str, default: str) -> str:
-    """Extract text from a child element, or return *default*."""
-    elem = root.find(tag)
-    if elem is None or elem.text is None:
-        return default
-    return elem.text
+# Direct children of the root element that a template file defines.
+_TEMPLATE_FIELDS = frozenset({"role", "template"})
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_template(
+    path: str, name: str, mtime_ns: int, size: int
+) -> tuple[str, str, str]:
+    """Parse a template file into an immutable ``(name, role, template)``.
+
+    The result is also kept in an on-disk cache and reused on later runs
+    while the file's content hash is unchanged.
+    """
+    source = Path(path).read_bytes()
+    digest = hashlib.blake2b(source, digest_size=16).digest()
+    key = hashlib.blake2b(path.encode("utf-8"), digest_size=16).hexdigest()
+    cache_file = cache_dir("prompts") / f"{key}.pkl"
+
+    entry = load_pickle(cache_file)
+    if isinstance(entry, tuple) and len(entry) == 2 and entry[0] == digest:
+        return entry[1]
+
+    result = _read_template_fields(source, name)
+    store_pickle(cache_file, (digest, result))
+    return result
+
+
+def _read_template_fields(source: bytes, name: str) -> tuple[str, str, str]:
+    """Extract ``(name, role, template)`` from template XML *source*.
+
+    Streams the XML with ``iterparse`` and stops as soon as the first
+    ``<role>`` and ``<template>`` children of the root have been read, so
+    no full element tree is built.
+    """
+    tmpl_name = name
+    fields: dict[str, str | None] = {}
+    depth = 0
+    events = ET.iterparse(io.BytesIO(source), events=("start", "end"))
+    try:
+        for event, elem in events:
+            if event == "start":
+                if depth == 0:
+                    tmpl_name = elem.attrib.get("name", name)
+                depth += 1
+                continue
+            depth -= 1
+            if depth == 1 and elem.tag in _TEMPLATE_FIELDS and elem.tag not in fields:
+                fields[elem.tag] = elem.text
+                if len(fields) == len(_TEMPLATE_FIELDS):
+                    break
+            if depth:
+                elem.clear()
+    finally:
+        events.close()
+    return (
+        tmpl_name,
+        fields.get("role") or "system",
+        fields.get("template") or "",
+    )
@@ -9,10 +9,19 @@ When disabled, behaviour is identical to the existing pipeline.
 
 from __future__ import annotations
 
+import hashlib
+from collections import OrderedDict
+
 from voice_agent.config import ConfigNode
 from voice_agent.llm import LLMBackend
 from voice_agent.prompt_loader import render_template
 
+# Refinements of short responses, keyed by backend, model and prompt hash.
+# Short CLI outputs ("done", "no files found") recur constantly.
+_REFINED_CACHE: OrderedDict[tuple[str, str, bytes], str] = OrderedDict()
+_REFINED_CACHE_SIZE = 512
+_MAX_CACHED_RESPONSE_CHARS = 4096
+
 
 def is_refinement_enabled(config: ConfigNode) -> bool:
     """Check whether the refinement pipeline is enabled in the config.
@@ -55,6 +64,11 @@ def refine_response(
     str
         The refined response text, or the original *response* if refinement
         is disabled or the input is empty.
+
+    Notes
+    -----
+    Refinements of responses shorter than 4096 characters are memoised per
+    backend and model, so a repeated response skips the LLM round-trip.
     """
     if config is not None and not is_refinement_enabled(config):
         return response
@@ -77,9 +91,23 @@ def refine_response(
             f"Source response:\n{response}"
         )
 
+    key: tuple[str, str, bytes] | None = None
+    if len(response) < _MAX_CACHED_RESPONSE_CHARS:
+        digest = hashlib.blake2b(prompt_text.encode("utf-8"), digest_size=16).digest()
+        key = (type(llm).__name__, str(llm.model), digest)
+        cached = _REFINED_CACHE.get(key)
+        if cached is not None:
+            _REFINED_CACHE.move_to_end(key)
+            return cached
+
     messages = [
         {"role": "system", "content": prompt_text},
         {"role": "user", "content": "Refine the source response above for audio delivery."},
     ]
 
-    return llm.chat(messages)
+    refined = llm.chat(messages)
+    if key is not None:
+        _REFINED_CACHE[key] = refined
+        while len(_REFINED_CACHE) > _REFINED_CACHE_SIZE:
+            _REFINED_CACHE.popitem(last=False)
+    return refined
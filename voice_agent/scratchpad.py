@@ -6,45 +6,113 @@ The LLM prompt is augmented with scratchpad contents when non-empty.
 
 from __future__ import annotations
 
+import os
+import stat
+import tempfile
 from pathlib import Path
 
 DEFAULT_SCRATCHPAD_PATH = Path(__file__).resolve().parent.parent / "scratchpad.md"
+_DEFAULT_PATH_STR = str(DEFAULT_SCRATCHPAD_PATH)
+
+# Scratchpad text and its formatted prompt section (built on first use),
+# keyed by path and stamped with (inode, mtime_ns, size).  The inode catches
+# atomic rewrites that land within the same mtime tick.
+_SP_CACHE: dict[str, tuple[int, int, int, str, str | None]] = {}
+
+
+def _resolve(path: Path | str | None) -> str:
+    """Return *path* as a plain string, or the default scratchpad path.
+
+    The module works on ``str`` paths with ``os`` functions: this runs on
+    every LLM turn and avoids constructing a ``Path`` each time.
+    """
+    return os.fspath(path) if path else _DEFAULT_PATH_STR
 
 
 def read_scratchpad(path: Path | str | None = None) -> str:
     """Read the scratchpad file and return its contents.
 
-    Returns an empty string if the file does not exist.
+    Returns an empty string if the file does not exist.  Contents are
+    cached and only re-read once the file changes.
     """
-    sp_path = Path(path) if path else DEFAULT_SCRATCHPAD_PATH
-    if not sp_path.exists():
-        return ""
-    return sp_path.read_text(encoding="utf-8")
+    entry = _load_entry(_resolve(path))
+    return entry[3] if entry is not None else ""
 
 
 def write_scratchpad(content: str, path: Path | str | None = None) -> None:
-    """Write content to the scratchpad file (overwrite)."""
-    sp_path = Path(path) if path else DEFAULT_SCRATCHPAD_PATH
-    sp_path.write_text(content, encoding="utf-8")
+    """Write content to the scratchpad file (overwrite).
+
+    The content is written to a temporary file in the same directory and
+    then renamed over the scratchpad, so a crash mid-write never leaves a
+    truncated file behind.  A symlinked scratchpad is written through to its
+    target, and an existing file keeps its permission bits.
+    """
+    sp_path = _resolve(path)
+    _SP_CACHE.pop(sp_path, None)
+    target = os.path.realpath(sp_path)
+    directory, name = os.path.split(target)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=directory)
+    try:
+        try:
+            # mkstemp creates the file 0600; keep the scratchpad's own mode.
+            os.chmod(fd, stat.S_IMODE(os.stat(target).st_mode))
+        except FileNotFoundError:
+            pass
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp_name, target)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
 
 
 def append_scratchpad(content: str, path: Path | str | None = None) -> None:
-    """Append content to the scratchpad file."""
-    existing = read_scratchpad(path)
-    separator = "\n" if existing and not existing.endswith("\n") else ""
-    write_scratchpad(existing + separator + content, path)
+    """Append content to the scratchpad file.
+
+    Only the new content is written; the existing file is never re-read or
+    rewritten, apart from peeking at its last byte to decide whether a
+    separating newline is needed.
+    """
+    sp_path = _resolve(path)
+    _SP_CACHE.pop(sp_path, None)
+    data = content.encode("utf-8")
+    with open(sp_path, "ab+") as f:
+        if f.seek(0, os.SEEK_END):
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                data = b"\n" + data
+        f.write(data)
 
 
 def clear_scratchpad(path: Path | str | None = None) -> None:
     """Remove the scratchpad file if it exists."""
-    sp_path = Path(path) if path else DEFAULT_SCRATCHPAD_PATH
-    if sp_path.exists():
-        sp_path.unlink()
+    sp_path = _resolve(path)
+    _SP_CACHE.pop(sp_path, None)
+    try:
+        os.unlink(sp_path)
+    except FileNotFoundError:
+        pass
 
 
 def scratchpad_prompt_section(path: Path | str | None = None) -> str:
     """Return a prompt section with scratchpad contents, or empty string if empty."""
-    contents = read_scratchpad(path)
+    sp_path = _resolve(path)
+    entry = _load_entry(sp_path)
+    if entry is None:
+        return ""
+    section = entry[4]
+    if section is None:
+        # Format once per file version; later turns reuse the string.
+        section = _format_section(entry[3])
+        _SP_CACHE[sp_path] = (*entry[:4], section)
+    return section
+
+
+def _format_section(contents: str) -> str:
+    """Wrap scratchpad *contents* in the prompt section markers."""
     if not contents.strip():
         return ""
     return (
@@ -53,3 +121,22 @@ def scratchpad_prompt_section(path: Path | str | None = None) -> str:
         f"{contents}\n"
         "--- End Scratchpad ---\n"
     )
+
+
+def _load_entry(sp_path: str) -> tuple[int, int, int, str, str | None] | None:
+    """Return the cache entry for *sp_path*, re-reading it if it changed.
+
+    Returns ``None`` if the file does not exist.
+    """
+    try:
+        st = os.stat(sp_path)
+    except FileNotFoundError:
+        _SP_CACHE.pop(sp_path, None)
+        return None
+    stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+    entry = _SP_CACHE.get(sp_path)
+    if entry is None or entry[:3] != stamp:
+        with open(sp_path, encoding="utf-8") as f:
+            entry = (*stamp, f.read(), None)
+        _SP_CACHE[sp_path] = entry
+    return entry
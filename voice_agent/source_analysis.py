@@ -10,15 +10,24 @@ When disabled, no source analysis is performed.
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
+import heapq
 import json
+import math
+import operator
+import os
 import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable
 
 from voice_agent.config import ConfigNode
 from voice_agent.llm import LLMBackend
 from voice_agent.prompt_loader import render_template
+from voice_agent.source_analysis_cache import ScoreCache, get_score_cache
 
 
 # ---------------------------------------------------------------------------
@@ -26,14 +35,23 @@ from voice_agent.prompt_loader import render_template
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SourceResult:
-    """A single scored and described documentation source."""
+    """A single scored and described documentation source.
+
+    Only the source's path is kept; :attr:`content` re-reads the file on
+    access, so a list of results does not pin every document in memory.
+    """
 
     name: str
     score: float
     description: str
-    content: str
+    content_path: str
+
+    @property
+    def content(self) -> str:
+        """The source text, read from :attr:`content_path`."""
+        return Path(self.content_path).read_text(encoding="utf-8")
 
 
 # ---------------------------------------------------------------------------
@@ -65,6 +83,80 @@ def _get_relevance_threshold(config: ConfigNode) -> float:
     return float(getattr(sa, "relevance_threshold", 0.5))
 
 
+def _get_top_k(config: ConfigNode) -> int | None:
+    """Return the maximum number of ranked sources to keep (default: all)."""
+    sa = config.get("source_analysis")
+    if sa is None:
+        return None
+    if isinstance(sa, dict):
+        top_k = sa.get("top_k")
+    else:
+        top_k = getattr(sa, "top_k", None)
+    return int(top_k) if top_k else None
+
+
+def _get_cache_scores(config: ConfigNode) -> bool:
+    """Return whether scores are persisted across runs (default ``False``)."""
+    sa = config.get("source_analysis")
+    if sa is None:
+        return False
+    if isinstance(sa, dict):
+        return bool(sa.get("cache_scores", False))
+    return bool(getattr(sa, "cache_scores", False))
+
+
+def _get_max_concurrency(config: ConfigNode) -> int:
+    """Return how many sources may be scored at once (default 1)."""
+    sa = config.get("source_analysis")
+    if sa is None:
+        return 1
+    if isinstance(sa, dict):
+        value = sa.get("max_concurrency", 1)
+    else:
+        value = getattr(sa, "max_concurrency", 1)
+    return max(1, int(value or 1))
+
+
+def _get_prefilter_top_k(config: ConfigNode) -> int:
+    """Return how many sources survive the lexical pre-filter (default 10).
+
+    ``0`` disables the pre-filter so every source is LLM-scored.
+    """
+    sa = config.get("source_analysis")
+    if sa is None:
+        return 10
+    if isinstance(sa, dict):
+        value = sa.get("prefilter_top_k", 10)
+    else:
+        value = getattr(sa, "prefilter_top_k", 10)
+    return max(0, int(value or 0))
+
+
+def _get_max_score_tokens(config: ConfigNode) -> int:
+    """Return the per-source token budget for scoring prompts (default 2000).
+
+    ``0`` sends each source in full.
+    """
+    sa = config.get("source_analysis")
+    if sa is None:
+        return 2000
+    if isinstance(sa, dict):
+        value = sa.get("max_score_tokens", 2000)
+    else:
+        value = getattr(sa, "max_score_tokens", 2000)
+    return max(0, int(value or 0))
+
+
+def _get_batch_scoring(config: ConfigNode) -> bool:
+    """Return whether sources are scored in one LLM call (default ``False``)."""
+    sa = config.get("source_analysis")
+    if sa is None:
+        return False
+    if isinstance(sa, dict):
+        return bool(sa.get("batch_scoring", False))
+    return bool(getattr(sa, "batch_scoring", False))
+
+
 # ---------------------------------------------------------------------------
 # Source loading
 # ---------------------------------------------------------------------------
@@ -86,40 +178,167 @@ def load_source(source_path: str) -> dict[str, str]:
         return {"name": source_path, "content": f"[Error reading file: {exc}]"}
 
 
+# ---------------------------------------------------------------------------
+# Lexical pre-filter
+# ---------------------------------------------------------------------------
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _tokenize(text: str) -> list[str]:
+    """Split *text* into lowercase word tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def bm25_scores(
+    query: str,
+    documents: list[str],
+    k1: float = 1.5,
+    b: float = 0.75,
+) -> list[float]:
+    """Score *documents* against *query* with Okapi BM25.
+
+    A cheap lexical relevance signal used to screen sources before the
+    much more expensive LLM scoring.  Returns one score per document, in
+    order; higher is more relevant.
+    """
+    if not documents:
+        return []
+    term_counts = [Counter(_tokenize(doc)) for doc in documents]
+    lengths = [sum(tc.values()) for tc in term_counts]
+    avg_len = sum(lengths) / len(lengths) or 1.0
+    n_docs = len(documents)
+
+    scores = [0.0] * n_docs
+    for term in set(_tokenize(query)):
+        df = sum(1 for tc in term_counts if term in tc)
+        if not df:
+            continue
+        idf = math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+        for i, tc in enumerate(term_counts):
+            tf = tc.get(term)
+            if tf:
+                norm = k1 * (1.0 - b + b * lengths[i] / avg_len)
+                scores[i] += idf * tf * (k1 + 1.0) / (tf + norm)
+    return scores
+
+
 # ---------------------------------------------------------------------------
 # Relevance scoring
 # ---------------------------------------------------------------------------
 
+# Rough characters-per-token ratio for English text with BPE tokenizers.
+_CHARS_PER_TOKEN = 4
+
+_TRUNCATION_MARKER = "\n\n[... middle of source omitted ...]\n\n"
+
+
+def truncate_for_scoring(content: str, max_tokens: int) -> str:
+    """Trim *content* to roughly *max_tokens*, keeping its head and tail.
+
+    Tokens are estimated at ``_CHARS_PER_TOKEN`` characters each, which is
+    close enough for a prompt budget and needs no tokenizer.  The beginning
+    and end of a document usually carry its topic and conclusions, so the
+    middle is what gets dropped.  ``0`` disables truncation.
+    """
+    budget = max_tokens * _CHARS_PER_TOKEN
+    if not max_tokens or len(content) <= budget:
+        return content
+    half = budget // 2
+    return content[:half] + _TRUNCATION_MARKER + content[-half:]
+
+
+
+class _JsonObjectScanner:
+    """Incrementally find where the first JSON object in a text closes.
+
+    Tracks brace depth, ignoring braces inside JSON strings, across any
+    number of :meth:`feed` calls, so it works on whole strings and on
+    streamed fragments alike.
+    """
+
+    __slots__ = ("depth", "in_string", "escaped")
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, text: str, start: int = 0) -> int:
+        """Scan *text* from *start*; return the index just past the closing
+        brace of the first object, or ``-1`` if it has not closed yet."""
+        depth = self.depth
+        in_string = self.in_string
+        escaped = self.escaped
+        for i in range(start, len(text)):
+            ch = text[i]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = depth > 0
+            elif ch == "{":
+                depth += 1
+            elif ch == "}" and depth:
+                depth -= 1
+                if not depth:
+                    self.depth, self.in_string, self.escaped = 0, False, False
+                    return i + 1
+        self.depth, self.in_string, self.escaped = depth, in_string, escaped
+        return -1
+
 
 def _parse_score_response(raw: str) -> dict[str, Any]:
     """Extract a JSON object from the LLM's scoring response.
 
     The LLM is instructed to return only ``{"score": ..., "description": ...}``
     but may wrap it in markdown fences or add commentary.  This function
-    attempts to extract the first JSON object found.
+    parses the first balanced ``{...}`` found, located in a single pass so
+    nested objects and braces inside strings are handled.
     """
-    # Strip markdown code fences if present
-    cleaned = re.sub(r"```(?:json)?\s*", "", raw)
-    cleaned = cleaned.replace("```", "").strip()
-
-    # Try the whole string first
-    try:
-        return json.loads(cleaned)
-    except (json.JSONDecodeError, ValueError):
-        pass
-
-    # Try to find a JSON object within the text
-    match = re.search(r"\{[^}]+\}", cleaned)
-    if match:
-        try:
-            return json.loads(match.group())
-        except (json.JSONDecodeError, ValueError):
-            pass
+    start = raw.find("{")
+    if start != -1:
+        end = _JsonObjectScanner().feed(raw, start)
+        if end != -1:
+            try:
+                parsed = json.loads(raw[start:end])
+            except (json.JSONDecodeError, ValueError):
+                pass
+            else:
+                if isinstance(parsed, dict):
+                    return parsed
 
     # Fallback: treat as irrelevant
     return {"score": 0.0, "description": "Unable to parse relevance score."}
 
 
+def _read_until_json_object(fragments: Iterable[str]) -> str:
+    """Consume streamed *fragments* until the first JSON object closes.
+
+    The stream is abandoned as soon as the score object is complete, rather
+    than waiting for any trailing commentary.  Returns the text received so
+    far; if the stream ends before an object closes, returns everything
+    received.
+    """
+    received: list[str] = []
+    scanner = _JsonObjectScanner()
+    stream = iter(fragments)
+    try:
+        for fragment in stream:
+            received.append(fragment)
+            if scanner.feed(fragment) != -1:
+                return "".join(received)
+    finally:
+        close = getattr(stream, "close", None)
+        if callable(close):
+            close()
+    return "".join(received)
+
+
 def score_source(
     question: str,
     source_name: str,
@@ -150,7 +369,11 @@ def score_source(
         {"role": "system", "content": prompt_text},
         {"role": "user", "content": "Score this source's relevance."},
     ]
-    raw = llm.chat(messages)
+    if getattr(llm, "supports_streaming", False) is True:
+        # Stop generation once the JSON object is complete.
+        raw = _read_until_json_object(llm.chat_stream(messages))
+    else:
+        raw = llm.chat(messages)
     parsed = _parse_score_response(raw)
 
     score = max(0.0, min(1.0, float(parsed.get("score", 0.0))))
@@ -158,6 +381,75 @@ def score_source(
     return score, description
 
 
+_ANSWER_RE = re.compile(r"<answer>\s*(\[.*?\])\s*</answer>", re.DOTALL)
+
+
+def _parse_batch_response(raw: str, count: int) -> list[tuple[float, str]] | None:
+    """Extract *count* ``(score, description)`` pairs from a batch response.
+
+    Accepts an ``<answer>[...]</answer>`` array whose items are either
+    ``{"score": ..., "description": ...}`` objects or bare numbers.  Returns
+    ``None`` if the answer is missing, malformed or the wrong length.
+    """
+    match = _ANSWER_RE.search(raw)
+    if match is None:
+        return None
+    try:
+        items = json.loads(match.group(1))
+    except (json.JSONDecodeError, ValueError):
+        return None
+    if not isinstance(items, list) or len(items) != count:
+        return None
+
+    pairs: list[tuple[float, str]] = []
+    for item in items:
+        try:
+            if isinstance(item, dict):
+                score = float(item.get("score", 0.0))
+                description = str(item.get("description", ""))
+            else:
+                score, description = float(item), ""
+        except (TypeError, ValueError):
+            return None
+        pairs.append((max(0.0, min(1.0, score)), description))
+    return pairs
+
+
+def score_sources_batch(
+    question: str,
+    sources: list[tuple[str, str]],
+    llm: LLMBackend,
+) -> list[tuple[float, str]] | None:
+    """Score several ``(name, content)`` sources in a single LLM call.
+
+    Returns one ``(score, description)`` per source, in order, or ``None``
+    if the response cannot be parsed so the caller can fall back to
+    :func:`score_source`.
+    """
+    listing = "\n".join(
+        f'<source index="{i}" name="{name}">\n{content}\n</source>'
+        for i, (name, content) in enumerate(sources)
+    )
+    try:
+        prompt_text = render_template(
+            "source_batch_relevance_prompt",
+            variables={"question": question, "sources": listing},
+        )
+    except FileNotFoundError:
+        prompt_text = (
+            f"Rate the relevance of each source to the question on a 0.0–1.0 scale.\n"
+            f"Respond with ONLY a JSON array in answer tags, one object per source in order: "
+            f"<answer>[{{\"score\": 0.0, \"description\": \"...\"}}]</answer>\n\n"
+            f"Question: {question}\n\nSources:\n{listing}"
+        )
+
+    messages = [
+        {"role": "system", "content": prompt_text},
+        {"role": "user", "content": "Score each source's relevance."},
+    ]
+    return _parse_batch_response(llm.chat(messages), len(sources))
+
+
 # ---------------------------------------------------------------------------
 # Full pipeline
 # ---------------------------------------------------------------------------
@@ -172,9 +464,23 @@ def analyze_sources(
     """Run the full source analysis pipeline.
 
     1. Load each source file.
-    2. Score each source against the question.
+    2. Score each source against the question.  Sources with identical
+       content are scored once and share the result.  With
+       ``cache_scores`` enabled, scores also persist on disk and are reused
+       for the same question, source and model.  Up to
+       ``max_concurrency`` sources are read and scored in parallel threads.
+       When there are more than ``prefilter_top_k`` distinct sources, only
+       the best matches by BM25 against the question are LLM-scored.
+       With ``batch_scoring`` enabled, all sources go to the LLM in a
+       single call, falling back to one call per source if the reply
+       cannot be parsed.  Each source is cut to ``max_score_tokens``
+       (head and tail) for scoring; results still point at the full file.
     3. Filter by the configured relevance threshold.
-    4. Rank by score descending.
+    4. Rank by score descending, keeping only the best ``top_k`` if set.
+
+    A literal lookup skips all of this: when the question is exactly a
+    source's file name, or a quoted phrase found in one, the matching
+    sources are returned with score 1.0 and no LLM call is made.
 
     Returns an empty list if source analysis is disabled or no sources
     pass the threshold.
@@ -185,35 +491,188 @@ def analyze_sources(
     if not sources:
         return []
 
-    threshold = _get_relevance_threshold(config)
-    results: list[SourceResult] = []
-
-    for source_path in sources:
-        loaded = load_source(source_path)
-        name = loaded["name"]
-        content = loaded["content"]
+    literal = _literal_matches(question, sources)
+    if literal:
+        return literal
 
-        # Skip sources that failed to load
-        if content.startswith("[Error"):
-            continue
-
-        score, description = score_source(question, name, content, llm)
+    threshold = _get_relevance_threshold(config)
+    top_k = _get_top_k(config)
+    score_cache = get_score_cache() if _get_cache_scores(config) else None
+    model = f"{type(llm).__name__}:{getattr(llm, 'model', '')}"
+
+    # File reads and LLM calls are both I/O-bound, so with more than one
+    # worker they run on a shared thread pool and overlap each other.
+    workers = min(_get_max_concurrency(config), len(sources))
+    with (
+        ThreadPoolExecutor(max_workers=workers) if workers > 1 else contextlib.nullcontext()
+    ) as pool:
+        run = pool.map if pool is not None else map
+        scored_sources = _load_and_score(
+            sources, run, score_cache, question, llm, model,
+            _get_prefilter_top_k(config), _get_batch_scoring(config),
+            _get_max_score_tokens(config),
+        )
 
+    results: list[SourceResult] = []
+    for name, source_path, (score, description) in scored_sources:
         if score >= threshold:
             results.append(
                 SourceResult(
                     name=name,
                     score=score,
                     description=description,
-                    content=content,
+                    content_path=source_path,
                 )
             )
 
     # Rank by score descending
-    results.sort(key=lambda r: r.score, reverse=True)
+    by_score = operator.attrgetter("score")
+    if top_k:
+        return heapq.nlargest(top_k, results, key=by_score)
+    results.sort(key=by_score, reverse=True)
     return results
 
 
+def _literal_matches(question: str, sources: list[str]) -> list[SourceResult]:
+    """Return the sources a literal file-name lookup refers to, if any."""
+    query = question.strip()
+    quoted = len(query) > 2 and query[0] == query[-1] and query[0] in "\"'"
+    phrase = query[1:-1].strip().lower() if quoted else ""
+
+    matches: list[SourceResult] = []
+    for source_path in sources:
+        name = os.path.basename(source_path)
+        if name == query:
+            description = "Exact file name match."
+        elif phrase and phrase in name.lower():
+            description = "Quoted phrase matches the file name."
+        else:
+            continue
+        if os.path.isfile(source_path):
+            matches.append(SourceResult(name, 1.0, description, source_path))
+    return matches
+
+
+def _load_and_score(
+    sources: list[str],
+    run: Callable[..., Iterable[Any]],
+    score_cache: ScoreCache | None,
+    question: str,
+    llm: LLMBackend,
+    model: str,
+    prefilter_top_k: int,
+    batch: bool,
+    max_score_tokens: int,
+) -> list[tuple[str, str, tuple[float, str]]]:
+    """Load *sources* and score each distinct content once.
+
+    *run* is ``map`` or an executor's ``map``; either way results come back
+    in source order.  Returns ``(name, source_path, (score, description))``
+    for every source that loaded and survived the lexical pre-filter.
+    Contents are dropped once scored.
+    """
+    loaded_sources: list[tuple[str, str, bytes]] = []
+    to_score: dict[bytes, tuple[str, str]] = {}
+    for source_path, loaded in zip(sources, run(load_source, sources)):
+        name = loaded["name"]
+        content = loaded["content"]
+
+        # Skip sources that failed to load
+        if content.startswith("[Error"):
+            continue
+
+        digest = hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+        loaded_sources.append((name, source_path, digest))
+        # The first source with a given content is the one that gets scored.
+        if digest not in to_score:
+            to_score[digest] = (name, truncate_for_scoring(content, max_score_tokens))
+
+    if prefilter_top_k and len(to_score) > prefilter_top_k:
+        lexical = bm25_scores(question, [content for _, content in to_score.values()])
+        kept = set(
+            heapq.nlargest(prefilter_top_k, range(len(lexical)), key=lexical.__getitem__)
+        )
+        to_score = {d: v for i, (d, v) in enumerate(to_score.items()) if i in kept}
+
+    def score_one(item: tuple[bytes, tuple[str, str]]) -> tuple[float, str]:
+        digest, (name, content) = item
+        return _score_with_cache(
+            score_cache, question, name, content, digest, llm, model, max_score_tokens
+        )
+
+    scores: dict[bytes, tuple[float, str]] = {}
+    if batch and len(to_score) > 1:
+        scores = _score_batch_with_cache(
+            score_cache, question, to_score, llm, model, max_score_tokens
+        )
+    pending = [item for item in to_score.items() if item[0] not in scores]
+    scores.update(zip((digest for digest, _ in pending), run(score_one, pending)))
+    return [
+        (name, source_path, scores[digest])
+        for name, source_path, digest in loaded_sources
+        if digest in scores
+    ]
+
+
+def _score_with_cache(
+    score_cache: ScoreCache | None,
+    question: str,
+    name: str,
+    content: str,
+    digest: bytes,
+    llm: LLMBackend,
+    model: str,
+    max_score_tokens: int,
+) -> tuple[float, str]:
+    """Score a source, consulting the persistent cache when one is given."""
+    if score_cache is None:
+        return score_source(question, name, content, llm)
+    key = ScoreCache.make_key(question, name, digest, model, max_score_tokens)
+    hit = score_cache.get(key)
+    if hit is not None:
+        return hit
+    result = score_source(question, name, content, llm)
+    score_cache.put(key, *result)
+    return result
+
+
+def _score_batch_with_cache(
+    score_cache: ScoreCache | None,
+    question: str,
+    to_score: dict[bytes, tuple[str, str]],
+    llm: LLMBackend,
+    model: str,
+    max_score_tokens: int,
+) -> dict[bytes, tuple[float, str]]:
+    """Batch-score the sources in *to_score* that are not already cached.
+
+    Returns the scores obtained, keyed by content digest; sources missing
+    from the result still need scoring one at a time.
+    """
+    scores: dict[bytes, tuple[float, str]] = {}
+    keys: dict[bytes, bytes] = {}
+    for digest, (name, _) in to_score.items():
+        if score_cache is not None:
+            keys[digest] = key = ScoreCache.make_key(
+                question, name, digest, model, max_score_tokens
+            )
+            hit = score_cache.get(key)
+            if hit is not None:
+                scores[digest] = hit
+    misses = [digest for digest in to_score if digest not in scores]
+    if len(misses) < 2:
+        return scores
+
+    batch = score_sources_batch(question, [to_score[d] for d in misses], llm)
+    if batch is None:
+        return scores
+    for digest, result in zip(misses, batch):
+        scores[digest] = result
+        if score_cache is not None:
+            score_cache.put(keys[digest], *result)
+    return scores
+
+
 def build_ranked_summary(results: list[SourceResult]) -> str:
     """Build a plain-text ranked summary of source results.
 
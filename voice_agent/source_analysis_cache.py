@@ -0,0 +1,111 @@
+"""Persistent cache of source relevance scores (R-17).
+
+Scoring a documentation source costs one LLM round-trip.  Scores are stored
+in a small SQLite database under the shared cache directory, keyed on the
+question, the source name, a hash of the source content, the model and the
+scoring token budget, so repeated questions against unchanged sources skip
+the LLM entirely.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+
+from voice_agent.cache import cache_dir
+
+# Bump when the scoring prompt or parsing changes to orphan old scores.
+_SCORE_CACHE_VERSION = 2
+
+
+class ScoreCache:
+    """SQLite-backed ``key -> (score, description)`` store.
+
+    All operations are best-effort: database errors are swallowed and
+    reported as cache misses, so a broken cache never breaks scoring.
+
+    Parameters
+    ----------
+    path:
+        Database file.  Its parent directory is created if needed.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS score_cache("
+            "key BLOB PRIMARY KEY, score REAL NOT NULL, description TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(
+        question: str,
+        source_name: str,
+        content_digest: bytes,
+        model: str,
+        max_score_tokens: int,
+    ) -> bytes:
+        """Return the cache key for one (question, source, model) scoring.
+
+        *max_score_tokens* is part of the key because it decides how much
+        of the content the score was computed on.
+        """
+        h = hashlib.blake2b(digest_size=16)
+        parts = (
+            str(_SCORE_CACHE_VERSION), model, str(max_score_tokens), question, source_name
+        )
+        for part in parts:
+            h.update(part.encode("utf-8"))
+            h.update(b"\0")
+        h.update(content_digest)
+        return h.digest()
+
+    def get(self, key: bytes) -> tuple[float, str] | None:
+        """Return the cached ``(score, description)`` for *key*, if any."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT score, description FROM score_cache WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        return (row[0], row[1]) if row is not None else None
+
+    def put(self, key: bytes, score: float, description: str) -> None:
+        """Store ``(score, description)`` under *key*."""
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO score_cache(key, score, description) "
+                    "VALUES (?, ?, ?)",
+                    (key, score, description),
+                )
+        except sqlite3.Error:
+            pass
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+@functools.lru_cache(maxsize=4)
+def _open(path: Path) -> ScoreCache | None:
+    try:
+        return ScoreCache(path)
+    except (OSError, sqlite3.Error):
+        return None
+
+
+def get_score_cache() -> ScoreCache | None:
+    """Return the shared score cache, or ``None`` if it cannot be opened."""
+    return _open(cache_dir("source_scores.sqlite3"))
@@ -7,13 +7,156 @@ swappable providers.  Provider is selected via ``assistant_config.yml``.
 from __future__ import annotations
 
 import abc
+import bisect
+import contextlib
+import functools
+import hashlib
+import importlib.util
+import itertools
+import mmap
+import os
 import pathlib
+import queue
 import re
-from typing import Any, Iterator
-
+import struct
+import sys
+import tempfile
+import threading
+import weakref
+from types import ModuleType
+from typing import Any, Callable, Iterable, Iterator
+
+from voice_agent.cache import cache_dir
 from voice_agent.config import ConfigNode
 
 
+def _lazy_import(name: str) -> ModuleType | None:
+    """Register *name* in ``sys.modules`` without executing it yet.
+
+    Uses ``importlib.util.LazyLoader`` so the module's code (and its heavy
+    dependency chain) only runs on first attribute access.  Returns ``None``
+    if the module is not installed; an already-imported module is returned
+    as-is.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        return None
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# FastRTC pulls in torch/numpy/onnx; defer executing it until Kokoro is used.
+_lazy_import("fastrtc")
+
+# Bound once here rather than re-imported on every synthesis call; ``None``
+# when numpy is not installed.
+np = _lazy_import("numpy")
+
+
+@functools.cache
+def _get_torch() -> ModuleType:
+    """Return the torch module, importing it on first use.
+
+    torch is only needed by Chatterbox and is too heavy to import up front;
+    caching the module keeps the per-chunk CUDA paths free of import
+    machinery.  Raises ``ImportError`` if torch is not installed.
+    """
+    import torch
+
+    return torch
+
+
+# Sample formats the PCM-based backends can yield.
+_PCM_DTYPES = frozenset({"float32", "int16"})
+
+
+def _validate_dtype(dtype: str) -> str:
+    """Return *dtype* if it is a supported output sample format."""
+    if dtype not in _PCM_DTYPES:
+        raise ValueError(
+            f"Unsupported TTS dtype: {dtype!r}. "
+            f"Available: {', '.join(sorted(_PCM_DTYPES))}"
+        )
+    return dtype
+
+
+def _pcm16_to_audio(raw: bytes | memoryview, dtype: str) -> Any:
+    """Convert a 16-bit PCM buffer to a sample array of *dtype*.
+
+    ``"int16"`` is a zero-copy view of *raw*.  ``"float32"`` converts and
+    scales into ``[-1.0, 1.0)`` in one fused ufunc loop, without the
+    intermediate float copy that ``astype`` plus a division would make.
+    """
+    pcm = np.frombuffer(raw, dtype=np.int16)
+    if dtype == "int16":
+        return pcm
+    return np.multiply(pcm, np.float32(1.0 / 32768.0), dtype=np.float32)
+
+
+@functools.cache
+def _scratch_dir() -> str | None:
+    """Return a RAM-backed directory for short-lived audio files, if any.
+
+    pyttsx3 drivers can only synthesise to a file path, so the WAV is put on
+    tmpfs (``/dev/shm``) where available to keep disk I/O off the speech
+    path.  ``None`` lets :mod:`tempfile` pick its default directory.
+    """
+    shm = "/dev/shm"
+    if os.path.isdir(shm) and os.access(shm, os.W_OK | os.X_OK):
+        return shm
+    return None
+
+
+def _read_wav_pcm16(path: str, dtype: str) -> tuple[int, Any]:
+    """Return ``(sample_rate, samples)`` for a 16-bit PCM WAV file.
+
+    Only the RIFF chunk headers are parsed; the sample payload is
+    memory-mapped and handed to numpy without first being read into a
+    Python ``bytes`` object.  The samples are always copied out once, so
+    the mapping is closed before returning and the file can be deleted
+    straight away (Windows refuses to unlink a mapped file).
+    """
+    with open(path, "rb") as f:
+        header = f.read(12)
+        if len(header) < 12 or header[:4] != b"RIFF" or header[8:] != b"WAVE":
+            raise RuntimeError(f"Not a WAV file: {path}")
+        sample_rate = None
+        while True:
+            chunk = f.read(8)
+            if len(chunk) < 8:
+                raise RuntimeError(f"WAV file has no data chunk: {path}")
+            chunk_id, size = chunk[:4], int.from_bytes(chunk[4:], "little")
+            if chunk_id == b"data":
+                break
+            body = f.read(size + (size & 1))  # chunks are word-aligned
+            if chunk_id == b"fmt ":
+                sample_rate = struct.unpack_from("<I", body, 4)[0]
+                if struct.unpack_from("<H", body, 14)[0] != 16:
+                    raise RuntimeError(f"Expected 16-bit PCM audio: {path}")
+        if sample_rate is None:
+            raise RuntimeError(f"WAV file has no fmt chunk: {path}")
+
+        offset = f.tell()
+        # Streaming writers may leave a placeholder size; trust the file.
+        size = min(size, os.fstat(f.fileno()).st_size - offset) & ~1
+        if size <= 0:
+            return sample_rate, _pcm16_to_audio(b"", dtype)
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    # The view is released before the mapping closes, even on error.
+    with mapping, memoryview(mapping)[offset:offset + size] as view:
+        audio = _pcm16_to_audio(view, dtype)
+        if dtype == "int16":
+            # float32 conversion already copied; int16 is still a view.
+            audio = audio.copy()
+    return sample_rate, audio
+
+
 class TTSBackend(abc.ABC):
     """Base class for all TTS providers."""
 
@@ -24,6 +167,24 @@ class TTSBackend(abc.ABC):
     def stream_tts(self, text: str) -> Iterator[tuple[int, Any]]:
         """Yield ``(sample_rate, audio_array)`` chunks for the given text."""
 
+    def stream_tts_batched(self, texts: Iterable[str]) -> Iterator[tuple[int, Any]]:
+        """Yield audio chunks for each of *texts*, in order.
+
+        *texts* may be a lazy iterable, such as the sentences of a reply
+        while the LLM is still producing it; each text is pulled only when
+        it is needed.  The default synthesises the texts one after another;
+        providers that can generate several texts together override it.
+        """
+        for text in texts:
+            yield from self.stream_tts(text)
+
+    def warm_up(self) -> None:
+        """Load models and prime inference ahead of the first real request.
+
+        The default does nothing; providers with expensive lazy state
+        override it.  Must be safe to run concurrently with ``stream_tts``.
+        """
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(voice={self.voice!r})"
 
@@ -38,61 +199,109 @@ class KokoroTTS(TTSBackend):
     def __init__(self, voice: str | None = "af_heart", **kwargs: Any) -> None:
         super().__init__(voice, **kwargs)
         self._model: Any = None
+        self._model_lock = threading.Lock()
 
     def _get_model(self) -> Any:
         if self._model is None:
-            from fastrtc import get_tts_model
+            with self._model_lock:
+                if self._model is None:
+                    # Resolves via sys.modules; the lazily registered module
+                    # only executes here, on first attribute access.
+                    from fastrtc import get_tts_model
 
-            self._model = get_tts_model()
+                    self._model = get_tts_model()
         return self._model
 
     def stream_tts(self, text: str) -> Iterator[tuple[int, Any]]:
         model = self._get_model()
         yield from model.stream_tts_sync(text)
 
+    def warm_up(self) -> None:
+        for _ in self.stream_tts(_WARM_UP_TEXT):
+            pass
+
 
 class Pyttsx3TTS(TTSBackend):
     """pyttsx3 local TTS fallback provider.
 
     Uses the system's built-in speech synthesis engine.  Audio is generated
     in-memory and yielded as a single chunk.
+
+    ``pyttsx3.init()`` enumerates the OS voices and only supports one engine
+    per driver, so a single engine (and resolved voice ids) is shared by all
+    instances; each call applies its own rate and voice before synthesising.
     """
 
+    _engine: Any = None
+    _voice_ids: dict[str, str | None] = {}
+    _engine_lock = threading.Lock()
+    # (rate, voice id) last applied to the shared engine.
+    _applied: tuple[int, str | None] | None = None
+
     def __init__(self, voice: str | None = None, **kwargs: Any) -> None:
         super().__init__(voice, **kwargs)
         self._rate: int = kwargs.get("rate", 150)
+        self._dtype: str = _validate_dtype(kwargs.get("dtype", "float32"))
 
-    def stream_tts(self, text: str) -> Iterator[tuple[int, Any]]:
-        import os
-        import tempfile
-        import wave
+    def _get_engine(self) -> Any:
+        """Return the shared pyttsx3 engine, creating it on first use.
 
-        import numpy as np
-        import pyttsx3
+        Must be called with ``_engine_lock`` held.
+        """
+        cls = type(self)
+        if cls._engine is None:
+            import pyttsx3
 
-        engine = pyttsx3.init()
-        engine.setProperty("rate", self._rate)
+            cls._engine = pyttsx3.init()
+            cls._applied = None
+        return cls._engine
 
-        if self.voice:
-            voices = engine.getProperty("voices")
-            for v in voices:
-                if self.voice.lower() in v.id.lower():
-                    engine.setProperty("voice", v.id)
-                    break
+    def _configure_engine(self, engine: Any) -> None:
+        """Apply this instance's rate and voice, skipping unchanged settings.
+
+        Must be called with ``_engine_lock`` held.
+        """
+        cls = type(self)
+        settings = (self._rate, self._resolve_voice_id(engine))
+        if settings == cls._applied:
+            return
+        engine.setProperty("rate", settings[0])
+        if settings[1]:
+            engine.setProperty("voice", settings[1])
+        cls._applied = settings
+
+    def _resolve_voice_id(self, engine: Any) -> str | None:
+        """Return the engine voice id matching ``self.voice`` (cached)."""
+        if not self.voice:
+            return None
+        key = self.voice.lower()
+        if key not in self._voice_ids:
+            self._voice_ids[key] = next(
+                (v.id for v in engine.getProperty("voices") if key in v.id.lower()),
+                None,
+            )
+        return self._voice_ids[key]
+
+    def warm_up(self) -> None:
+        with self._engine_lock:
+            self._resolve_voice_id(self._get_engine())
+
+    def stream_tts(self, text: str) -> Iterator[tuple[int, Any]]:
+        if np is None:
+            raise RuntimeError("numpy package not installed. Run: pip install numpy")
 
         # Write to a unique temporary WAV file to avoid race conditions
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            wav_path = tmp.name
+        fd, wav_path = tempfile.mkstemp(suffix=".wav", dir=_scratch_dir())
+        os.close(fd)
 
         try:
-            engine.save_to_file(text, wav_path)
-            engine.runAndWait()
-
-            with wave.open(wav_path, "rb") as wf:
-                sample_rate = wf.getframerate()
-                frames = wf.readframes(wf.getnframes())
-                audio = np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
-                yield (sample_rate, audio)
+            with self._engine_lock:
+                engine = self._get_engine()
+                self._configure_engine(engine)
+                engine.save_to_file(text, wav_path)
+                engine.runAndWait()
+
+            sample_rate, audio = _read_wav_pcm16(wav_path, self._dtype)
         except FileNotFoundError:
             raise RuntimeError("pyttsx3 failed to generate audio output.")
         finally:
@@ -101,6 +310,8 @@ class Pyttsx3TTS(TTSBackend):
             except OSError:
                 pass
 
+        yield (sample_rate, audio)
+
 
 class RealtimeTTSBackend(TTSBackend):
     """RealtimeTTS with SystemEngine provider.
@@ -111,40 +322,81 @@ class RealtimeTTSBackend(TTSBackend):
 
     DEFAULT_SAMPLE_RATE = 22050
 
+    # The RealtimeTTS module, imported on first synthesis and kept here so
+    # later calls skip the import machinery.
+    _realtimetts: ModuleType | None = None
+
     def __init__(self, voice: str | None = None, **kwargs: Any) -> None:
         super().__init__(voice, **kwargs)
         self._sample_rate: int = kwargs.get("sample_rate", self.DEFAULT_SAMPLE_RATE)
+        self._dtype: str = _validate_dtype(kwargs.get("dtype", "float32"))
+
+    @classmethod
+    def _get_realtimetts(cls) -> ModuleType:
+        """Return the RealtimeTTS module, importing it on first use."""
+        if cls._realtimetts is None:
+            import RealtimeTTS
+
+            cls._realtimetts = RealtimeTTS
+        return cls._realtimetts
 
     def stream_tts(self, text: str) -> Iterator[tuple[int, Any]]:
-        import numpy as np
-        from RealtimeTTS import SystemEngine, TextToAudioStream
+        """Yield audio chunk by chunk as the engine produces it.
+
+        Playback runs on a worker thread that hands chunks over through a
+        queue, so the first audio reaches the caller before the rest of the
+        utterance has been synthesised.
+        """
+        if np is None:
+            raise RuntimeError("numpy package not installed. Run: pip install numpy")
+        rtts = self._get_realtimetts()
 
-        engine = SystemEngine()
+        engine = rtts.SystemEngine()
         if self.voice:
             engine.set_voice(self.voice)
 
-        stream = TextToAudioStream(engine)
+        stream = rtts.TextToAudioStream(engine)
         stream.feed(text)
 
-        audio_chunks: list[bytes] = []
+        chunks: queue.SimpleQueue[bytes | BaseException | None] = queue.SimpleQueue()
 
-        def on_audio_chunk(chunk: bytes) -> None:
-            audio_chunks.append(chunk)
-
-        stream.play(on_audio_chunk=on_audio_chunk, muted=True)
+        def play() -> None:
+            try:
+                stream.play(on_audio_chunk=chunks.put, muted=True)
+            except BaseException as exc:  # re-raised in the consumer
+                chunks.put(exc)
+            else:
+                chunks.put(None)
 
-        if audio_chunks:
-            raw = b"".join(audio_chunks)
-            audio = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
-            yield (self._sample_rate, audio)
+        worker = threading.Thread(target=play, name="realtimetts-play", daemon=True)
+        worker.start()
+        pending = b""  # odd trailing byte carried to the next chunk
+        try:
+            while (chunk := chunks.get()) is not None:
+                if isinstance(chunk, BaseException):
+                    raise chunk
+                if pending:
+                    chunk = pending + chunk
+                cut = len(chunk) & ~1
+                pending = chunk[cut:]
+                if cut:
+                    yield (self._sample_rate, _pcm16_to_audio(chunk[:cut], self._dtype))
+        finally:
+            if worker.is_alive():
+                # Consumer stopped early; let the engine wind down.
+                stop = getattr(stream, "stop", None)
+                if callable(stop):
+                    stop()
 
 
 # ---------------------------------------------------------------------------
 # Chatterbox TTS — voice cloning provider (R-18)
 # ---------------------------------------------------------------------------
 
-# Sentence-boundary regex for chunking long inputs (R-22).
-_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+# One sentence per match: text up to a terminal ``.``/``!``/``?`` that is
+# followed by whitespace, or the remainder of the input (R-22).  ASCII mode
+# keeps ``\s`` to the six ASCII spaces, which the engine tests much faster.
+_SENTENCE_RE = re.compile(r"(?=\S)(?:.*?[.!?](?=\s)|.+)", re.DOTALL | re.ASCII)
 
 # Maximum characters per chunk before sentence-boundary splitting kicks in.
 _CHUNK_CHAR_LIMIT = 500
@@ -154,27 +406,43 @@ def _chunk_text(text: str, limit: int = _CHUNK_CHAR_LIMIT) -> list[str]:
     """Split *text* into sentence-boundary chunks of at most *limit* chars.
 
     If a single sentence exceeds *limit* it is yielded as-is (never broken
-    mid-sentence).  Empty inputs return an empty list.
+    mid-sentence).  Empty inputs return an empty list.  Only sentence
+    offsets are tracked; each chunk is one slice of the input, so the
+    whitespace between its sentences is kept as written.
     """
-    if not text or not text.strip():
+    text = text.strip()
+    if not text:
         return []
-    sentences = _SENTENCE_SPLIT_RE.split(text.strip())
+    starts: list[int] = []
+    ends: list[int] = []
+    for match in _SENTENCE_RE.finditer(text):
+        starts.append(match.start())
+        ends.append(match.end())
+
+    # Sentence ends are increasing, so the last sentence that fits in a
+    # chunk is found by bisection rather than by walking every sentence.
     chunks: list[str] = []
-    current = ""
-    for sent in sentences:
-        if current and len(current) + 1 + len(sent) > limit:
-            chunks.append(current)
-            current = sent
-        else:
-            current = f"{current} {sent}".strip() if current else sent
-    if current:
-        chunks.append(current)
+    i, n = 0, len(starts)
+    while i < n:
+        chunk_start = starts[i]
+        j = max(bisect.bisect_right(ends, chunk_start + limit, i), i + 1)
+        chunks.append(text[chunk_start:ends[j - 1]])
+        i = j
     return chunks
 
 
 # Recognised model_type values and their install hints.
 _CHATTERBOX_MODEL_TYPES = {"original", "turbo", "rsxdalv-faster"}
 
+# Autocast precisions on CUDA; names match the torch dtype attributes.
+_CHATTERBOX_PRECISIONS = {"auto", "float32", "float16", "bfloat16"}
+
+# Bytes of the reference WAV hashed to key the conditioning cache.
+_REFERENCE_HASH_BYTES = 4096
+
+# Sentinel returned by ``next()`` once a streaming generator is done.
+_EXHAUSTED = object()
+
 
 class ChatterboxTTS(TTSBackend):
     """Chatterbox TTS voice-cloning provider (R-18).
@@ -208,6 +476,14 @@ class ChatterboxTTS(TTSBackend):
     # Chatterbox outputs 24 kHz audio.
     SAMPLE_RATE = 24000
 
+    # Loaded models shared by instances with identical settings, so a
+    # rebuilt backend does not reload (or recompile) GPU-resident weights.
+    # Keyed by (model_type, device, quantize, compile, precision, voice_file);
+    # the voice file is part of the key because conditioning is set on the
+    # model.
+    _shared_models: dict[tuple[Any, ...], Any] = {}
+    _shared_models_lock = threading.Lock()
+
     def __init__(
         self,
         voice: str | None = None,
@@ -217,6 +493,11 @@ class ChatterboxTTS(TTSBackend):
         device: str = "auto",
         exaggeration: float = 0.5,
         cfg_weight: float = 0.5,
+        quantize: bool = True,
+        compile: bool = False,
+        stream_chunk_size: int = 0,
+        batch_size: int = 1,
+        precision: str = "float32",
         **kwargs: Any,
     ) -> None:
         super().__init__(voice, **kwargs)
@@ -225,14 +506,35 @@ class ChatterboxTTS(TTSBackend):
         self.device_preference = device.lower()
         self.exaggeration = exaggeration
         self.cfg_weight = cfg_weight
+        self.quantize = quantize
+        self.compile = compile
+        self.stream_chunk_size = stream_chunk_size
+        self.batch_size = batch_size
+        self.precision = precision.lower()
         self._model: Any = None
         self._resolved_device: str | None = None
+        # Reference file whose conditioning is currently set on the model.
+        self._prepared_reference: pathlib.Path | None = None
 
         if self.model_type not in _CHATTERBOX_MODEL_TYPES:
             raise ValueError(
                 f"Unknown Chatterbox model_type: {self.model_type!r}. "
                 f"Available: {', '.join(sorted(_CHATTERBOX_MODEL_TYPES))}"
             )
+        if batch_size < 1:
+            raise ValueError(f"Chatterbox batch_size must be at least 1, got {batch_size}")
+        if self.precision not in _CHATTERBOX_PRECISIONS:
+            raise ValueError(
+                f"Unknown Chatterbox precision: {self.precision!r}. "
+                f"Available: {', '.join(sorted(_CHATTERBOX_PRECISIONS))}"
+            )
+
+    def __repr__(self) -> str:
+        # Identify the clone by its reference file; never repr the model.
+        return (
+            f"{self.__class__.__name__}(voice_file={self.voice_file!r}, "
+            f"model_type={self.model_type!r})"
+        )
 
     # -- Validation (R-21) --------------------------------------------------
 
@@ -263,7 +565,7 @@ class ChatterboxTTS(TTSBackend):
             return self._resolved_device
         if self.device_preference == "auto":
             try:
-                import torch
+                torch = _get_torch()
                 self._resolved_device = "cuda" if torch.cuda.is_available() else "cpu"
             except ImportError:
                 self._resolved_device = "cpu"
@@ -275,20 +577,64 @@ class ChatterboxTTS(TTSBackend):
         """Lazy-load the Chatterbox model on first use (R-20)."""
         if self._model is not None:
             return self._model
+        device = self._resolve_device()
+        key = (
+            self.model_type, device, self.quantize, self.compile,
+            self.precision, self.voice_file,
+        )
+        # A background warm-up may be loading concurrently; load only once.
+        with self._shared_models_lock:
+            model = self._shared_models.get(key)
+            if model is None:
+                model = self._build_model()
+                if self.quantize and device == "cpu":
+                    model = _quantize_for_cpu(model)
+                elif (
+                    self.compile
+                    and device == "cuda"
+                    # The faster branch compiles its own modules.
+                    and self.model_type != "rsxdalv-faster"
+                ):
+                    model = _compile_for_cuda(model, self._autocast)
+                self._shared_models[key] = model
+            self._model = model
+        return self._model
+
+    def _autocast(self) -> contextlib.AbstractContextManager[Any]:
+        """Return the mixed-precision context for a model call.
+
+        Weights stay FP32; under ``torch.autocast`` matmuls and convolutions
+        run in the configured half precision while the FP32 conditionals and
+        features are cast per op, so mixed-dtype inputs never reach a layer.
+        Autocast state is per thread, so enter it in the thread that calls
+        the model.
+        """
+        if self.precision == "float32" or self._resolve_device() != "cuda":
+            return contextlib.nullcontext()
+        torch = _get_torch()
+        if self.precision != "auto":
+            dtype = getattr(torch, self.precision)
+        elif torch.cuda.is_bf16_supported():
+            dtype = torch.bfloat16
+        else:
+            return contextlib.nullcontext()
+        return torch.autocast("cuda", dtype=dtype)
 
+    def _build_model(self) -> Any:
+        """Import and instantiate the configured Chatterbox model."""
         device = self._resolve_device()
 
         try:
             if self.model_type == "turbo":
                 from chatterbox.tts import ChatterboxTurbo
-                self._model = ChatterboxTurbo.from_pretrained(device=device)
+                return ChatterboxTurbo.from_pretrained(device=device)
             else:
                 # Both "original" and "rsxdalv-faster" use the same class.
                 # The rsxdalv-faster branch ships its optimisations inside
                 # the same ChatterboxTTS2 class (torch.compile + CUDA graphs
                 # are applied transparently).
                 from chatterbox.tts import ChatterboxTTS2
-                self._model = ChatterboxTTS2.from_pretrained(device=device)
+                return ChatterboxTTS2.from_pretrained(device=device)
         except ImportError as exc:
             if self.model_type == "rsxdalv-faster":
                 install_cmd = (
@@ -301,7 +647,56 @@ class ChatterboxTTS(TTSBackend):
                 f"chatterbox-tts package not installed. Run: {install_cmd}"
             ) from exc
 
-        return self._model
+    def warm_up(self) -> None:
+        """Load the model and run one short generation to prime it."""
+        for _ in self.stream_tts(_WARM_UP_TEXT):
+            pass
+
+    # -- Reference voice cache ----------------------------------------------
+
+    def _reference_cache_path(self, voice_path: pathlib.Path) -> pathlib.Path:
+        """Return the on-disk cache path for *voice_path*'s conditioning.
+
+        The key hashes the first 4 KB (the WAV header and opening samples)
+        plus the file size, so large reference files are never read in full.
+        """
+        with open(voice_path, "rb") as f:
+            head = f.read(_REFERENCE_HASH_BYTES)
+        digest = hashlib.blake2b(head, digest_size=8)
+        digest.update(str(voice_path.stat().st_size).encode())
+        return cache_dir("chatterbox_refs") / f"{self.model_type}-{digest.hexdigest()}.pt"
+
+    def _prepare_reference(self, model: Any, voice_path: pathlib.Path) -> bool:
+        """Set the model's conditioning on *voice_path*, via the disk cache.
+
+        Returns ``False`` when the model does not expose
+        ``prepare_conditionals``; the caller then passes the reference file
+        to every ``generate`` call instead.
+        """
+        if self._prepared_reference == voice_path:
+            return True
+        if not hasattr(model, "prepare_conditionals"):
+            return False
+
+        cache_path = self._reference_cache_path(voice_path)
+        try:
+            from chatterbox.tts import Conditionals
+            model.conds = Conditionals.load(
+                cache_path, map_location=self._resolve_device()
+            )
+        except Exception:
+            # Cache miss or unreadable entry: encode the reference once.
+            with self._autocast():
+                if self.model_type == "turbo":
+                    model.prepare_conditionals(str(voice_path))
+                else:
+                    model.prepare_conditionals(
+                        str(voice_path), exaggeration=self.exaggeration
+                    )
+            _save_conditionals(model.conds, cache_path)
+
+        self._prepared_reference = voice_path
+        return True
 
     # -- Audio generation (R-18, R-22) --------------------------------------
 
@@ -310,32 +705,266 @@ class ChatterboxTTS(TTSBackend):
 
         Long inputs are split at sentence boundaries (R-22) to prevent
         voice drift.  Each chunk yields a ``(sample_rate, audio_array)``
-        tuple.
+        tuple; see :meth:`stream_tts_batched` for how chunks are generated.
+        """
+        return self.stream_tts_batched([text])
+
+    def stream_tts_batched(self, texts: Iterable[str]) -> Iterator[tuple[int, Any]]:
+        """Generate voice-cloned audio for each of *texts*, in order.
+
+        All texts are split into sentence chunks that share one generation
+        pipeline (and, with ``batch_size``, batches), so the next text
+        starts generating while the previous one plays.  Texts are consumed
+        lazily: the next one is pulled while the current chunk generates,
+        so a streamed LLM reply overlaps with synthesis.
+
+        Chunks flow through a two-stage pipeline: one worker thread runs
+        ``generate()`` while a second converts the previous chunk's tensor to
+        numpy, and the caller plays the chunk before that.  On CUDA the
+        device-to-host copy runs on its own stream, so it does not queue
+        behind the next chunk's kernels.
+
+        With ``stream_chunk_size`` set and a model that offers
+        ``generate_stream`` (the streaming Chatterbox forks), audio is
+        instead yielded every ``stream_chunk_size`` speech tokens, so
+        playback starts long before a sentence finishes generating.
+
+        With ``batch_size`` above 1 and a model that offers
+        ``generate_batch``, up to ``batch_size`` chunks are synthesised in
+        one call for higher throughput on long replies, at the cost of the
+        first chunk waiting for its whole batch.
         """
-        import numpy as np
+        from concurrent.futures import Future, ThreadPoolExecutor
+
+        if np is None:
+            raise RuntimeError("numpy package not installed. Run: pip install numpy")
 
         voice_path = self._validate_voice_file()
         model = self._load_model()
 
-        chunks = _chunk_text(text)
+        # With the conditioning prepared up front, generate() skips
+        # re-encoding the reference file for every chunk.
+        prompt: dict[str, str] = {}
+        if not self._prepare_reference(model, voice_path):
+            prompt["audio_prompt_path"] = str(voice_path)
+
+        options: dict[str, Any] = dict(prompt)
+        if self.model_type != "turbo":
+            # Turbo has no emotion controls.
+            options["exaggeration"] = self.exaggeration
+            options["cfg_weight"] = self.cfg_weight
+
+        chunks = (chunk for text in texts for chunk in _chunk_text(text))
+
+        if self.stream_chunk_size and hasattr(model, "generate_stream"):
+            yield from self._stream_sub_chunks(model, chunks, options)
+            return
+
+        # Forks that offer generate_batch synthesise several chunks per
+        # call; otherwise each group holds a single chunk.
+        size = self.batch_size if hasattr(model, "generate_batch") else 1
+        groups = map(list, itertools.batched(chunks, size))
+        first = next(groups, None)
+        if first is None:
+            return
+
+        cuda = self._resolve_device() == "cuda"
+        copy_stream: Any = None
+
+        def generate(group: list[str]) -> tuple[list[Any], Any]:
+            with self._autocast():
+                if len(group) > 1:
+                    # A batched tensor iterates as one waveform row per text.
+                    wavs = list(model.generate_batch(group, **options))
+                else:
+                    wavs = [model.generate(group[0], **options)]
+            ready = None
+            if cuda and getattr(wavs[0], "is_cuda", False) is True:
+                # Marks the end of this group's kernels on the generation stream.
+                ready = _get_torch().cuda.Event()
+                ready.record()
+            return wavs, ready
+
+        def to_host(wav: Any) -> Any:
+            torch = _get_torch()
+            wav = wav.squeeze()  # a view; launches no kernel
+            # Pinned memory lets the copy run as a true async DMA; the numpy
+            # view keeps the block alive until the caller drops the audio.
+            host = torch.empty(wav.shape, dtype=torch.float32, pin_memory=True)
+            wav.record_stream(copy_stream)  # keep the buffer alive for the copy
+            with torch.cuda.stream(copy_stream):
+                # copy_ converts half-precision output to float32 here, on
+                # the copy stream and after its wait on ``ready``.
+                host.copy_(wav, non_blocking=True)
+            copy_stream.synchronize()
+            return host.numpy()
+
+        def to_audio(generated: Future) -> list[tuple[int, Any]]:
+            nonlocal copy_stream
+            wavs, ready = generated.result()
+            if ready is None:
+                return [(self.SAMPLE_RATE, _waveform_to_audio(wav)) for wav in wavs]
+            if copy_stream is None:
+                copy_stream = _get_torch().cuda.Stream()
+            copy_stream.wait_event(ready)
+            return [(self.SAMPLE_RATE, to_host(wav)) for wav in wavs]
+
+        # Single-worker stages keep output in order; at most one group is
+        # submitted ahead of the one being played.  Both pools are owned by
+        # one exit stack, so every way out of this generator (exhaustion,
+        # an error, or close() on barge-in) shuts both down without waiting.
+        with contextlib.ExitStack() as stages:
+
+            def stage(name: str) -> ThreadPoolExecutor:
+                pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix=name)
+                stages.callback(pool.shutdown, wait=False, cancel_futures=True)
+                return pool
+
+            gen_pool = stage("chatterbox-gen")
+            post_pool = stage("chatterbox-post")
+
+            def submit(group: list[str]) -> Future:
+                return post_pool.submit(to_audio, gen_pool.submit(generate, group))
+
+            pending = submit(first)
+            for group in groups:
+                upcoming = submit(group)
+                yield from pending.result()
+                pending = upcoming
+            yield from pending.result()
+
+    def _stream_sub_chunks(
+        self, model: Any, chunks: Iterable[str], options: dict[str, Any]
+    ) -> Iterator[tuple[int, Any]]:
+        """Yield audio from ``model.generate_stream`` as each piece lands.
+
+        The streaming forks decode every ``chunk_size`` speech tokens with
+        overlapping context and cross-fade the seams themselves; items are
+        ``(audio, metrics)`` pairs or bare audio tensors.
+
+        Autocast is entered around each step only, so it does not stay
+        active in the caller's thread while this generator is suspended.
+        """
         for chunk in chunks:
-            if self.model_type == "turbo":
-                wav = model.generate(chunk, audio_prompt_path=str(voice_path))
-            else:
-                wav = model.generate(
-                    chunk,
-                    audio_prompt_path=str(voice_path),
-                    exaggeration=self.exaggeration,
-                    cfg_weight=self.cfg_weight,
-                )
+            with self._autocast():
+                stream = iter(model.generate_stream(
+                    chunk, chunk_size=self.stream_chunk_size, **options
+                ))
+            while True:
+                with self._autocast():
+                    item = next(stream, _EXHAUSTED)
+                if item is _EXHAUSTED:
+                    break
+                wav = item[0] if isinstance(item, tuple) else item
+                yield (self.SAMPLE_RATE, _waveform_to_audio(wav))
 
-            # Chatterbox returns a torch.Tensor — convert to numpy.
-            if hasattr(wav, "numpy"):
-                audio = wav.squeeze().cpu().numpy().astype(np.float32)
-            else:
-                audio = np.asarray(wav, dtype=np.float32)
 
-            yield (self.SAMPLE_RATE, audio)
+def _waveform_to_audio(wav: Any) -> Any:
+    """Convert a Chatterbox waveform to a float32 numpy array.
+
+    Chatterbox returns a ``torch.Tensor`` that is already FP32, so no
+    rescaling is needed.  Casting on the tensor (a no-op in that case) lets
+    ``.numpy()`` return a view rather than copying the samples again the
+    way a trailing ``astype`` would.
+    """
+    if hasattr(wav, "numpy"):
+        return wav.squeeze().float().cpu().numpy()
+    return np.asarray(wav, dtype=np.float32)
+
+
+def _quantize_for_cpu(model: Any) -> Any:
+    """Apply int8 dynamic quantisation to the ``Linear`` layers of *model*.
+
+    Chatterbox models are plain wrappers around several ``torch.nn.Module``
+    components (``t3``, ``s3gen``, ...), so each component is quantised in
+    place.  A component that cannot be quantised stays in FP32.
+    """
+    torch = _get_torch()
+
+    def quantize(module: Any) -> Any:
+        try:
+            return torch.ao.quantization.quantize_dynamic(
+                module, {torch.nn.Linear}, dtype=torch.qint8
+            )
+        except Exception:
+            return module
+
+    if isinstance(model, torch.nn.Module):
+        return quantize(model)
+    for name, value in list(vars(model).items()):
+        if isinstance(value, torch.nn.Module):
+            setattr(model, name, quantize(value))
+    return model
+
+
+# Chatterbox components called repeatedly inside ``generate()``: the
+# autoregressive text-to-token transformer and the token-to-wave decoder.
+_COMPILE_TARGETS = ("t3", "s3gen")
+
+# Generations run after compiling so CUDA-graph capture happens at load
+# time rather than on the first reply.
+_COMPILE_WARM_UP_RUNS = 2
+
+
+def _compile_for_cuda(
+    model: Any,
+    autocast: Callable[[], contextlib.AbstractContextManager[Any]] = (
+        contextlib.nullcontext
+    ),
+) -> Any:
+    """Wrap the heavy Chatterbox components with ``torch.compile``.
+
+    Uses ``mode="reduce-overhead"`` so repeated forward steps replay CUDA
+    graphs instead of launching kernels one by one.  Inductor's on-disk
+    caches are enabled under the shared cache directory so later starts
+    reuse the compiled artifacts.  Compilation happens lazily on the first
+    call, so the model is primed here, under *autocast* so the captured
+    graphs match the precision of later calls; if that fails, the eager
+    components are restored.
+    """
+    torch = _get_torch()
+
+    os.environ.setdefault("TORCHINDUCTOR_CACHE_DIR", str(cache_dir("torchinductor")))
+    os.environ.setdefault("TORCHINDUCTOR_FX_GRAPH_CACHE", "1")
+
+    eager: dict[str, Any] = {}
+    for name in _COMPILE_TARGETS:
+        module = getattr(model, name, None)
+        if isinstance(module, torch.nn.Module):
+            eager[name] = module
+            setattr(
+                model,
+                name,
+                torch.compile(module, mode="reduce-overhead", fullgraph=False, dynamic=False),
+            )
+    if not eager:
+        return model
+
+    try:
+        for _ in range(_COMPILE_WARM_UP_RUNS):
+            with autocast():
+                model.generate(_WARM_UP_TEXT)
+    except Exception:
+        # e.g. BackendCompilerFailed on an unsupported GPU/toolchain.
+        for name, module in eager.items():
+            setattr(model, name, module)
+    return model
+
+
+def _save_conditionals(conds: Any, cache_path: pathlib.Path) -> None:
+    """Atomically persist Chatterbox conditionals; best-effort, never raises."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        os.close(fd)
+        try:
+            conds.save(pathlib.Path(tmp_name))
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except Exception:
+        pass
 
 
 # ---------------------------------------------------------------------------
@@ -349,12 +978,26 @@ _PROVIDERS: dict[str, type[TTSBackend]] = {
     "chatterbox": ChatterboxTTS,
 }
 
+# Config keys consumed by the factory itself rather than forwarded to providers.
+_RESERVED_TTS_KEYS = frozenset({"provider", "voice", "warmup"})
+
+# Short utterance synthesised by warm_up() to prime model inference.
+_WARM_UP_TEXT = "Ready."
+
 
 def get_tts_backend(config: ConfigNode) -> TTSBackend:
     """Instantiate the TTS backend specified in the config.
 
     Reads ``config.tts.provider`` and ``config.tts.voice`` to select and
     configure the appropriate backend.  Kokoro is the default.
+
+    When ``config.tts.warmup`` is true, the backend's ``warm_up()`` runs in
+    a daemon thread so models load while the user is still getting ready
+    to speak, rather than on the first reply.
+
+    Backends are cached per ``(provider, voice, options)``, so repeated
+    calls with the same settings return the same instance and its loaded
+    model.  Call :func:`reset_tts_backends` to drop them.
     """
     provider = getattr(config.tts, "provider", "kokoro").lower()
     voice = getattr(config.tts, "voice", None)
@@ -366,11 +1009,51 @@ def get_tts_backend(config: ConfigNode) -> TTSBackend:
             f"Available: {', '.join(sorted(_PROVIDERS))}"
         )
 
-    kwargs: dict[str, Any] = {}
     # Forward any extra tts config keys (e.g. rate)
-    tts_data = config.tts.to_dict()
-    for key, value in tts_data.items():
-        if key not in ("provider", "voice"):
-            kwargs[key] = value
-
-    return cls(voice=voice, **kwargs)
+    kwargs: dict[str, Any] = {
+        key: value
+        for key, value in config.tts.to_dict().items()
+        if key not in _RESERVED_TTS_KEYS
+    }
+
+    options = tuple(sorted(kwargs.items()))
+    try:
+        hash(options)
+    except TypeError:  # unhashable option values; build uncached
+        backend = cls(voice=voice, **kwargs)
+    else:
+        backend = _make_backend(provider, voice, options)
+    if config.tts.get("warmup", False) and backend not in _WARMED_BACKENDS:
+        _WARMED_BACKENDS.add(backend)
+        threading.Thread(
+            target=_warm_up_quietly,
+            args=(backend,),
+            name=f"tts-warmup-{provider}",
+            daemon=True,
+        ).start()
+    return backend
+
+
+# Backends whose warm-up has already been started.
+_WARMED_BACKENDS: weakref.WeakSet[TTSBackend] = weakref.WeakSet()
+
+
+@functools.lru_cache(maxsize=4)
+def _make_backend(
+    provider: str, voice: str | None, options: tuple[tuple[str, Any], ...]
+) -> TTSBackend:
+    """Construct a backend; cached so equal settings share one instance."""
+    return _PROVIDERS[provider](voice=voice, **dict(options))
+
+
+def reset_tts_backends() -> None:
+    """Drop the cached backends so the next lookup builds new instances."""
+    _make_backend.cache_clear()
+
+
+def _warm_up_quietly(backend: TTSBackend) -> None:
+    """Run ``backend.warm_up()``, leaving any failure to the first real call."""
+    try:
+        backend.warm_up()
+    except Exception:
+        pass
@@ -8,17 +8,43 @@ suitable for injection into the LLM prompt.
 from __future__ import annotations
 
 import ast
+import hashlib
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterator
 
+from voice_agent.cache import cache_dir, load_pickle, store_pickle
 
-@dataclass(frozen=True)
+# Bump when CommandInfo or the parsing rules change to invalidate old entries.
+_CACHE_VERSION = 6
+
+# Cheap textual screen: any ``@<name>.command`` decorator needs this text.
+_COMMAND_ATTR_RE = re.compile(rb"\.\s*command\b")
+
+# Statements that can define a command function.
+_FUNCTION_DEFS = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+# Below this many files, process start-up costs more than parallel parsing saves.
+_PARALLEL_MIN_FILES = 8
+
+# Discovered commands and their rendered catalog, keyed by absolute path and
+# stamped with (mtime_ns, size) so an edited file is picked up on next use.
+_CATALOG_CACHE: dict[str, tuple[int, int, list[CommandInfo], str]] = {}
+
+
+@dataclass(frozen=True, slots=True)
 class CommandInfo:
-    """Metadata about a single discovered Typer command."""
+    """Metadata about a single discovered Typer command.
+
+    ``docstring`` holds only the summary (first non-blank) line, which is
+    all the catalog shows.
+    """
 
     name: str
-    params: list[str]
+    params: tuple[str, ...]
     docstring: str
 
 
@@ -33,6 +59,10 @@ def discover_commands(typer_file: str | Path) -> list[CommandInfo]:
     - Their parameter lists (names and type annotations)
     - Their docstrings
 
+    Results are cached in memory and on disk keyed by the file's path,
+    mtime and size, so an unchanged file is parsed once rather than on
+    every prompt, and not again on the next start-up.
+
     Parameters
     ----------
     typer_file:
@@ -48,28 +78,7 @@ def discover_commands(typer_file: str | Path) -> list[CommandInfo]:
     FileNotFoundError
         If the file does not exist.
     """
-    path = Path(typer_file)
-    if not path.exists():
-        raise FileNotFoundError(f"Typer command file not found: {path}")
-
-    source = path.read_text()
-    tree = ast.parse(source, filename=str(path))
-
-    commands: list[CommandInfo] = []
-
-    for node in ast.walk(tree):
-        if not isinstance(node, ast.FunctionDef):
-            continue
-        if not _has_command_decorator(node):
-            continue
-
-        name = node.name.replace("_", "-")
-        params = _extract_params(node)
-        docstring = ast.get_docstring(node) or ""
-
-        commands.append(CommandInfo(name=name, params=params, docstring=docstring))
-
-    return commands
+    return list(_discover(Path(typer_file))[0])
 
 
 def build_command_catalog(typer_file: str | Path) -> str:
@@ -89,25 +98,15 @@ def build_command_catalog(typer_file: str | Path) -> str:
         Formatted multi-line string listing commands, their signatures,
         and descriptions.
     """
-    commands = discover_commands(typer_file)
-    if not commands:
-        return "(No commands discovered.)"
-
-    lines: list[str] = []
-    for cmd in commands:
-        sig = f"  {cmd.name}"
-        if cmd.params:
-            sig += f" {' '.join(cmd.params)}"
-        lines.append(sig)
-        if cmd.docstring:
-            first_line = cmd.docstring.strip().split("\n")[0]
-            lines.append(f"    {first_line}")
-    return "\n".join(lines)
+    return _discover(Path(typer_file))[1]
 
 
 def build_catalog_from_files(typer_files: list[str | Path]) -> str:
     """Build a combined catalog from multiple Typer command files.
 
+    Files are parsed in parallel worker processes when enough of them have
+    changed to outweigh the pool start-up cost.
+
     Parameters
     ----------
     typer_files:
@@ -118,12 +117,14 @@ def build_catalog_from_files(typer_files: list[str | Path]) -> str:
     str
         Combined catalog string.
     """
-    sections: list[str] = []
-    for f in typer_files:
-        path = Path(f)
-        catalog = build_command_catalog(path)
-        sections.append(f"[{path.stem}]\n{catalog}")
-    return "\n\n".join(sections)
+    paths = [Path(f) for f in typer_files]
+    stale = [path for path in paths if _cached_entry(path) is None]
+    if len(stale) >= _PARALLEL_MIN_FILES:
+        # Workers fill the on-disk cache; the loop below then only loads it.
+        with ProcessPoolExecutor() as pool:
+            list(pool.map(discover_commands, stale))
+
+    return "\n\n".join(f"[{path.stem}]\n{_discover(path)[1]}" for path in paths)
 
 
 # ---------------------------------------------------------------------------
@@ -131,26 +132,143 @@ def build_catalog_from_files(typer_files: list[str | Path]) -> str:
 # ---------------------------------------------------------------------------
 
 
-def _has_command_decorator(node: ast.FunctionDef) -> bool:
-    """Check if a function has an ``@app.command()`` decorator."""
+def _cached_entry(
+    path: Path, stat: os.stat_result | None = None
+) -> tuple[list[CommandInfo], str] | None:
+    """Return the in-memory entry for *path* if it is still current."""
+    cached = _CATALOG_CACHE.get(os.path.abspath(path))
+    if cached is None:
+        return None
+    if stat is None:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+    if cached[:2] != (stat.st_mtime_ns, stat.st_size):
+        return None
+    return cached[2], cached[3]
+
+
+def _discover(path: Path) -> tuple[list[CommandInfo], str]:
+    """Return ``(commands, catalog)`` for *path*, parsing only on a miss."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Typer command file not found: {path}") from None
+
+    entry = _cached_entry(path, stat)
+    if entry is not None:
+        return entry
+
+    cache_file = _cache_file_for(path, stat)
+    commands = _load_cached_commands(cache_file)
+    if commands is None:
+        commands = _parse_commands(path)
+        _store_cached_commands(cache_file, commands)
+    catalog = _format_catalog(commands)
+    _CATALOG_CACHE[os.path.abspath(path)] = (
+        stat.st_mtime_ns, stat.st_size, commands, catalog
+    )
+    return commands, catalog
+
+
+def _parse_commands(path: Path) -> list[CommandInfo]:
+    """Statically parse *path* and return its ``@app.command()`` functions."""
+    # Raw bytes skip a decode pass; ast.parse honours the file's own
+    # encoding declaration rather than the locale default.
+    source = path.read_bytes()
+    # Files that cannot contain a command decorator skip the full AST parse.
+    if not _COMMAND_ATTR_RE.search(source):
+        return []
+    tree = ast.parse(source, filename=str(path))
+
+    commands: list[CommandInfo] = []
+
+    for node in _candidate_defs(tree):
+        if not _has_command_decorator(node):
+            continue
+
+        name = node.name.replace("_", "-")
+        params = _extract_params(node)
+        # The raw docstring skips cleandoc's re-indent pass over every line.
+        raw = ast.get_docstring(node, clean=False)
+        docstring = raw.lstrip().split("\n", 1)[0].rstrip() if raw else ""
+
+        commands.append(CommandInfo(name=name, params=params, docstring=docstring))
+
+    return commands
+
+
+def _candidate_defs(
+    tree: ast.Module,
+) -> Iterator[ast.FunctionDef | ast.AsyncFunctionDef]:
+    """Yield the functions that can carry a command decorator.
+
+    Commands are registered at module level (or one level down in a class
+    body), so only those statements are visited instead of every node in
+    every function body.
+    """
+    for node in tree.body:
+        if isinstance(node, _FUNCTION_DEFS):
+            yield node
+        elif isinstance(node, ast.ClassDef):
+            for member in node.body:
+                if isinstance(member, _FUNCTION_DEFS):
+                    yield member
+
+
+def _cache_file_for(path: Path, stat: os.stat_result) -> Path:
+    """Return the cache entry path for a Typer file's current version."""
+    key = f"{_CACHE_VERSION}:{path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}"
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    return cache_dir("typer_catalog") / f"{digest}.pkl"
+
+
+def _load_cached_commands(cache_file: Path) -> list[CommandInfo] | None:
+    """Return cached commands, or ``None`` on a miss or unreadable entry."""
+    commands = load_pickle(cache_file)
+    return commands if isinstance(commands, list) else None
+
+
+def _store_cached_commands(cache_file: Path, commands: list[CommandInfo]) -> None:
+    """Persist *commands*; caching is best-effort and never raises."""
+    store_pickle(cache_file, commands)
+
+
+def _format_catalog(commands: list[CommandInfo]) -> str:
+    """Render discovered commands as the catalog text used in prompts."""
+    if not commands:
+        return "(No commands discovered.)"
+
+    lines: list[str] = []
+    for cmd in commands:
+        sig = f"  {cmd.name}"
+        if cmd.params:
+            sig += f" {' '.join(cmd.params)}"
+        lines.append(sig)
+        if cmd.docstring:
+            lines.append(f"    {cmd.docstring}")
+    return "\n".join(lines)
+
+
+def _has_command_decorator(node: ast.FunctionDef | ast.AsyncFunctionDef) -> bool:
+    """Check if a function has an ``@<app>.command`` decorator.
+
+    Both the call form ``@app.command()`` and the bare ``@app.command``
+    are accepted, for any Typer instance name.
+    """
     for decorator in node.decorator_list:
-        # @app.command() — Call form
-        if isinstance(decorator, ast.Call):
-            func = decorator.func
-            if (
-                isinstance(func, ast.Attribute)
-                and func.attr == "command"
-                and isinstance(func.value, ast.Name)
-            ):
-                return True
-        # @app.command — Attribute form (no parentheses)
-        if isinstance(decorator, ast.Attribute):
-            if decorator.attr == "command" and isinstance(decorator.value, ast.Name):
-                return True
+        target = decorator.func if isinstance(decorator, ast.Call) else decorator
+        if (
+            isinstance(target, ast.Attribute)
+            and target.attr == "command"
+            and isinstance(target.value, ast.Name)
+        ):
+            return True
     return False
 
 
-def _extract_params(node: ast.FunctionDef) -> list[str]:
+def _extract_params(node: ast.FunctionDef | ast.AsyncFunctionDef) -> tuple[str, ...]:
     """Extract parameter names and annotations from a function definition."""
     params: list[str] = []
     for arg in node.args.args:
@@ -160,19 +278,15 @@ def _extract_params(node: ast.FunctionDef) -> list[str]:
             params.append(f"{name}:{annotation}")
         else:
             params.append(name)
-    return params
+    return tuple(params)
 
 
 def _annotation_to_str(node: ast.expr) -> str:
-    """Convert an AST annotation node to a readable string."""
+    """Convert an AST annotation node to a readable string.
+
+    Plain names are returned directly; anything else (attributes, generics,
+    ``X | Y`` unions, ``Annotated[...]``) is rendered back to source.
+    """
     if isinstance(node, ast.Name):
         return node.id
-    if isinstance(node, ast.Constant):
-        return repr(node.value)
-    if isinstance(node, ast.Attribute):
-        return f"{_annotation_to_str(node.value)}.{node.attr}"
-    if isinstance(node, ast.Subscript):
-        base = _annotation_to_str(node.value)
-        slice_str = _annotation_to_str(node.slice)
-        return f"{base}[{slice_str}]"
-    return ast.dump(node)
+    return ast.unparse(node)